@@ -1,9 +1,14 @@
-from . import eda
-from . import aws
-from . import dataio
-from . import reports
-from . import transform
-from . import charts 
+from jcds.utils import _lazy_loader
+
+# Subpackages are imported on first access (PEP 562), so `import jcds` stays
+# cheap and e.g. `jcds.transform` never loads matplotlib or scikit-learn.
+__getattr__, __dir__ = _lazy_loader(
+    __name__,
+    {
+        name: (f".{name}", None)
+        for name in ["eda", "aws", "dataio", "reports", "transform", "charts", "metrics"]
+    },
+)
 
 
 __all__ = ["eda", "aws", "dataio", "reports", "transform", "charts","help"]
@@ -2,9 +2,9 @@ import sys
 import jcds.utils
 
 # Import your functions from internal files
-from .s3_utils import list_s3_bucket
+from .s3_utils import list_s3_bucket, iter_s3_objects, get_s3_client
 
 help = jcds.utils._make_module_help(sys.modules[__name__])
 
 # Declare what this module exports
-__all__ = ["list_s3_bucket", "help"]
+__all__ = ["list_s3_bucket", "iter_s3_objects", "get_s3_client", "help"]
@@ -1,39 +1,162 @@
-def list_s3_bucket(bucket_name):
+from functools import lru_cache
+
+
+# keys per ListObjectsV2 page; S3 never returns more than 1000
+S3_PAGE_SIZE = 1000
+
+
+@lru_cache(maxsize=None)
+def get_s3_client(anonymous=True, endpoint_url=None, region_name=None):
     """
-    List the contents (object keys) of a public Amazon S3 bucket using anonymous access.
+    Return a cached boto3 S3 client.
+
+    Clients are created once per combination of arguments and reused, since
+    building one loads the service model and takes far longer than a request.
+    boto3 clients are thread-safe.
+
+    Parameters
+    ----------
+    anonymous : bool, optional
+        Use unsigned requests, which only work with public buckets. If False,
+        the default boto3 credential chain is used. Default is True.
+    endpoint_url : str, optional
+        Base URL of an S3-compatible service. Default is AWS.
+    region_name : str, optional
+        AWS region of the bucket. Default is boto3's configured region.
+
+    Returns
+    -------
+    botocore.client.S3
+    """
+    import boto3
+    from botocore import UNSIGNED
+    from botocore.config import Config
+
+    config = Config(signature_version=UNSIGNED) if anonymous else None
+    return boto3.client(
+        "s3", config=config, endpoint_url=endpoint_url, region_name=region_name
+    )
+
+
+def iter_s3_objects(
+    bucket_name,
+    prefix="",
+    delimiter=None,
+    page_size=S3_PAGE_SIZE,
+    anonymous=True,
+    endpoint_url=None,
+    client=None,
+):
+    """
+    Lazily list the objects of an S3 bucket, following pagination.
+
+    Pages of up to `page_size` keys are requested only as the generator is
+    consumed, so buckets with millions of objects can be scanned (or the
+    scan stopped early) in constant memory.
+
+    Parameters
+    ----------
+    bucket_name : str
+        The name of the S3 bucket.
+    prefix : str, optional
+        Only list keys starting with this prefix. Default is all keys.
+    delimiter : str, optional
+        Group keys sharing a prefix up to the delimiter (e.g. '/') into a
+        single record, like a directory listing. Default is None.
+    page_size : int, optional
+        Keys per request, at most 1000. Default is 1000.
+    anonymous, endpoint_url
+        Passed to `get_s3_client` when `client` is None.
+    client : botocore.client.S3, optional
+        Client to use instead of the cached one.
+
+    Yields
+    ------
+    dict
+        One record per object with 'key', 'size' (bytes), 'etag' (without
+        quotes), 'last_modified' (datetime) and 'is_prefix' False. With a
+        delimiter, each common prefix yields a record with 'is_prefix' True
+        and the other fields None.
+    """
+    if client is None:
+        client = get_s3_client(anonymous, endpoint_url)
+
+    params = {"Bucket": bucket_name}
+    if prefix:
+        params["Prefix"] = prefix
+    if delimiter:
+        params["Delimiter"] = delimiter
+    if page_size != S3_PAGE_SIZE:
+        params["MaxKeys"] = page_size
+
+    while True:
+        response = client.list_objects_v2(**params)
+        for obj in response.get("Contents", []):
+            yield {
+                "key": obj["Key"],
+                "size": obj.get("Size"),
+                "etag": obj.get("ETag", "").strip('"') or None,
+                "last_modified": obj.get("LastModified"),
+                "is_prefix": False,
+            }
+        for common in response.get("CommonPrefixes", []):
+            yield {
+                "key": common["Prefix"],
+                "size": None,
+                "etag": None,
+                "last_modified": None,
+                "is_prefix": True,
+            }
+        if not response.get("IsTruncated"):
+            return
+        params["ContinuationToken"] = response["NextContinuationToken"]
+
+
+def list_s3_bucket(bucket_name, prefix="", delimiter=None, verbose=True, **kwargs):
+    """
+    List the contents of a public Amazon S3 bucket using anonymous access.
 
     Parameters
     ----------
     bucket_name : str
         The name of the public S3 bucket to list contents from.
+    prefix : str, optional
+        Only list keys starting with this prefix. Default is all keys.
+    delimiter : str, optional
+        Group keys into common prefixes, e.g. '/'. Default is None.
+    verbose : bool, optional
+        Print each key. Default is True.
+    **kwargs
+        Passed to `iter_s3_objects`.
 
     Returns
     -------
-    None
-        Prints the keys (filenames) of the objects found in the bucket.
+    list of dict or None
+        The records yielded by `iter_s3_objects`, or None on error.
 
     Notes
     -----
     - This function uses anonymous (unsigned) access and works only with public buckets.
     - Requires the `boto3` and `botocore` libraries.
+    - Every page is fetched, so buckets with more than 1000 objects are listed in full.
+      Use `iter_s3_objects` to stream very large buckets instead of collecting them.
     - If the bucket is not public or an error occurs, an error message is printed.
 
     """
 
     try:
-        import boto3
-        from botocore import UNSIGNED
-        from botocore.config import Config
+        import boto3  # noqa: F401
     except ImportError as e:
         print("Required library is not installed:", e)
         return
 
-    # create anonymous s3 client
-    s3 = boto3.client("s3", config=Config(signature_version=UNSIGNED))
-
+    records = []
     try:
-        response = s3.list_objects_v2(Bucket=bucket_name)
-        for obj in response.get("Contents", []):
-            print(obj["Key"])
+        for record in iter_s3_objects(bucket_name, prefix, delimiter, **kwargs):
+            if verbose:
+                print(record["key"])
+            records.append(record)
     except Exception as e:
         print("Error accessing bucket:", e)
+        return None
+    return records
@@ -1,12 +1,18 @@
 import sys
 import jcds.utils
 
-# Import your functions from internal files
-from .roc import plot_roc
-from .boxplots import outlier_boxplots
-from .missing import missing_data_heatmap
-from .categorical import categorical_barplot
-from .correlation import correlation_heatmap
+# Functions are imported from internal files on first access, so matplotlib,
+# seaborn and scikit-learn load only when a chart is used
+__getattr__, __dir__ = jcds.utils._lazy_loader(
+    __name__,
+    {
+        "plot_roc": (".roc", "plot_roc"),
+        "outlier_boxplots": (".boxplots", "outlier_boxplots"),
+        "missing_data_heatmap": (".missing", "missing_data_heatmap"),
+        "categorical_barplot": (".categorical", "categorical_barplot"),
+        "correlation_heatmap": (".correlation", "correlation_heatmap"),
+    },
+)
 
 help = jcds.utils._make_module_help(sys.modules[__name__])
 
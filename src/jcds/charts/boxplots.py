@@ -1,31 +1,43 @@
+from pathlib import Path
+
 import matplotlib.pyplot as plt 
 import seaborn as sns 
 
-from jcds.eda.inspect import show_convar, show_binary_list
+from jcds.eda.outliers import outlier_columns
+from jcds.eda.profile import profile_file
 
 
-def outlier_boxplots(dataframe, threshold=1.5, figsize=(14, 5)):
+def outlier_boxplots(dataframe, threshold=1.5, figsize=(14, 5), chunksize=100_000, error=0.01):
     """
     Plots boxplots for numeric (non-binary) columns with potential outliers.
 
     Parameters
     ----------
-    dataframe : pd.DataFrame
-        The input DataFrame.
+    dataframe : pd.DataFrame or str or Path
+        The input DataFrame, or the path to a CSV or Parquet file. Files are
+        streamed once and each box is drawn from a `QuantileSketch` of the
+        column (whiskers at the IQR bounds, no individual fliers).
     threshold : float, optional
         IQR multiplier to define outliers. Default is 1.5.
     figsize : tuple
         Size of the figure.
+    chunksize : int, optional
+        Rows per chunk when `dataframe` is a file path. Default is 100,000.
+    error : float, optional
+        Rank error of the quartile sketches for file paths. Default is 0.01.
 
     Returns
     -------
     None
     """
-    numeric_cols = show_convar(dataframe)
-    binary_info = show_binary_list(dataframe)
-    binary_cols = binary_info["binary_columns"] + binary_info["binary_with_nan"]
+    profile = None
+    if isinstance(dataframe, (str, Path)):
+        profile = profile_file(dataframe, chunksize=chunksize, quantile_error=error)
+        dataframe = profile.schema()
 
-    outlier_cols = [col for col in numeric_cols if col not in binary_cols]
+    outlier_cols = outlier_columns(dataframe, profile)
+    if profile is not None:
+        outlier_cols = [col for col in outlier_cols if profile[col].quantile_sketch is not None]
 
     if not outlier_cols:
         print("No numeric (non-binary) columns available for boxplot.")
@@ -41,7 +53,11 @@ def outlier_boxplots(dataframe, threshold=1.5, figsize=(14, 5)):
     axes = axes.flatten() if num_cols > 1 else [axes]
 
     for ax, col in zip(axes, outlier_cols):
-        sns.boxplot(y=dataframe[col], ax=ax)
+        if profile is None:
+            sns.boxplot(y=dataframe[col], ax=ax)
+        else:
+            stats = profile[col].quantile_sketch.box_stats(threshold)
+            ax.bxp([stats], showfliers=False)
         ax.set_title(col)
 
     for ax in axes[num_cols:]:
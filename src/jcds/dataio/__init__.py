@@ -1,11 +1,50 @@
 import sys
 import jcds.utils
 
-from .io_utils import load_parquet, save_parquet, load_csv, save_csv
+from .io_utils import (
+    load_parquet,
+    save_parquet,
+    load_csv,
+    save_csv,
+    sniff_encoding,
+    save_feather,
+    load_feather,
+    iter_parquet,
+    parquet_metadata,
+)
+from .optimize import optimize_dtypes, plan_dtypes
 
-from .s3_io import read_s3
+# the S3 readers need `requests`; import them on first access
+__getattr__, __dir__ = jcds.utils._lazy_loader(
+    __name__,
+    {
+        "read_s3": (".s3_io", "read_s3"),
+        "read_s3_many": (".s3_io", "read_s3_many"),
+        "download_s3": (".s3_io", "download_s3"),
+        "open_s3": (".s3_io", "open_s3"),
+        "configure_session": (".s3_io", "configure_session"),
+    },
+)
 
 help = jcds.utils._make_module_help(sys.modules[__name__])
 
 # Declare what this module exports
-__all__ = ["load_parquet", "save_parquet", "load_csv", "save_csv", "read_s3", "help"]
+__all__ = [
+    "load_parquet",
+    "save_parquet",
+    "load_csv",
+    "save_csv",
+    "sniff_encoding",
+    "save_feather",
+    "load_feather",
+    "iter_parquet",
+    "parquet_metadata",
+    "optimize_dtypes",
+    "plan_dtypes",
+    "read_s3",
+    "read_s3_many",
+    "download_s3",
+    "open_s3",
+    "configure_session",
+    "help",
+]
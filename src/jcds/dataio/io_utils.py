@@ -1,52 +1,555 @@
+import codecs
+import hashlib
+import os
+
+import numpy as np
 import pandas as pd
+import pandas.api.types as ptypes
 from pathlib import Path
 from typing import Union, Optional
 
+from jcds.dataio.optimize import (
+    NUMERIC_KINDS,
+    OPTIMIZE_SAMPLE_ROWS,
+    concat_chunks,
+    optimize_dtypes,
+    plan_dtypes,
+    report_memory,
+)
+
+
+# encodings tried, in order, when `load_csv` is not told which to use
+DEFAULT_ENCODINGS = ["utf-8", "utf-8-sig", "latin1", "ISO-8859-1", "cp1252"]
 
-def save_parquet(dataframe: pd.DataFrame, filepath: Union[str, Path], **kwargs) -> None:
-    """Save a DataFrame to a Parquet file.
+# byte-order marks, longest first so UTF-32 LE is not mistaken for UTF-16 LE
+_BOMS = [
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+]
+
+
+def save_parquet(
+    dataframe: pd.DataFrame,
+    filepath: Union[str, Path],
+    partition_cols: Optional[list[str]] = None,
+    mode: str = "overwrite",
+    row_group_size: Optional[int] = None,
+    compression: Optional[str] = "snappy",
+    **kwargs,
+) -> None:
+    """Save a DataFrame to a Parquet file or a hive-partitioned dataset.
 
     Parameters
     ----------
     dataframe : pd.DataFrame
         The DataFrame to save.
     filepath : str or Path
-        Destination file path.
+        Destination file path, or directory for a dataset.
+    partition_cols : list of str, optional
+        Columns to partition by. Rows are written to ``col=value``
+        subdirectories of `filepath`, and the columns are dropped from the
+        files themselves.
+    mode : {'overwrite', 'append', 'overwrite_partitions'}, optional
+        'overwrite' (default) replaces the file or, with `partition_cols`,
+        the ``col=value`` subdirectories of the dataset; other files in the
+        directory are kept. 'append' adds new files to the dataset directory. 'overwrite_partitions'
+        replaces only the partitions present in `dataframe`, leaving the
+        others untouched, which suits incremental jobs. The last two write a
+        dataset directory even without `partition_cols`.
+    row_group_size : int, optional
+        Maximum number of rows per row group. Smaller groups let filtered
+        reads skip more data; larger groups compress better.
+    compression : str or None, optional
+        Codec such as 'snappy' (default), 'zstd', 'gzip' or None.
     **kwargs
-        Additional keyword arguments passed to `DataFrame.to_parquet`.
+        Additional keyword arguments passed to `DataFrame.to_parquet` for a
+        single file, or to `pyarrow.dataset.write_dataset` for a dataset.
+
+    Raises
+    ------
+    ValueError
+        If `mode` is not valid, if 'append' targets an existing single file,
+        if a single-file overwrite targets a directory, or if an overwrite
+        would delete files that are not Parquet.
 
     Notes
     -----
     Automatically creates the parent directory if it doesn't exist.
 
     """
+    if mode not in ("overwrite", "append", "overwrite_partitions"):
+        raise ValueError(
+            "[jcds] mode must be 'overwrite', 'append' or 'overwrite_partitions'."
+        )
     filepath = Path(filepath)
+    if mode != "overwrite" and filepath.is_file():
+        raise ValueError(
+            f"[jcds] Cannot {mode} to the single file {filepath}; "
+            "use a dataset directory instead."
+        )
+    if partition_cols is None and mode == "overwrite" and filepath.is_dir():
+        raise ValueError(
+            f"[jcds] {filepath} is a directory; pass partition_cols to overwrite "
+            "a dataset or mode='append' to add to it."
+        )
     filepath.parent.mkdir(parents=True, exist_ok=True)
-    dataframe.to_parquet(filepath, index=False, **kwargs)
 
+    if partition_cols is None and mode == "overwrite":
+        dataframe.to_parquet(
+            filepath,
+            index=False,
+            row_group_size=row_group_size,
+            compression=compression,
+            **kwargs,
+        )
+        return
 
-def load_parquet(filepath: Union[str, Path], **kwargs) -> pd.DataFrame:
+    import uuid
+
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    if mode == "overwrite" and filepath.exists():
+        _clear_dataset(filepath, partition_cols)
+    table = pa.Table.from_pandas(dataframe, preserve_index=False)
+    options = {"max_rows_per_group": row_group_size} if row_group_size else {}
+    ds.write_dataset(
+        table,
+        filepath,
+        format="parquet",
+        partitioning=partition_cols,
+        partitioning_flavor="hive" if partition_cols else None,
+        # unique names so appended files never replace earlier ones
+        basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+        existing_data_behavior=(
+            "delete_matching" if mode == "overwrite_partitions" else "overwrite_or_ignore"
+        ),
+        file_options=ds.ParquetFileFormat().make_write_options(compression=compression),
+        **options,
+        **kwargs,
+    )
+
+
+def _clear_dataset(path, partition_cols):
+    """Delete a Parquet file or the hive partitions of a dataset directory.
+
+    Only ``col=value`` subdirectories for the columns in `partition_cols` are
+    removed, and only if they hold nothing but Parquet and metadata files.
+    """
+    import shutil
+
+    if path.is_file():
+        path.unlink()
+        return
+    prefixes = tuple(f"{col}=" for col in partition_cols)
+    partitions = [
+        sub for sub in path.iterdir() if sub.is_dir() and sub.name.startswith(prefixes)
+    ]
+    # metadata files written by Spark and pyarrow alongside the data
+    allowed = {"_SUCCESS", "_metadata", "_common_metadata"}
+    for partition in partitions:
+        for file in partition.rglob("*"):
+            if file.is_file() and file.suffix != ".parquet" and file.name not in allowed:
+                raise ValueError(
+                    f"[jcds] Refusing to overwrite {path}: it contains non-Parquet file {file}."
+                )
+    for partition in partitions:
+        shutil.rmtree(partition)
+
+
+def load_parquet(
+    filepath: Union[str, Path],
+    columns: Optional[list[str]] = None,
+    filters=None,
+    batch_size: Optional[int] = None,
+    optimize: bool = False,
+    **kwargs,
+):
     """Load a Parquet file into a pandas DataFrame.
 
     Parameters
     ----------
     filepath : str or Path
-        Path to the Parquet file.
+        Path to the Parquet file or hive-partitioned dataset directory.
+    columns : list of str, optional
+        Columns to read. Other columns are never decoded.
+    filters : list of tuple, list of list of tuple or pyarrow.compute.Expression, optional
+        Row filter, e.g. ``[("year", ">=", 2023)]`` (see `pyarrow.parquet.read_table`).
+        Partitions and row groups that the filter rules out are skipped.
+    batch_size : int, optional
+        If given, return an iterator of DataFrames of at most this many rows
+        (see `iter_parquet`) instead of loading the whole file.
+    optimize : bool, optional
+        If True, read with compact dtypes: integer and float columns are
+        narrowed in Arrow from their exact min/max (losslessly), text columns
+        with few distinct values in the first `OPTIMIZE_SAMPLE_ROWS` rows are
+        read as 'category' and other text as Arrow-backed strings. Prints the
+        memory use before (estimated from the sample) and after. Default is
+        False.
     **kwargs
-        Additional keyword arguments passed to `pd.read_parquet`.
+        Additional keyword arguments passed to `pd.read_parquet`, or to
+        `pyarrow.parquet.read_table` when `optimize=True`.
+
+    Returns
+    -------
+    pd.DataFrame or iterator of pd.DataFrame
+        The loaded DataFrame, or an iterator of DataFrames if `batch_size` is set.
+
+    Notes
+    -----
+    Requires either `pyarrow` or `fastparquet` to be installed; `optimize`
+    and `batch_size` require `pyarrow`.
+
+    """
+    filepath = Path(filepath)
+    if batch_size is not None:
+        batches = iter_parquet(filepath, batch_size, columns, filters)
+        if optimize:
+            return _optimize_batches(batches)
+        return batches
+    if optimize:
+        return _read_parquet_optimized(filepath, columns=columns, filters=filters, **kwargs)
+    return pd.read_parquet(filepath, columns=columns, filters=filters, **kwargs)
+
+
+def iter_parquet(
+    filepath: Union[str, Path],
+    batch_size: int = 100_000,
+    columns: Optional[list[str]] = None,
+    filters=None,
+):
+    """Stream a Parquet file as DataFrames, one record batch at a time.
+
+    Uses `pyarrow.parquet.ParquetFile.iter_batches`, so only the requested
+    columns of one batch are decoded at a time. With list-style `filters`,
+    row groups whose statistics cannot match are skipped without reading
+    their data pages, and the remaining batches are filtered row by row.
+    A dataset directory (see `save_parquet`) is scanned with
+    `pyarrow.dataset`, which also skips partitions ruled out by `filters`.
+
+    Parameters
+    ----------
+    filepath : str or Path
+        Path to the Parquet file or hive-partitioned dataset directory.
+    batch_size : int, optional
+        Maximum number of rows per DataFrame. Default is 100,000.
+    columns : list of str, optional
+        Columns to yield. Default is all columns.
+    filters : list of tuple, list of list of tuple or pyarrow.compute.Expression, optional
+        Row filter in the `pyarrow.parquet.read_table` format.
+
+    Yields
+    ------
+    pd.DataFrame
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    if Path(filepath).is_dir():
+        # datasets prune partitions and row groups in the Arrow scanner
+        if filters is not None and not isinstance(filters, pc.Expression):
+            filters = pq.filters_to_expression(filters)
+        dataset = ds.dataset(filepath, format="parquet", partitioning="hive")
+        for batch in dataset.to_batches(columns=columns, filter=filters, batch_size=batch_size):
+            if batch.num_rows:
+                yield batch.to_pandas()
+        return
+
+    parquet_file = pq.ParquetFile(filepath)
+    row_groups = list(range(parquet_file.num_row_groups))
+    read_columns = columns
+    expression = None
+
+    if filters is not None:
+        if isinstance(filters, pc.Expression):
+            expression = filters
+            read_columns = None
+        else:
+            filters = _normalize_filters(filters)
+            expression = pq.filters_to_expression(filters)
+            stats = parquet_metadata(filepath, row_groups=True)
+            row_groups = [
+                rg for rg in row_groups if _may_match(stats[stats["row_group"] == rg], filters)
+            ]
+            if columns is not None:
+                fields = [f[0] for conjunction in filters for f in conjunction]
+                read_columns = list(columns) + [f for f in dict.fromkeys(fields) if f not in columns]
+
+    if not row_groups:
+        return
+    for batch in parquet_file.iter_batches(
+        batch_size=batch_size, row_groups=row_groups, columns=read_columns
+    ):
+        table = pa.Table.from_batches([batch])
+        if expression is not None:
+            table = table.filter(expression)
+        if columns is not None and read_columns != columns:
+            table = table.select(columns)
+        if table.num_rows:
+            yield table.to_pandas()
+
+
+def _normalize_filters(filters):
+    """Return filters as a list of conjunctions (lists of tuples)."""
+    if filters and isinstance(filters[0], tuple):
+        return [list(filters)]
+    return [list(conjunction) for conjunction in filters]
+
+
+def _may_match(stats, filters):
+    """
+    Check whether a row group can hold rows matching DNF `filters`.
+
+    `stats` holds one row per column of the row group (see
+    `parquet_metadata`). Predicates on columns without statistics, and
+    comparisons that fail (e.g. mismatched types), are assumed to match.
+    """
+    by_column = stats.set_index("column")
+
+    def predicate_may_match(name, op, value):
+        if name not in by_column.index or not by_column.at[name, "has_min_max"]:
+            return True
+        low, high = by_column.at[name, "min"], by_column.at[name, "max"]
+        try:
+            if op in ("=", "=="):
+                return low <= value <= high
+            if op == "<":
+                return low < value
+            if op == "<=":
+                return low <= value
+            if op == ">":
+                return high > value
+            if op == ">=":
+                return high >= value
+            if op == "in":
+                return any(low <= v <= high for v in value)
+            if op == "!=":
+                return not (low == high == value)
+        except TypeError:
+            return True
+        return True
+
+    return any(
+        all(predicate_may_match(*predicate) for predicate in conjunction)
+        for conjunction in filters
+    )
+
+
+def parquet_metadata(filepath: Union[str, Path], row_groups: bool = False) -> pd.DataFrame:
+    """Read column statistics from a Parquet footer without reading any data.
+
+    Parameters
+    ----------
+    filepath : str or Path
+        Path to the Parquet file.
+    row_groups : bool, optional
+        If True, return one row per row group and column instead of one row
+        per column. Default is False.
 
     Returns
     -------
     pd.DataFrame
-        The loaded DataFrame.
+        Columns ``column``, ``num_rows``, ``null_count``, ``min``, ``max``,
+        ``has_min_max``, ``compressed_bytes`` and ``uncompressed_bytes``
+        (plus ``row_group`` with `row_groups=True`). Per-column rows combine
+        the row groups; ``min``/``max`` are None unless every row group has
+        statistics for the column, and ``null_count`` is None if any row
+        group lacks a null count.
 
     Notes
     -----
-    Requires either `pyarrow` or `fastparquet` to be installed.
+    Writers may omit statistics. pandas writes NaN in float columns as nulls,
+    so they are included in ``null_count``.
+    """
+    import pyarrow.parquet as pq
+
+    metadata = pq.ParquetFile(filepath).metadata
+    records = []
+    for rg in range(metadata.num_row_groups):
+        row_group = metadata.row_group(rg)
+        for i in range(row_group.num_columns):
+            chunk = row_group.column(i)
+            statistics = chunk.statistics
+            has_min_max = statistics is not None and statistics.has_min_max
+            has_null_count = statistics is not None and statistics.has_null_count
+            records.append(
+                {
+                    "row_group": rg,
+                    "column": chunk.path_in_schema,
+                    "num_rows": row_group.num_rows,
+                    "null_count": statistics.null_count if has_null_count else None,
+                    "min": statistics.min if has_min_max else None,
+                    "max": statistics.max if has_min_max else None,
+                    "has_min_max": has_min_max,
+                    "compressed_bytes": chunk.total_compressed_size,
+                    "uncompressed_bytes": chunk.total_uncompressed_size,
+                }
+            )
+    columns = [
+        "row_group", "column", "num_rows", "null_count", "min", "max",
+        "has_min_max", "compressed_bytes", "uncompressed_bytes",
+    ]
+    stats = pd.DataFrame(records, columns=columns)
+    if row_groups:
+        return stats
+
+    summary = []
+    for name, group in stats.groupby("column", sort=False):
+        has_min_max = bool(group["has_min_max"].all())
+        null_counts = group["null_count"]
+        summary.append(
+            {
+                "column": name,
+                "num_rows": int(group["num_rows"].sum()),
+                "null_count": None if null_counts.isna().any() else int(null_counts.sum()),
+                "min": min(group["min"]) if has_min_max else None,
+                "max": max(group["max"]) if has_min_max else None,
+                "has_min_max": has_min_max,
+                "compressed_bytes": int(group["compressed_bytes"].sum()),
+                "uncompressed_bytes": int(group["uncompressed_bytes"].sum()),
+            }
+        )
+    return pd.DataFrame(summary, columns=columns[1:])
+
+
+def _optimize_batches(batches):
+    """Apply the dtype plan of the first batch to every batch."""
+    plan = None
+    for batch in batches:
+        if plan is None:
+            plan = plan_dtypes(batch)
+        yield optimize_dtypes(batch, plan)
+
+
+def _read_parquet_optimized(filepath, **kwargs):
+    """Read a Parquet file with compact dtypes (see `load_parquet`)."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    filters = kwargs.get("filters")
+    if filters is not None and not isinstance(filters, pc.Expression):
+        filters = pq.filters_to_expression(filters)
+    sample = ds.dataset(filepath, format="parquet", partitioning="hive").head(
+        OPTIMIZE_SAMPLE_ROWS, columns=kwargs.get("columns"), filter=filters
+    )
+    sample = sample.to_pandas()
+    plan = plan_dtypes(sample)
+
+    categories = [col for col, kind in plan.items() if kind == "category"]
+    table = pq.read_table(filepath, read_dictionary=categories, **kwargs)
+    table = pa.table(
+        {name: _narrow_arrow(column) for name, column in zip(table.column_names, table.columns)},
+        metadata=table.schema.metadata,
+    )
+    strings = {pa.string(): pd.StringDtype("pyarrow"), pa.large_string(): pd.StringDtype("pyarrow")}
+    dataframe = table.to_pandas(types_mapper=strings.get)
+
+    before = sample.memory_usage(deep=True).sum() / max(len(sample), 1) * len(dataframe)
+    after = dataframe.memory_usage(deep=True).sum()
+    report_memory(before, after, estimated=len(dataframe) > len(sample))
+    return dataframe
+
+
+def _narrow_arrow(column):
+    """Cast an Arrow column to the narrowest numeric type that holds it exactly."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if pa.types.is_integer(column.type) and column.null_count == 0 and len(column):
+        bounds = pc.min_max(column)
+        low, high = bounds["min"].as_py(), bounds["max"].as_py()
+        candidates = ["uint8", "uint16", "uint32"] if low >= 0 else ["int8", "int16", "int32"]
+        for dtype in candidates:
+            info = np.iinfo(dtype)
+            if info.min <= low and high <= info.max:
+                return column.cast(pa.from_numpy_dtype(np.dtype(dtype)))
+    if pa.types.is_float64(column.type):
+        narrow = column.cast(pa.float32())
+        if pc.all(pc.equal(narrow.cast(pa.float64()), column)).as_py() is not False:
+            return narrow
+    return column
+
+
+def save_feather(
+    dataframe: pd.DataFrame,
+    filepath: Union[str, Path],
+    compression: Optional[str] = "uncompressed",
+    **kwargs,
+) -> None:
+    """Save a DataFrame as an Arrow IPC (Feather v2) file.
+
+    Parameters
+    ----------
+    dataframe : pd.DataFrame
+        The DataFrame to save.
+    filepath : str or Path
+        Destination file path.
+    compression : {'uncompressed', 'lz4', 'zstd'}, optional
+        Buffer compression. The default 'uncompressed' lets `load_feather`
+        memory-map the file without copying; compressed files are smaller
+        but must be decompressed on every load.
+    **kwargs
+        Additional keyword arguments passed to `pyarrow.feather.write_feather`.
+
+    Notes
+    -----
+    Automatically creates the parent directory if it doesn't exist.
 
     """
+    import pyarrow.feather as feather
+
     filepath = Path(filepath)
-    return pd.read_parquet(filepath, **kwargs)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    feather.write_feather(dataframe, filepath, compression=compression, **kwargs)
+
+
+def load_feather(
+    filepath: Union[str, Path],
+    columns: Optional[list[str]] = None,
+    memory_map: bool = True,
+    dtype_backend: Optional[str] = None,
+) -> pd.DataFrame:
+    """Load an Arrow IPC (Feather) file, memory-mapped by default.
+
+    With `memory_map=True` the file is mapped rather than read, so numeric
+    columns without nulls and Arrow-backed string columns point straight at
+    the file's pages: repeated loads are near-instant and processes loading
+    the same file share memory through the OS page cache.
+
+    Parameters
+    ----------
+    filepath : str or Path
+        Path to the Feather file.
+    columns : list of str, optional
+        Columns to load. Default is all columns.
+    memory_map : bool, optional
+        Map the file instead of reading it into memory. Default is True.
+    dtype_backend : {'pyarrow'} or None, optional
+        'pyarrow' returns every column as `pd.ArrowDtype`, avoiding all
+        conversion copies. None (default) restores the saved pandas dtypes.
+
+    Returns
+    -------
+    pd.DataFrame
+
+    """
+    import pyarrow as pa
+    import pyarrow.feather as feather
+
+    table = feather.read_table(filepath, columns=columns, memory_map=memory_map)
+    if dtype_backend == "pyarrow":
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+    # large_string columns come from string[pyarrow] columns; mapping them
+    # directly keeps them zero-copy instead of converting value by value
+    strings = {pa.large_string(): pd.StringDtype("pyarrow")}
+    return table.to_pandas(split_blocks=True, types_mapper=strings.get)
 
 
 def save_csv(dataframe: pd.DataFrame, filepath: Union[str, Path], **kwargs) -> None:
@@ -77,13 +580,78 @@ def save_csv(dataframe: pd.DataFrame, filepath: Union[str, Path], **kwargs) -> N
     dataframe.to_csv(filepath, **kwargs)
 
 
+def sniff_encoding(
+    filepath: Union[str, Path],
+    encodings: Optional[list[str]] = None,
+    sample_bytes: int = 1024 * 1024,
+) -> Optional[str]:
+    """Guess the text encoding of a file from a bounded sample of its bytes.
+
+    A byte-order mark decides the encoding outright if the sample decodes with
+    it. Otherwise each encoding in `encodings` is tried on the sample and the
+    first that decodes it cleanly is returned. Only `sample_bytes` bytes are
+    read, however large the file.
+
+    Parameters
+    ----------
+    filepath : str or Path
+        Path to the file.
+    encodings : list of str, optional
+        Candidate encodings, in order of preference. Defaults to
+        `DEFAULT_ENCODINGS`.
+    sample_bytes : int, optional
+        Number of bytes read from the start of the file. Default is 1 MB.
+
+    Returns
+    -------
+    str or None
+        The detected encoding, or None if no candidate decodes the sample.
+
+    Notes
+    -----
+    Single-byte encodings such as latin1 decode any input, so they should come
+    after the stricter ones in `encodings`.
+    """
+    encodings = encodings or DEFAULT_ENCODINGS
+    with open(filepath, "rb") as f:
+        sample = f.read(sample_bytes)
+        at_eof = not f.read(1)
+
+    candidates = [enc for bom, enc in _BOMS if sample.startswith(bom)][:1]
+    candidates += encodings
+
+    return next((enc for enc in candidates if _decodes(sample, enc, at_eof)), None)
+
+
+def _decodes(data, encoding, final=False):
+    """Check whether `data` decodes cleanly with `encoding`.
+
+    Incremental decoding tolerates a multi-byte character cut off at the end
+    of `data` unless `final` is True.
+    """
+    try:
+        codecs.getincrementaldecoder(encoding)().decode(data, final=final)
+    except (UnicodeDecodeError, LookupError):
+        return False
+    return True
+
+
 def load_csv(
     filepath: Union[str, Path],
     encodings: Optional[list[str]] = None,
     preview_bytes: int = 300,
+    chunksize: Optional[int] = None,
+    engine: Optional[str] = None,
+    sample_bytes: int = 1024 * 1024,
+    optimize: bool = False,
+    cache_dir: Optional[Union[str, Path]] = None,
     **kwargs,
-) -> pd.DataFrame:
-    """Attempt to load a CSV using multiple encodings. If all fail, preview raw bytes.
+):
+    """Load a CSV, detecting its encoding from a sample of the raw bytes.
+
+    The encoding is sniffed once with `sniff_encoding` and the file is parsed
+    a single time with it. If no encoding fits, a preview of the raw bytes is
+    printed.
 
     Parameters
     ----------
@@ -93,37 +661,213 @@ def load_csv(
         List of encodings to try. Defaults to common ones.
     preview_bytes : int
         Number of bytes to show if loading fails (for debugging).
+    chunksize : int, optional
+        If given, return an iterator yielding DataFrames of this many rows
+        instead of loading the whole file.
+    engine : {'c', 'python', 'pyarrow'}, optional
+        Parser engine passed to `pd.read_csv`. 'pyarrow' parses with multiple
+        threads but cannot be combined with `chunksize`.
+    sample_bytes : int, optional
+        Number of bytes used to detect the encoding. Default is 1 MB.
+    optimize : bool, optional
+        If True, choose compact dtypes from the first `OPTIMIZE_SAMPLE_ROWS`
+        rows (see `plan_dtypes`): text columns are parsed directly as
+        'category' or Arrow-backed strings, and numeric columns are downcast
+        losslessly chunk by chunk, so the default wide frame is never built.
+        Prints the memory use before (estimated from the sample) and after.
+        Default is False.
+    cache_dir : str or Path, optional
+        If given, the parsed frame is saved there as a Feather file and later
+        calls with the same arguments load it memory-mapped (see
+        `load_feather`) instead of parsing again. The cache entry is keyed
+        by the CSV's path, size and modification time plus the read
+        arguments, so editing the file invalidates it. Ignored with
+        `chunksize`.
     **kwargs
-        Additional arguments passed to `pd.read_csv`.
+        Additional arguments passed to `pd.read_csv`. Passing `encoding`
+        skips detection.
 
     Returns
     -------
-    pd.DataFrame
-        Loaded DataFrame.
+    pd.DataFrame or pandas.io.parsers.TextFileReader
+        Loaded DataFrame, or an iterator of DataFrames if `chunksize` is set.
 
     Raises
     ------
-    UnicodeDecodeError
-        If no encoding successfully loads the file.
+    ValueError
+        If no encoding successfully decodes the file, or if `chunksize` is
+        combined with the pyarrow engine.
 
     Notes
     -----
+    If the sample decodes as UTF-8 but a later part of the file does not, the
+    parse is retried once with the next candidate encoding. With `chunksize`,
+    such a file raises `UnicodeDecodeError` while iterating; pass a larger
+    `sample_bytes` or an explicit `encoding` instead. The pyarrow engine
+    decodes non-UTF-8 files through Python, so an encoding that fails part
+    way through the file can abort the interpreter; prefer the default engine
+    for multi-byte encodings other than UTF-8.
     """
     filepath = Path(filepath)
-    encodings = encodings or ["utf-8", "utf-8-sig", "latin1", "ISO-8859-1", "cp1252"]
+    encodings = encodings or DEFAULT_ENCODINGS
+
+    if cache_dir is not None and chunksize is None:
+        options = dict(kwargs, encodings=encodings, engine=engine, optimize=optimize)
+        cache_path = _csv_cache_path(filepath, cache_dir, options)
+        if cache_path.exists():
+            print(f"[jcds] Loaded CSV from cache: {cache_path}")
+            return _restore_nan(load_feather(cache_path))
+        dataframe = load_csv(
+            filepath, encodings, preview_bytes, None, engine, sample_bytes, optimize, **kwargs
+        )
+        _write_csv_cache(dataframe, cache_path)
+        return dataframe
+
+    if engine == "pyarrow" and chunksize is not None:
+        raise ValueError("[jcds] The pyarrow engine does not support chunksize.")
+
+    encoding = kwargs.pop("encoding", None)
+    fallbacks = []
+    if encoding is None:
+        encoding = sniff_encoding(filepath, encodings, sample_bytes)
+        if encoding in encodings:
+            fallbacks = encodings[encodings.index(encoding) + 1 :]
+    elif encoding in encodings:
+        fallbacks = encodings[encodings.index(encoding) + 1 :]
+    if encoding is None:
+        _print_preview(filepath, preview_bytes)
+        raise ValueError(
+            f"[jcds] Failed to decode file {filepath} with encodings {encodings}. "
+            "See preview above for troubleshooting."
+        )
+
+    try:
+        if optimize:
+            dataframe = _read_csv_optimized(
+                filepath, chunksize, encoding=encoding, engine=engine, **kwargs
+            )
+        else:
+            dataframe = pd.read_csv(
+                filepath, encoding=encoding, engine=engine, chunksize=chunksize, **kwargs
+            )
+        if engine == "pyarrow":
+            # pyarrow returns undecodable text as bytes instead of raising
+            raw = _undecoded_bytes(dataframe)
+            if raw is not None:
+                raise UnicodeDecodeError(encoding, raw, 0, len(raw), "undecoded by pyarrow")
+    except UnicodeDecodeError as e:
+        # the sample decoded but a later part of the file did not; retry once
+        # with the next candidate that decodes the failing bytes
+        retry = next((enc for enc in fallbacks if _decodes(e.object, enc, True)), None)
+        if chunksize is not None or retry is None:
+            raise
+        print(f"[jcds] Failed to load with encoding: {encoding}")
+        return load_csv(
+            filepath, fallbacks, preview_bytes, chunksize, engine, sample_bytes,
+            optimize, encoding=retry, **kwargs
+        )
+
+    print(f"[jcds] Loaded CSV with encoding: {encoding}")
+    return dataframe
 
-    for encoding in encodings:
-        try:
-            dataframe = pd.read_csv(filepath, encoding=encoding, **kwargs)
-            print(f"[jcds] Loaded CSV with encoding: {encoding}")
-            return dataframe
-        except UnicodeDecodeError:
-            print(f"[jcds] Failed to load with encoding: {encoding}")
-            continue
-        except Exception as e:
-            print(f"[jcds] Unexpected error with encoding '{encoding}': {e}")
-            continue
 
+def _csv_cache_path(filepath, cache_dir, options):
+    """Cache file for a CSV: named by its path, keyed by its state and options."""
+    source = filepath.resolve()
+    stat = source.stat()
+    path_key = hashlib.blake2b(str(source).encode(), digest_size=6).hexdigest()
+    state = repr((stat.st_size, stat.st_mtime_ns, sorted(options.items())))
+    state_key = hashlib.blake2b(state.encode(), digest_size=6).hexdigest()
+    return Path(cache_dir) / f"{source.stem}-{path_key}-{state_key}.feather"
+
+
+def _restore_nan(dataframe):
+    """Use NaN for missing values in object columns, as `pd.read_csv` does.
+
+    Arrow nulls come back as None in object columns.
+    """
+    for col in dataframe.columns[(dataframe.dtypes == object).to_numpy()]:
+        values = dataframe[col].to_numpy()
+        missing = pd.isna(values)
+        if missing.any():
+            values = values.copy()
+            values[missing] = np.nan
+            dataframe[col] = values
+    return dataframe
+
+
+def _write_csv_cache(dataframe, cache_path):
+    """Write a cache entry atomically and drop stale entries for the same CSV."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    prefix = cache_path.name.rsplit("-", 1)[0]
+    temp_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        save_feather(dataframe, temp_path)
+        os.replace(temp_path, cache_path)
+    except Exception as e:
+        # caching is best effort, e.g. non-string column labels
+        temp_path.unlink(missing_ok=True)
+        print(f"[jcds] Could not cache CSV: {e}")
+        return
+    for stale in cache_path.parent.glob(f"{prefix}-*.feather"):
+        if stale != cache_path:
+            stale.unlink(missing_ok=True)
+
+
+def _read_csv_optimized(filepath, chunksize, **kwargs):
+    """Read a CSV with dtypes planned from its first rows (see `load_csv`)."""
+    sample_kwargs = dict(kwargs, engine=None) if kwargs.get("engine") == "pyarrow" else dict(kwargs)
+    # a caller's nrows caps the sample too
+    nrows = min(sample_kwargs.pop("nrows", None) or OPTIMIZE_SAMPLE_ROWS, OPTIMIZE_SAMPLE_ROWS)
+    sample = pd.read_csv(filepath, nrows=nrows, **sample_kwargs)
+    plan = plan_dtypes(sample)
+
+    # integer widths cannot be passed to the parser: it wraps values that do
+    # not fit instead of raising, so only text dtypes are set at parse time
+    dtype = {col: kind for col, kind in plan.items() if kind not in NUMERIC_KINDS}
+    user_dtype = kwargs.pop("dtype", None)
+    if isinstance(user_dtype, dict):
+        dtype.update(user_dtype)
+        plan = {col: kind for col, kind in plan.items() if col not in user_dtype}
+    elif user_dtype is not None:
+        dtype, plan = user_dtype, {}
+
+    if chunksize is not None:
+        reader = pd.read_csv(filepath, dtype=dtype, chunksize=chunksize, **kwargs)
+        return (optimize_dtypes(chunk, plan) for chunk in reader)
+    if kwargs.get("engine") == "pyarrow":
+        dataframe = optimize_dtypes(pd.read_csv(filepath, dtype=dtype, **kwargs), plan)
+    else:
+        with pd.read_csv(
+            filepath, dtype=dtype, chunksize=OPTIMIZE_SAMPLE_ROWS, **kwargs
+        ) as reader:
+            dataframe = concat_chunks([optimize_dtypes(chunk, plan) for chunk in reader])
+
+    before = sample.memory_usage(deep=True).sum() / max(len(sample), 1) * len(dataframe)
+    after = dataframe.memory_usage(deep=True).sum()
+    report_memory(before, after, estimated=len(dataframe) > len(sample))
+    return dataframe
+
+
+def _undecoded_bytes(dataframe):
+    """Return the cells the pyarrow engine left as raw bytes, joined, or None.
+
+    pyarrow turns a whole column to bytes when any cell fails to decode, so
+    all of them are returned to choose an encoding that decodes every one;
+    pyarrow aborts the process if decoding fails inside its reader.
+    """
+    raw = [
+        value
+        for _, column in dataframe.select_dtypes("object").items()
+        if ptypes.infer_dtype(column, skipna=True) in ("bytes", "mixed")
+        for value in column
+        if isinstance(value, bytes)
+    ]
+    return b"\n".join(raw) if raw else None
+
+
+def _print_preview(filepath, preview_bytes):
+    """Print the first bytes of a file that could not be decoded."""
     print(f"[jcds] ❌ Could not decode file: {filepath}")
     print(f"[jcds] Preview of raw bytes:")
 
@@ -133,8 +877,3 @@ def load_csv(
             print(raw.decode("latin1", errors="replace"))  # fallback preview
     except Exception as e:
         print(f"[jcds] Also failed to read raw bytes: {e}")
-
-    raise ValueError(
-        f"[jcds] Failed to decode file {filepath} with encodings {encodings}. "
-        "See preview above for troubleshooting."
-    )
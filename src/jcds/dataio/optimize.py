@@ -0,0 +1,143 @@
+import numpy as np
+import pandas as pd
+import pandas.api.types as ptypes
+from pandas.api.types import union_categoricals
+
+
+# rows read to plan dtypes before the full load
+OPTIMIZE_SAMPLE_ROWS = 100_000
+
+# string columns with at most this share of distinct values become categories
+CATEGORY_MAX_RATIO = 0.5
+
+# plan entries for numeric columns; narrowed per chunk after parsing
+NUMERIC_KINDS = ("integer", "float")
+
+STRING_DTYPE = "string[pyarrow]"
+
+
+def plan_dtypes(sample, category_ratio=CATEGORY_MAX_RATIO):
+    """
+    Choose a compact dtype for each column from a sample of the data.
+
+    Parameters
+    ----------
+    sample : pd.DataFrame
+        Rows read with pandas' default dtypes, e.g. the first chunk of a file.
+    category_ratio : float, optional
+        String columns whose distinct values make up at most this share of
+        the non-null values become 'category'; others become Arrow-backed
+        strings. Default is 0.5.
+
+    Returns
+    -------
+    dict
+        Maps each column to 'integer' or 'float' for numeric columns (narrowed
+        from the actual values by `optimize_dtypes`), or to 'category' or
+        'string[pyarrow]' for text columns. Other columns are left out.
+    """
+    plan = {}
+    for col, series in sample.items():
+        if ptypes.is_bool_dtype(series):
+            continue
+        if ptypes.is_integer_dtype(series):
+            plan[col] = "integer"
+        elif ptypes.is_float_dtype(series):
+            plan[col] = "float"
+        elif ptypes.is_object_dtype(series) or ptypes.is_string_dtype(series):
+            if ptypes.infer_dtype(series, skipna=True) not in ("string", "empty"):
+                continue
+            values = series.dropna()
+            if len(values) and values.nunique() <= category_ratio * len(values):
+                plan[col] = "category"
+            else:
+                plan[col] = STRING_DTYPE
+    return plan
+
+
+def _downcast(series, kind):
+    """
+    Narrow a numeric Series without losing information.
+
+    Integers take the smallest (unsigned if non-negative) integer dtype that
+    holds them. Floats become float32 only if every value survives the round
+    trip exactly. Series that do not match `kind` (e.g. a column that turned
+    out to hold text) are returned unchanged.
+    """
+    if kind == "integer" and ptypes.is_integer_dtype(series):
+        sign = "unsigned" if len(series) and series.min() >= 0 else "integer"
+        return pd.to_numeric(series, downcast=sign)
+    if ptypes.is_float_dtype(series) and series.dtype != np.float32:
+        narrow = series.astype(np.float32)
+        if np.array_equal(narrow.to_numpy(np.float64), series.to_numpy(), equal_nan=True):
+            return narrow
+    return series
+
+
+def optimize_dtypes(dataframe, plan=None, category_ratio=CATEGORY_MAX_RATIO):
+    """
+    Return a copy of a DataFrame with narrower dtypes.
+
+    Numeric columns are downcast losslessly, low-cardinality text columns
+    become 'category' and other text columns Arrow-backed strings.
+
+    Parameters
+    ----------
+    dataframe : pd.DataFrame
+    plan : dict, optional
+        Output of `plan_dtypes`. If None, planned from `dataframe` itself.
+    category_ratio : float, optional
+        Passed to `plan_dtypes` when `plan` is None. Default is 0.5.
+
+    Returns
+    -------
+    pd.DataFrame
+    """
+    if plan is None:
+        plan = plan_dtypes(dataframe, category_ratio)
+    columns = {}
+    for col, series in dataframe.items():
+        kind = plan.get(col)
+        if kind in NUMERIC_KINDS:
+            series = _downcast(series, kind)
+        elif kind is not None and series.dtype != kind:
+            series = series.astype(kind)
+        columns[col] = series
+    return pd.DataFrame(columns, index=dataframe.index)
+
+
+def concat_chunks(chunks):
+    """
+    Concatenate DataFrame chunks, keeping categorical columns categorical.
+
+    `pd.concat` turns categoricals with differing categories into object
+    columns, so their categories are unioned first.
+    """
+    if not chunks:
+        return pd.DataFrame()
+    for col in chunks[0].columns:
+        if all(isinstance(chunk[col].dtype, pd.CategoricalDtype) for chunk in chunks):
+            categories = union_categoricals([chunk[col] for chunk in chunks]).categories
+            for chunk in chunks:
+                chunk[col] = chunk[col].cat.set_categories(categories)
+    return pd.concat(chunks)
+
+
+def report_memory(before, after, estimated=False):
+    """
+    Print memory use before and after dtype optimization.
+
+    Parameters
+    ----------
+    before, after : int
+        Sizes in bytes.
+    estimated : bool, optional
+        Mark `before` as an estimate. Default is False.
+    """
+    before_mb, after_mb = before / 1024**2, after / 1024**2
+    saved = 100 * (1 - after / before) if before else 0.0
+    prefix = "~" if estimated else ""
+    print(
+        f"[jcds] Memory usage: {prefix}{before_mb:.2f} MB -> {after_mb:.2f} MB "
+        f"({saved:.0f}% smaller)"
+    )
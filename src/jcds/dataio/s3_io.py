@@ -1,9 +1,191 @@
+import hashlib
+import io
+import json
+import os
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 import pandas as pd
 import requests
-from io import BytesIO
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# transient statuses worth retrying (throttling and server errors)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# bytes fetched per range request when reading Parquet remotely
+RANGE_BLOCK_SIZE = 1024 * 1024
+
+# size cap of a download cache; least recently used files are evicted first
+CACHE_MAX_BYTES = 2 * 1024**3
+
+FILE_TYPES = ("csv", "excel", "parquet")
+
+_session = None
+_cache_lock = threading.Lock()
+
+# cache entries a running read_s3_many still has to read; never evicted
+_pinned = Counter()
+
+
+def configure_session(retries=3, backoff_factor=0.5, pool_maxsize=10):
+    """Create the shared HTTP session used by `read_s3` and `open_s3`.
+
+    The session keeps connections alive between calls (one pool per host) and
+    retries failed requests with exponential backoff.
+
+    Parameters
+    ----------
+    retries : int, optional
+        Maximum number of retries per request. Default is 3.
+    backoff_factor : float, optional
+        Base of the exponential sleep between retries, in seconds. Default
+        is 0.5.
+    pool_maxsize : int, optional
+        Number of connections kept open per host. Default is 10.
+
+    Returns
+    -------
+    requests.Session
+    """
+    global _session
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=("GET", "HEAD"),
+    )
+    adapter = HTTPAdapter(
+        max_retries=retry, pool_connections=pool_maxsize, pool_maxsize=pool_maxsize
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if _session is not None:
+        _session.close()
+    _session = session
+    return session
+
+
+def get_session():
+    """Return the shared HTTP session, creating it with defaults if needed."""
+    return _session if _session is not None else configure_session()
+
+
+def _check_file_type(file_type):
+    if file_type not in FILE_TYPES:
+        raise ValueError("Unsupported file type. Use 'csv', 'excel' or 'parquet'.")
+
+
+def _s3_url(bucket_name, file_name, endpoint_url=None):
+    if endpoint_url is None:
+        return f"https://{bucket_name}.s3.amazonaws.com/{file_name}"
+    return f"{endpoint_url.rstrip('/')}/{bucket_name}/{file_name}"
+
 
+class _HTTPRangeFile(io.RawIOBase):
+    """Read-only, seekable file whose reads are HTTP range requests."""
 
-def read_s3(bucket_name: str, file_name: str, file_type: str = "csv") -> pd.DataFrame:
+    def __init__(self, url, session, timeout):
+        self.url = url
+        self.session = session
+        self.timeout = timeout
+        response = session.head(url, timeout=timeout)
+        response.raise_for_status()
+        self.size = int(response.headers["Content-Length"])
+        self.position = 0
+        self.range_requests = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self.position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            self.position = offset
+        elif whence == io.SEEK_CUR:
+            self.position += offset
+        elif whence == io.SEEK_END:
+            self.position = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        return self.position
+
+    def readinto(self, buffer):
+        end = min(self.position + len(buffer), self.size)
+        if end <= self.position:
+            return 0
+        response = self.session.get(
+            self.url,
+            headers={"Range": f"bytes={self.position}-{end - 1}"},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        if response.status_code != 206:
+            raise OSError(f"Server does not support range requests: {self.url}")
+        self.range_requests += 1
+        data = response.content
+        buffer[: len(data)] = data
+        self.position += len(data)
+        return len(data)
+
+
+def open_s3(
+    bucket_name: str,
+    file_name: str,
+    endpoint_url: str = None,
+    timeout: float = 30,
+    block_size: int = RANGE_BLOCK_SIZE,
+):
+    """Open a public S3 object as a seekable, read-only file.
+
+    Nothing is downloaded up front: each read fetches only the bytes it needs
+    with an HTTP range request over the shared session, buffered in blocks
+    of `block_size`. Parquet readers can then fetch the footer and just the
+    column chunks they need.
+
+    Parameters
+    ----------
+    bucket_name : str
+        The name of the public S3 bucket.
+    file_name : str
+        The path to the file within the bucket.
+    endpoint_url : str, optional
+        Base URL of an S3-compatible service, addressed path-style as
+        ``{endpoint_url}/{bucket_name}/{file_name}``. Default is AWS.
+    timeout : float, optional
+        Seconds to wait for each response. Default is 30.
+    block_size : int, optional
+        Read-ahead buffer size in bytes. Default is 1 MB.
+
+    Returns
+    -------
+    io.BufferedReader
+        The underlying range reader is available as `.raw`; its
+        `range_requests` counts the requests made.
+    """
+    url = _s3_url(bucket_name, file_name, endpoint_url)
+    return io.BufferedReader(_HTTPRangeFile(url, get_session(), timeout), block_size)
+
+
+def read_s3(
+    bucket_name: str,
+    file_name: str,
+    file_type: str = "csv",
+    endpoint_url: str = None,
+    timeout: float = 30,
+    columns: list = None,
+    filters=None,
+    **kwargs,
+) -> pd.DataFrame:
     """Download a public file from an S3 bucket and load it into a pandas DataFrame.
 
     Parameters
@@ -13,7 +195,20 @@ def read_s3(bucket_name: str, file_name: str, file_type: str = "csv") -> pd.Data
     file_name : str
         The path to the file within the bucket.
     file_type : str, optional
-        The type of file to load. Supported values are 'csv' and 'excel'. Defaults to 'csv'.
+        The type of file to load. Supported values are 'csv', 'excel' and
+        'parquet'. Defaults to 'csv'.
+    endpoint_url : str, optional
+        Base URL of an S3-compatible service (path-style). Default is AWS.
+    timeout : float, optional
+        Seconds to wait for each response. Default is 30.
+    columns : list of str, optional
+        Parquet only: columns to fetch.
+    filters : list of tuple, optional
+        Parquet only: row filter in the `pyarrow.parquet.read_table` format.
+    **kwargs
+        Additional keyword arguments passed to `pd.read_csv`, `pd.read_excel`
+        or `pyarrow.parquet.read_table`. For CSV, `chunksize` returns an
+        iterator of DataFrames that keeps streaming the response.
 
     Returns
     -------
@@ -23,28 +218,301 @@ def read_s3(bucket_name: str, file_name: str, file_type: str = "csv") -> pd.Data
     Notes
     -----
     - This function assumes the file is publicly accessible via a standard S3 URL.
+    - Requests share a pooled `requests.Session` and are retried with backoff
+      on connection errors and 429/5xx responses (see `configure_session`).
+    - CSV bodies are streamed into `pd.read_csv` as they arrive instead of
+      being buffered whole. Parquet files are read with range requests (see
+      `open_s3`), so only the footer and the selected columns and row groups
+      are downloaded. Excel files are downloaded whole.
     - For Excel files, only `.xlsx` is supported.
-    - Requires the `requests`, `pandas`, and `io` modules.
     - Prints an error message and returns None if the request fails or the file type is unsupported.
 
     """
-    url = f"https://{bucket_name}.s3.amazonaws.com/{file_name}"
+    _check_file_type(file_type)
+    url = _s3_url(bucket_name, file_name, endpoint_url)
 
     try:
-        response = requests.get(url)
+        if file_type == "parquet":
+            import pyarrow.parquet as pq
+
+            with open_s3(bucket_name, file_name, endpoint_url, timeout) as source:
+                table = pq.read_table(source, columns=columns, filters=filters, **kwargs)
+            return table.to_pandas()
+
+        response = get_session().get(url, stream=file_type == "csv", timeout=timeout)
         response.raise_for_status()
 
-        if file_type == "csv":
-            dataframe = pd.read_csv(BytesIO(response.content))
-        elif file_type == "excel":
-            dataframe = pd.read_excel(BytesIO(response.content))
-        else:
-            raise ValueError("Unsupported file type. Use 'csv' or 'excel'.")
-        return dataframe
+        if file_type == "excel":
+            return pd.read_excel(io.BytesIO(response.content), **kwargs)
+        # let urllib3 undo any Content-Encoding while pandas reads the stream
+        response.raw.decode_content = True
+        if kwargs.get("chunksize") is not None or kwargs.get("iterator"):
+            return _stream_chunks(response, pd.read_csv(response.raw, **kwargs))
+        with response:
+            return pd.read_csv(response.raw, **kwargs)
 
     except ValueError:
-        raise  # Let unsupported type errors propagate for testing
+        raise  # parsing errors propagate, as they always have
 
     except Exception as e:
         print(f"[jcds] Error loading file from S3: {e}")
         return None
+
+
+def _stream_chunks(response, reader):
+    """Yield CSV chunks, closing the response once they are consumed."""
+    with response, reader:
+        yield from reader
+
+
+def _cache_paths(cache_dir, url):
+    """Data and metadata paths of the cache entry for `url`."""
+    digest = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+    return cache_dir / digest, cache_dir / f"{digest}.json"
+
+
+def _evict(cache_dir, max_bytes, keep=None):
+    """
+    Delete least recently used cache entries until under `max_bytes`.
+
+    `keep` and pinned entries are skipped. Call with `_cache_lock` held.
+    """
+    entries = []
+    for meta_path in cache_dir.glob("*.json"):
+        data_path = meta_path.with_suffix("")
+        try:
+            stat = data_path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, data_path, meta_path))
+    total = sum(size for _, size, _, _ in entries)
+    for _, size, data_path, meta_path in sorted(entries, key=lambda e: e[0]):
+        if total <= max_bytes:
+            break
+        if data_path == keep or _pinned[data_path]:
+            continue
+        meta_path.unlink(missing_ok=True)
+        data_path.unlink(missing_ok=True)
+        total -= size
+
+
+def download_s3(
+    bucket_name: str,
+    file_name: str,
+    cache_dir,
+    endpoint_url: str = None,
+    timeout: float = 30,
+    revalidate: bool = True,
+    max_bytes: int = CACHE_MAX_BYTES,
+) -> Path:
+    """Download a public S3 object into a local cache and return its path.
+
+    A cached copy is revalidated with a conditional request (`If-None-Match`
+    on its ETag, or `If-Modified-Since`); a 304 reply reuses it without
+    downloading again. Entries are named by a hash of the object URL and the
+    least recently used ones are evicted once the cache exceeds `max_bytes`.
+
+    Parameters
+    ----------
+    bucket_name : str
+        The name of the public S3 bucket.
+    file_name : str
+        The path to the file within the bucket.
+    cache_dir : str or Path
+        Directory holding the cache; created if missing.
+    endpoint_url : str, optional
+        Base URL of an S3-compatible service (path-style). Default is AWS.
+    timeout : float, optional
+        Seconds to wait for each response. Default is 30.
+    revalidate : bool, optional
+        If False, a cached copy is used without contacting S3. Default is True.
+    max_bytes : int, optional
+        Size cap of the cache in bytes. Default is 2 GB.
+
+    Returns
+    -------
+    Path
+        Local path of the downloaded (or still valid cached) object.
+
+    Raises
+    ------
+    requests.HTTPError
+        If S3 answers with an error status.
+    """
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    url = _s3_url(bucket_name, file_name, endpoint_url)
+    data_path, meta_path = _cache_paths(cache_dir, url)
+
+    headers = {}
+    if data_path.exists() and meta_path.exists():
+        meta = json.loads(meta_path.read_text())
+        if not revalidate:
+            os.utime(data_path)  # mark as recently used
+            return data_path
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        elif meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    with get_session().get(url, headers=headers, stream=True, timeout=timeout) as response:
+        if response.status_code == 304 and headers:
+            os.utime(data_path)
+            return data_path
+        response.raise_for_status()
+        partial = data_path.with_name(f"{data_path.name}.{threading.get_ident()}.part")
+        with open(partial, "wb") as f:
+            for block in response.iter_content(RANGE_BLOCK_SIZE):
+                f.write(block)
+        meta = {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+
+    with _cache_lock:
+        os.replace(partial, data_path)
+        meta_path.write_text(json.dumps(meta))
+        _evict(cache_dir, max_bytes, keep=data_path)
+    return data_path
+
+
+def _read_local(path, file_type, columns=None, filters=None, **kwargs):
+    if file_type == "parquet":
+        return pd.read_parquet(path, columns=columns, filters=filters, **kwargs)
+    if file_type == "excel":
+        return pd.read_excel(path, **kwargs)
+    return pd.read_csv(path, **kwargs)
+
+
+def read_s3_many(
+    bucket_name: str,
+    file_names: list,
+    file_type: str = "csv",
+    cache_dir=None,
+    max_workers: int = 8,
+    concat: bool = True,
+    endpoint_url: str = None,
+    timeout: float = 30,
+    columns: list = None,
+    filters=None,
+    revalidate: bool = True,
+    max_bytes: int = CACHE_MAX_BYTES,
+    **kwargs,
+):
+    """Load many public S3 objects concurrently.
+
+    Objects are fetched on a thread pool over the shared session (see
+    `configure_session`; its `pool_maxsize` should be at least
+    `max_workers`) and parsed as they arrive.
+
+    Parameters
+    ----------
+    bucket_name : str
+        The name of the public S3 bucket.
+    file_names : list of str or list of dict
+        Paths of the files within the bucket, or records from
+        `jcds.aws.iter_s3_objects`; the sizes in records are used to start
+        the largest downloads first, and prefix records are skipped.
+    file_type : str, optional
+        'csv', 'excel' or 'parquet'. Defaults to 'csv'.
+    cache_dir : str or Path, optional
+        If given, objects are downloaded through `download_s3` into this
+        directory, so unchanged objects are not downloaded again.
+    max_workers : int, optional
+        Number of concurrent downloads. Default is 8.
+    concat : bool, optional
+        If True (default), return one DataFrame with the files in the order
+        of `file_names`. If False, return a dict mapping each file name to
+        its DataFrame.
+    endpoint_url : str, optional
+        Base URL of an S3-compatible service (path-style). Default is AWS.
+    timeout : float, optional
+        Seconds to wait for each response. Default is 30.
+    columns : list of str, optional
+        Parquet only: columns to read.
+    filters : list of tuple, optional
+        Parquet only: row filter in the `pyarrow.parquet.read_table` format.
+    revalidate : bool, optional
+        Passed to `download_s3`. Default is True.
+    max_bytes : int, optional
+        Size cap of the cache in bytes. Default is 2 GB.
+    **kwargs
+        Additional keyword arguments passed to the reader of each file.
+
+    Returns
+    -------
+    pd.DataFrame, dict or None
+        The loaded data, or None if any file failed to load (the failures
+        are printed).
+    """
+    _check_file_type(file_type)
+    records = [
+        f if isinstance(f, dict) else {"key": f}
+        for f in file_names
+        if not (isinstance(f, dict) and f.get("is_prefix"))
+    ]
+    file_names = [record["key"] for record in records]
+
+    pinned = {}
+    if cache_dir is not None:
+        # protect every entry of this batch until it has been read, so that
+        # another worker's eviction cannot delete it in between
+        pinned = {
+            name: _cache_paths(Path(cache_dir), _s3_url(bucket_name, name, endpoint_url))[0]
+            for name in file_names
+        }
+        with _cache_lock:
+            _pinned.update(pinned[name] for name in file_names)
+
+    def load(file_name):
+        if cache_dir is None:
+            return read_s3(
+                bucket_name,
+                file_name,
+                file_type,
+                endpoint_url=endpoint_url,
+                timeout=timeout,
+                columns=columns,
+                filters=filters,
+                **kwargs,
+            )
+        try:
+            path = download_s3(
+                bucket_name,
+                file_name,
+                cache_dir,
+                endpoint_url=endpoint_url,
+                timeout=timeout,
+                revalidate=revalidate,
+                max_bytes=max_bytes,
+            )
+            return _read_local(path, file_type, columns, filters, **kwargs)
+        except Exception as e:
+            print(f"[jcds] Error loading {file_name} from S3: {e}")
+            return None
+        finally:
+            with _cache_lock:
+                _pinned[pinned[file_name]] -= 1
+                if _pinned[pinned[file_name]] <= 0:
+                    del _pinned[pinned[file_name]]
+
+    # start the largest objects first so a big file does not run on alone at the end
+    order = sorted(range(len(records)), key=lambda i: -(records[i].get("size") or 0))
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(file_names)))) as pool:
+        futures = {i: pool.submit(load, file_names[i]) for i in order}
+        frames = [futures[i].result() for i in range(len(file_names))]
+    if cache_dir is not None:
+        # entries kept for this batch may have left the cache over its cap
+        with _cache_lock:
+            _evict(Path(cache_dir), max_bytes)
+
+    failed = [name for name, df in zip(file_names, frames) if df is None]
+    if failed:
+        print(f"[jcds] {len(failed)} of {len(file_names)} files failed to load: {failed}")
+        return None
+    if not concat:
+        return dict(zip(file_names, frames))
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
@@ -2,7 +2,7 @@ import sys
 import jcds.utils
 
 # Import your functions from internal files
-from .datetime import create_dt_col, create_dt_cols
+from .datetime import create_dt_col, create_dt_cols, infer_datetime_format
 
 from .lists import list_unique_values
 
@@ -10,7 +10,6 @@ from .inspect import (
     show_memory_use,
     show_shape,
     show_dimensions,
-    show_dupes,
     show_catvar,
     show_convar,
     show_lowcardvars,
@@ -34,9 +33,20 @@ from .inspect import (
     show_null_cols,
 )
 
-from .outliers import detect_outliers_iqr, plot_outlier_boxplots
+from .cache import enable_cache, disable_cache, clear_cache, cache_info, fingerprint
 
-from .reports import dqr_cat, dqr_cont, display_all_col_head
+from .duplicates import show_dupes, show_file_dupes
+
+from .parallel import set_executor, get_executor
+
+from .profile import (
+    profile_dataframe,
+    profile_column,
+    profile_file,
+    profile_parquet_metadata,
+)
+
+from .sketches import HyperLogLog, QuantileSketch, approx_nunique, approx_quantile
 
 from .transform import (
     rename_column,
@@ -50,10 +60,27 @@ from .transform import (
     convert_to_bool,
 )
 
-from .univariate import describe_categorical, plot_categorical
-
-from .multivariate import correlation_matrix, plot_correlation_heatmap
-
+# Plotting and notebook helpers import matplotlib, seaborn and IPython, so
+# they are loaded on first access
+__getattr__, __dir__ = jcds.utils._lazy_loader(
+    __name__,
+    {
+        "detect_outliers": (".outliers", "detect_outliers"),
+        "detect_outliers_iqr": (".outliers", "detect_outliers_iqr"),
+        "outlier_columns": (".outliers", "outlier_columns"),
+        "OutlierResult": (".outliers", "OutlierResult"),
+        "register_outlier_engine": (".outliers", "register_outlier_engine"),
+        "iqr_fences": (".outliers", "iqr_fences"),
+        "plot_outlier_boxplots": (".outliers", "plot_outlier_boxplots"),
+        "dqr_cat": (".reports", "dqr_cat"),
+        "dqr_cont": (".reports", "dqr_cont"),
+        "display_all_col_head": (".reports", "display_all_col_head"),
+        "describe_categorical": (".univariate", "describe_categorical"),
+        "plot_categorical": (".univariate", "plot_categorical"),
+        "correlation_matrix": (".multivariate", "correlation_matrix"),
+        "plot_correlation_heatmap": (".multivariate", "plot_correlation_heatmap"),
+    },
+)
 
 help = jcds.utils._make_module_help(sys.modules[__name__])
 
@@ -72,6 +99,7 @@ __all__ = [
     "show_shape",
     "show_dimensions",
     "show_dupes",
+    "show_file_dupes",
     "show_catvar",
     "show_convar",
     "show_lowcardvars",
@@ -85,6 +113,7 @@ __all__ = [
     "rename_column",
     "create_dt_col",
     "create_dt_cols",
+    "infer_datetime_format",
     "describe_categorical",
     "plot_categorical",
     "correlation_matrix",
@@ -98,7 +127,12 @@ __all__ = [
     "count_id_like_columns",
     "get_dtype_summary",
     "show_missing_summary",
+    "detect_outliers",
     "detect_outliers_iqr",
+    "outlier_columns",
+    "OutlierResult",
+    "register_outlier_engine",
+    "iqr_fences",
     "plot_outlier_boxplots",
     "delete_columns",
     "convert_to_int",
@@ -110,5 +144,20 @@ __all__ = [
     "convert_to_bool",
     "show_null_rows",
     "show_null_cols", 
+    "profile_dataframe",
+    "profile_column",
+    "profile_file",
+    "profile_parquet_metadata",
+    "HyperLogLog",
+    "QuantileSketch",
+    "approx_nunique",
+    "approx_quantile",
+    "enable_cache",
+    "disable_cache",
+    "clear_cache",
+    "cache_info",
+    "fingerprint",
+    "set_executor",
+    "get_executor",
     "help",
 ]
@@ -0,0 +1,264 @@
+import copy
+import functools
+import hashlib
+import inspect
+import pickle
+import sys
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+# rows hashed by the default (sampled) fingerprint
+FINGERPRINT_SAMPLE_ROWS = 64
+
+
+def _buffer_ids(dataframe):
+    """
+    Identify the arrays backing a DataFrame.
+
+    Replacing or adding a column allocates a new array, so this changes even
+    when the sampled rows do not. Returns an empty tuple if the block layout
+    is not available in this pandas version.
+    """
+    manager = getattr(dataframe, "_mgr", None)
+    ids = []
+    for block in getattr(manager, "blocks", ()):
+        values = block.values
+        if isinstance(values, np.ndarray):
+            ids.append(values.__array_interface__["data"][0])
+        else:
+            ids.append(id(values))
+    return tuple(ids)
+
+
+def fingerprint(dataframe, full=False, sample_rows=FINGERPRINT_SAMPLE_ROWS):
+    """
+    Return a cheap digest identifying the contents of a DataFrame.
+
+    The digest covers the shape, column labels, dtypes, the identity of the
+    underlying arrays and a hash of `sample_rows` evenly spaced rows
+    (including their index labels). Replacing, adding or re-typing a column
+    and most whole-frame operations change it; an in-place edit of a single
+    cell outside the sampled rows does not. Use `full=True` to hash every row
+    when that matters.
+
+    Parameters
+    ----------
+    dataframe : pd.DataFrame
+    full : bool, optional
+        Hash all rows instead of a sample. Default is False.
+    sample_rows : int, optional
+        Number of rows hashed when `full=False`. Default is 64.
+
+    Returns
+    -------
+    str
+        Hex digest.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    header = (
+        dataframe.shape,
+        [str(col) for col in dataframe.columns],
+        [str(dtype) for dtype in dataframe.dtypes],
+        _buffer_ids(dataframe),
+    )
+    digest.update(repr(header).encode())
+
+    n_rows = len(dataframe)
+    if full or n_rows <= sample_rows:
+        rows = dataframe
+    else:
+        positions = np.unique(np.linspace(0, n_rows - 1, sample_rows).astype(np.intp))
+        rows = dataframe.iloc[positions]
+    try:
+        hashes = pd.util.hash_pandas_object(rows, index=True).to_numpy()
+    except TypeError:
+        # unhashable cells (lists, dicts); fall back to their text
+        hashes = pd.util.hash_pandas_object(rows.astype(str), index=True).to_numpy()
+    digest.update(hashes.tobytes())
+    return digest.hexdigest()
+
+
+def _estimate_size(value):
+    """Approximate memory held by a cached value, in bytes."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return int(value.memory_usage(deep=True).sum())
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+class LRUCache:
+    """
+    Least-recently-used store bounded by entry count and total size.
+
+    Parameters
+    ----------
+    max_bytes : int
+        Evict entries once their estimated total size exceeds this.
+    max_entries : int
+        Evict entries once there are more than this many.
+    """
+
+    def __init__(self, max_bytes, max_entries):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key):
+        """Return ``(True, value)`` on a hit and ``(False, None)`` on a miss."""
+        if key not in self._entries:
+            self.misses += 1
+            return False, None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True, self._entries[key][0]
+
+    def put(self, key, value):
+        """Store `value`, evicting the least recently used entries as needed."""
+        size = _estimate_size(value)
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self.current_bytes -= self._entries.pop(key)[1]
+        self._entries[key] = (value, size)
+        self.current_bytes += size
+        while self._entries and (
+            self.current_bytes > self.max_bytes or len(self._entries) > self.max_entries
+        ):
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.current_bytes -= evicted
+
+    def clear(self):
+        self._entries.clear()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+
+# the active cache; None while caching is disabled (the default)
+_cache = None
+_full_hash = False
+
+
+def enable_cache(max_bytes=256 * 1024**2, max_entries=256, full_hash=False):
+    """
+    Turn on result caching for the inspect functions, profiles and reports.
+
+    Results are keyed by the function, its arguments and a `fingerprint` of
+    the DataFrame (or the path, size and modification time of a file), so a
+    repeat call on an unchanged frame is answered from memory.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        Memory cap for cached results. Default is 256 MB.
+    max_entries : int, optional
+        Maximum number of cached results. Default is 256.
+    full_hash : bool, optional
+        Fingerprint frames by hashing every row instead of a sample, so that
+        in-place edits to any cell invalidate the cache. Default is False.
+    """
+    global _cache, _full_hash
+    _cache = LRUCache(max_bytes, max_entries)
+    _full_hash = full_hash
+
+
+def disable_cache():
+    """Turn caching off and drop all cached results."""
+    global _cache
+    _cache = None
+
+
+def clear_cache():
+    """Drop all cached results, keeping caching enabled."""
+    if _cache is not None:
+        _cache.clear()
+
+
+def cache_info():
+    """
+    Return cache statistics.
+
+    Returns
+    -------
+    dict
+        ``enabled``, ``hits``, ``misses``, ``entries``, ``bytes``,
+        ``max_bytes`` and ``max_entries``.
+    """
+    if _cache is None:
+        return {"enabled": False, "hits": 0, "misses": 0, "entries": 0, "bytes": 0}
+    return {
+        "enabled": True,
+        "hits": _cache.hits,
+        "misses": _cache.misses,
+        "entries": len(_cache),
+        "bytes": _cache.current_bytes,
+        "max_bytes": _cache.max_bytes,
+        "max_entries": _cache.max_entries,
+    }
+
+
+def _data_key(data):
+    """Cache key for the data argument, or None if it cannot be keyed."""
+    if isinstance(data, pd.DataFrame):
+        return ("frame", fingerprint(data, full=_full_hash))
+    if isinstance(data, (str, Path)):
+        path = Path(data).resolve()
+        stat = path.stat()
+        return ("file", str(path), stat.st_size, stat.st_mtime_ns)
+    return None
+
+
+def cached(func):
+    """
+    Cache the results of a function whose first argument is the data.
+
+    Calls bypass the cache while it is disabled, when a precomputed
+    `profile` is passed, and when `verbose=True` asks for printed output.
+    Cached values are copied on the way in and out, so callers may modify
+    what they get back.
+    """
+    signature = inspect.signature(func)
+    data_param = next(iter(signature.parameters))
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _cache is None:
+            return func(*args, **kwargs)
+
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+        data = arguments.pop(data_param)
+        if arguments.get("profile") is not None or arguments.get("verbose"):
+            return func(*args, **kwargs)
+        try:
+            data_key = _data_key(data)
+        except (OSError, TypeError):
+            data_key = None
+        if data_key is None:
+            return func(*args, **kwargs)
+
+        key = (func.__module__, func.__qualname__, data_key, repr(sorted(arguments.items())))
+        hit, value = _cache.get(key)
+        if hit:
+            return copy.deepcopy(value)
+        value = func(*args, **kwargs)
+        _cache.put(key, copy.deepcopy(value))
+        return value
+
+    return wrapper
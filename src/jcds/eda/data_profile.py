@@ -0,0 +1,291 @@
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+# report kind -> function(profile, show_columns) returning the lines to print;
+# a line is a string or a DataFrame to display
+_RENDERERS = {}
+
+
+def register_renderer(kind):
+    """
+    Register the function that renders `DataProfile` objects of `kind`.
+
+    The function takes the profile and a `show_columns` flag and returns a
+    list of items to print, each a string or a DataFrame.
+    """
+
+    def decorator(func):
+        _RENDERERS[kind] = func
+        return func
+
+    return decorator
+
+
+def _jsonable(value):
+    """Convert numpy scalars, tuples and non-str keys to plain JSON types."""
+    if isinstance(value, dict):
+        return {str(k): _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    return value
+
+
+def _is_scalar_metric(value):
+    return value is None or isinstance(value, (bool, int, float, np.number, np.bool_))
+
+
+@dataclass
+class DataProfile:
+    """
+    Machine-readable result of a report function.
+
+    `data_info`, `data_cardinality`, `data_quality`, `catvar_report`,
+    `dqr_cont` and `dqr_cat` compute their numbers into a `DataProfile`,
+    print it, and return it, so the same pass serves the console, notebooks
+    and metric pipelines. Profiles round-trip through JSON and Parquet
+    without recomputing anything.
+
+    Attributes
+    ----------
+    kind : str
+        Name of the report that produced the profile, e.g. "data_quality".
+    summary : dict
+        Metrics and column lists, keyed by name.
+    tables : dict of str to pd.DataFrame
+        Tabular results, e.g. the per-feature tables of `dqr_cont`.
+
+    Examples
+    --------
+    >>> result = data_quality(df, verbose=False)
+    >>> result["duplicates"]
+    0
+    >>> DataProfile.from_json(result.to_json()) == result
+    True
+    """
+
+    kind: str
+    summary: dict = field(default_factory=dict)
+    tables: dict = field(default_factory=dict)
+
+    def __getitem__(self, key):
+        return self.summary[key]
+
+    def __eq__(self, other):
+        if not isinstance(other, DataProfile):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return f"DataProfile(kind={self.kind!r}, summary={list(self.summary)})"
+
+    # --- rendering ---
+
+    def _lines(self, show_columns=True):
+        if self.kind not in _RENDERERS:
+            # importing the report modules registers their renderers
+            import jcds.eda.reports  # noqa: F401
+            import jcds.reports  # noqa: F401
+        return _RENDERERS[self.kind](self, show_columns)
+
+    def render(self, show_columns=True):
+        """
+        Return the report text, as the report function prints it.
+
+        Parameters
+        ----------
+        show_columns : bool, optional
+            Whether to list the columns behind each count. Default is True.
+
+        Returns
+        -------
+        str
+        """
+        return "\n".join(
+            item.to_string() if isinstance(item, pd.DataFrame) else item
+            for item in self._lines(show_columns)
+        )
+
+    def show(self, show_columns=True):
+        """
+        Print the report; tables are shown with IPython's `display`.
+
+        Parameters
+        ----------
+        show_columns : bool, optional
+            Whether to list the columns behind each count. Default is True.
+        """
+        from IPython.display import display
+
+        text = []
+        for item in self._lines(show_columns):
+            if isinstance(item, pd.DataFrame):
+                if text:
+                    print("\n".join(text))
+                    text = []
+                display(item)
+            else:
+                text.append(item)
+        if text:
+            print("\n".join(text))
+
+    # --- comparison ---
+
+    def diff(self, other):
+        """
+        Compare the summary metrics with another profile.
+
+        Parameters
+        ----------
+        other : DataProfile
+
+        Returns
+        -------
+        dict
+            Maps each summary key whose value differs to a
+            ``(self_value, other_value)`` tuple. Missing keys compare as None.
+        """
+        mine, theirs = self.to_dict()["summary"], other.to_dict()["summary"]
+        return {
+            key: (mine.get(key), theirs.get(key))
+            for key in list(mine) + [k for k in theirs if k not in mine]
+            if mine.get(key) != theirs.get(key)
+        }
+
+    # --- serialization ---
+
+    def to_dict(self):
+        """
+        Return the profile as a dict of plain JSON types.
+
+        Tables are stored in pandas' "split" layout (columns, index, data).
+        """
+        return {
+            "kind": self.kind,
+            "summary": _jsonable(self.summary),
+            "tables": {
+                name: json.loads(table.to_json(orient="split", default_handler=str))
+                for name, table in self.tables.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a profile from the output of `to_dict`."""
+        tables = {
+            name: pd.DataFrame(
+                split["data"], index=split["index"], columns=split["columns"]
+            )
+            for name, split in data.get("tables", {}).items()
+        }
+        return cls(data["kind"], dict(data.get("summary", {})), tables)
+
+    def to_json(self, path=None, indent=None):
+        """
+        Serialize the profile to JSON.
+
+        Parameters
+        ----------
+        path : str or Path, optional
+            If given, write the JSON to this file and return None.
+        indent : int, optional
+            Indentation passed to `json.dumps`. Default is compact output.
+
+        Returns
+        -------
+        str or None
+        """
+        text = json.dumps(self.to_dict(), indent=indent)
+        if path is None:
+            return text
+        Path(path).write_text(text, encoding="utf-8")
+
+    @classmethod
+    def from_json(cls, source):
+        """
+        Load a profile from a JSON string or a path to a JSON file.
+        """
+        if isinstance(source, Path) or (
+            isinstance(source, str) and not source.lstrip().startswith("{")
+        ):
+            source = Path(source).read_text(encoding="utf-8")
+        return cls.from_dict(json.loads(source))
+
+    def to_frame(self):
+        """
+        Return the profile as a one-row DataFrame.
+
+        Scalar metrics become typed columns so stored profiles can be queried
+        and compared directly; lists, dicts and tables are JSON-encoded.
+        Frames of several profiles can be concatenated and written together.
+
+        Returns
+        -------
+        pd.DataFrame
+        """
+        data = self.to_dict()
+        row = {"kind": data["kind"]}
+        for key, value in data["summary"].items():
+            row[key] = value if _is_scalar_metric(value) else json.dumps(value)
+        for name, table in data["tables"].items():
+            row[f"table:{name}"] = json.dumps(table)
+        return pd.DataFrame([row])
+
+    @classmethod
+    def from_frame(cls, frame):
+        """
+        Rebuild profiles from the rows of a frame built by `to_frame`.
+
+        Returns
+        -------
+        list of DataProfile
+        """
+        profiles = []
+        for record in frame.to_dict(orient="records"):
+            kind = record.pop("kind")
+            summary, tables = {}, {}
+            for key, value in record.items():
+                if isinstance(value, np.generic):
+                    value = value.item()
+                if isinstance(value, float) and np.isnan(value):
+                    # columns missing from this row after concatenation
+                    continue
+                if key.startswith("table:"):
+                    tables[key[len("table:") :]] = json.loads(value)
+                else:
+                    summary[key] = json.loads(value) if isinstance(value, str) else value
+            profiles.append(cls.from_dict({"kind": kind, "summary": summary, "tables": tables}))
+        return profiles
+
+    def to_parquet(self, path):
+        """
+        Write the profile to a Parquet file as one row (see `to_frame`).
+
+        Parameters
+        ----------
+        path : str or Path
+        """
+        self.to_frame().to_parquet(path, index=False)
+
+    @classmethod
+    def read_parquet(cls, path):
+        """
+        Load a profile written by `to_parquet`.
+
+        Use `from_frame(pd.read_parquet(path))` for files holding several
+        profiles.
+        """
+        profiles = cls.from_frame(pd.read_parquet(path))
+        if len(profiles) != 1:
+            raise ValueError(
+                f"Expected one profile in {path}, found {len(profiles)}; use from_frame."
+            )
+        return profiles[0]
@@ -1,8 +1,243 @@
+import warnings
+
+import numpy as np
 import pandas as pd
+from pandas.tseries.api import guess_datetime_format
 from typing import Union, List
 
 
-def create_dt_col(dataframe, datetime_col, col_type="month"):
+# Candidate formats tried, in order, when sniffing datetime strings.
+# Month-first comes before day-first, matching pandas' default.
+DATETIME_FORMATS = (
+    "%Y-%m-%d",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M:%S%z",
+    "%Y-%m-%d %H:%M",
+    "%Y/%m/%d",
+    "%m/%d/%Y",
+    "%m/%d/%Y %H:%M",
+    "%m/%d/%Y %H:%M:%S",
+    "%d/%m/%Y",
+    "%d/%m/%Y %H:%M",
+    "%d-%m-%Y",
+    "%d.%m.%Y",
+    "%Y%m%d",
+    "%d %b %Y",
+    "%d-%b-%Y",
+    "%b %d, %Y",
+    "%B %d, %Y",
+)
+
+# key in DataFrame.attrs holding the formats found per column
+FORMAT_ATTR = "datetime_formats"
+
+
+def infer_datetime_format(
+    series, sample_size=1000, threshold=0.8, formats=None, random_state=0
+):
+    """
+    Find a datetime format that parses most values of a string column.
+
+    A random sample of the column's values is parsed with each candidate
+    format in one vectorized `pd.to_datetime` call. The format guessed by
+    pandas from the first sampled string is tried first, then `formats`.
+
+    Parameters
+    ----------
+    series : pd.Series
+        The column to test.
+    sample_size : int, optional
+        Number of rows to sample; nulls among them are ignored. Default is 1000.
+    threshold : float, optional
+        Minimum share of sampled values a format must parse. Default is 0.8.
+    formats : sequence of str, optional
+        Candidate formats. Default is `DATETIME_FORMATS`.
+    random_state : int, optional
+        Seed for the sample. Default is 0.
+
+    Returns
+    -------
+    str or None
+        The format parsing the largest share of the sample, or None if no
+        candidate reaches `threshold`.
+    """
+    values = series
+    if len(values) > sample_size:
+        # sample rows before dropping nulls so the column is never fully scanned
+        rng = np.random.default_rng(random_state)
+        values = values.iloc[np.sort(rng.choice(len(values), sample_size, replace=False))]
+    values = values.dropna()
+    if not len(values):
+        return None
+    # only strings can be datetime strings; anything else counts as a miss
+    strings = values[[isinstance(value, str) for value in values]]
+    if not len(strings):
+        return None
+
+    candidates = list(formats if formats is not None else DATETIME_FORMATS)
+    with warnings.catch_warnings():
+        # pandas warns when its guess is day-first; candidates cover both orders
+        warnings.simplefilter("ignore", UserWarning)
+        guessed = guess_datetime_format(strings.iloc[0])
+    if guessed is not None and guessed not in candidates:
+        candidates.insert(0, guessed)
+
+    best, best_ratio = None, threshold
+    for fmt in candidates:
+        parsed = pd.to_datetime(strings, format=fmt, errors="coerce", utc=True)
+        ratio = parsed.notna().sum() / len(values)
+        if ratio >= best_ratio and (best is None or ratio > best_ratio):
+            best, best_ratio = fmt, ratio
+            if ratio == 1:
+                break
+    return best
+
+
+def cached_datetime_format(dataframe, column):
+    """
+    Return the datetime format recorded for `column`, or None.
+
+    Formats are recorded in ``dataframe.attrs["datetime_formats"]`` by
+    `show_possible_datetime_columns` and `to_datetime(format="infer")`, and
+    travel with copies of the DataFrame.
+    """
+    return dataframe.attrs.get(FORMAT_ATTR, {}).get(column)
+
+
+def _remember_format(dataframe, column, fmt):
+    dataframe.attrs.setdefault(FORMAT_ATTR, {})[column] = fmt
+
+
+def parse_datetime_column(dataframe, column, format=None, errors="raise"):
+    """
+    Parse one column to datetime, reusing a recorded format when possible.
+
+    Parameters
+    ----------
+    dataframe : pd.DataFrame
+    column : str
+    format : str, optional
+        Explicit format, passed to `pd.to_datetime`. None uses the format
+        recorded for the column, if any. "infer" sniffs a format with
+        `infer_datetime_format` first (and records it).
+    errors : {'raise', 'coerce', 'ignore'}, optional
+        Passed to `pd.to_datetime`. Default is 'raise'.
+
+    Returns
+    -------
+    pd.Series
+    """
+    series = dataframe[column]
+    if format not in (None, "infer"):
+        return pd.to_datetime(series, format=format, errors=errors)
+
+    fmt = cached_datetime_format(dataframe, column)
+    if fmt is None and format == "infer":
+        fmt = infer_datetime_format(series)
+        if fmt is not None:
+            _remember_format(dataframe, column, fmt)
+    if fmt is None:
+        return pd.to_datetime(series, errors=errors)
+    try:
+        return pd.to_datetime(series, format=fmt, errors=errors)
+    except (ValueError, TypeError):
+        # the sniffed format only had to match most values
+        return pd.to_datetime(series, errors=errors)
+
+
+DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+# create_dt_cols components: computed once per distinct calendar day, with
+# their output dtypes ('category' is the weekday number as DAY_NAMES codes)
+DATETIME_FEATURES = {
+    "year": (lambda days: days.year, "int16"),
+    "month": (lambda days: days.month, "int8"),
+    "day": (lambda days: days.day, "int8"),
+    "weekday": (lambda days: days.weekday, "int8"),
+    "weekday_name": (lambda days: days.weekday, "category"),
+    "weekofyear": (lambda days: days.isocalendar().week.to_numpy(np.int64), "int8"),
+    "quarter": (lambda days: days.quarter, "int8"),
+    "is_weekend": (lambda days: days.weekday >= 5, "bool"),
+    "dayofyear": (lambda days: days.dayofyear, "int16"),
+    "is_month_start": (lambda days: days.is_month_start, "bool"),
+    "is_month_end": (lambda days: days.is_month_end, "bool"),
+}
+
+
+def _day_codes(series):
+    """
+    Map each timestamp to its calendar day.
+
+    Returns the code of every row into the distinct days, the days as a
+    DatetimeIndex and the mask of missing rows (whose code is meaningless).
+    Timezone-aware values are taken at their local wall time.
+    """
+    if isinstance(series.dtype, pd.DatetimeTZDtype):
+        series = series.dt.tz_localize(None)
+    days = series.to_numpy().astype("datetime64[D]").view(np.int64)
+    missing = np.isnat(days.view("datetime64[D]"))
+    if missing.all():
+        # one placeholder day keeps the broadcast uniform; every row is masked
+        return np.zeros(len(days), dtype=np.intp), pd.DatetimeIndex(["1970-01-01"]), missing
+
+    low = days[~missing].min() if missing.any() else days.min()
+    days[missing] = low
+    high = days.max()
+    if high - low < len(days):
+        # dense range of days: the offset is the code, no hashing needed
+        np.subtract(days, low, out=days)
+        codes, uniques = days, np.arange(low, high + 1)
+    else:
+        codes, uniques = pd.factorize(days)
+    return codes, pd.DatetimeIndex(uniques.astype("datetime64[D]")), missing
+
+
+def _broadcast(values, dtype, codes, missing):
+    """Expand per-day feature values to rows, with missing rows as NA (False for flags)."""
+    values = np.asarray(values).astype(dtype if dtype != "category" else np.int8)
+    out = values.take(codes)
+    if dtype == "category":
+        out[missing] = -1
+        return pd.Categorical.from_codes(out, categories=list(DAY_NAMES))
+    if dtype == "bool":
+        out[missing] = False
+        return out
+    if missing.any():
+        return pd.arrays.IntegerArray(out, missing)
+    return out
+
+
+def _parse_unique(dataframe, datetime_col):
+    """Parse a non-datetime column once per distinct value and broadcast the result."""
+    codes, uniques = pd.factorize(dataframe[datetime_col])
+    strings = [str(value) for value in uniques]
+    has_dash = any("-" in value for value in strings)
+    has_slash = any("/" in value for value in strings)
+
+    if has_dash and has_slash:
+        raise ValueError(
+            f"Inconsistent datetime format detected in column '{datetime_col}'. "
+            "Mix of '-' and '/' found. Please standardize format before applying datetime expansion."
+        )
+
+    frame = pd.DataFrame({datetime_col: uniques})
+    frame.attrs = dataframe.attrs
+    try:
+        parsed = parse_datetime_column(frame, datetime_col, format="infer")
+    except Exception as e:
+        raise ValueError(f"Could not convert '{datetime_col}' to datetime: {e}")
+    fmt = cached_datetime_format(frame, datetime_col)
+    if fmt is not None:
+        _remember_format(dataframe, datetime_col, fmt)
+    return pd.Series(
+        parsed.array.take(codes, allow_fill=True), index=dataframe.index, name=datetime_col
+    )
+
+
+def create_dt_col(dataframe, datetime_col, col_type="month", inplace=False):
     """
     Wrapper for create_dt_cols that creates a single datetime-derived column.
 
@@ -14,20 +249,28 @@ def create_dt_col(dataframe, datetime_col, col_type="month"):
         Name of the column containing datetime values.
     col_type : str
         A single datetime component to extract.
+    inplace : bool, default False
+        If True, add the column to `dataframe` instead of a copy.
 
     Returns
     -------
-    DataFrame
-        A copy of the DataFrame with one new datetime feature column added.
+    DataFrame or None
+        A new DataFrame (a shallow copy) with one new datetime feature
+        column added, or None if `inplace=True`.
 
     """
-    return create_dt_cols(dataframe, datetime_col, [col_type])
+    return create_dt_cols(dataframe, datetime_col, [col_type], inplace=inplace)
 
 
-def create_dt_cols(dataframe, datetime_col, col_types=["month"]):
+def create_dt_cols(dataframe, datetime_col, col_types=["month"], inplace=False):
     """
     Add one or more datetime-derived columns to a DataFrame from a single datetime column.
 
+    Every component depends only on the calendar day, so each is computed
+    once per distinct day and broadcast back to the rows by day codes. A
+    column that is not yet datetime is likewise parsed once per distinct
+    value.
+
     Parameters
     ----------
     dataframe : DataFrame
@@ -38,11 +281,20 @@ def create_dt_cols(dataframe, datetime_col, col_types=["month"]):
         One or more datetime components to extract. Supported values:
         "year", "month", "day", "weekday", "weekday_name", "weekofyear",
         "quarter", "is_weekend", "dayofyear", "is_month_start", "is_month_end".
+    inplace : bool, default False
+        If True, add the columns to `dataframe` itself (and replace a parsed
+        `datetime_col`) instead of to a new frame.
 
     Returns
     -------
-    DataFrame
-        A copy of the DataFrame with the new datetime feature columns added.
+    DataFrame or None
+        A new DataFrame with the new datetime feature columns added, or None
+        if `inplace=True`. The new frame shares the data of the unchanged
+        columns with `dataframe` (a shallow copy), which itself is not
+        modified. Numeric components are int8 ("year" and
+        "dayofyear" int16; nullable "Int8"/"Int16" when the column has
+        missing values), flags are bool and "weekday_name" is a categorical
+        with the days in weekday order.
 
     Raises
     ------
@@ -50,53 +302,30 @@ def create_dt_cols(dataframe, datetime_col, col_types=["month"]):
         If the datetime_col is missing or if any component in col_types is unsupported.
 
     """
-    supported_types = {
-        "year": lambda x: x.dt.year,
-        "month": lambda x: x.dt.month,
-        "day": lambda x: x.dt.day,
-        "weekday": lambda x: x.dt.weekday,
-        "weekday_name": lambda x: x.dt.day_name(),
-        "weekofyear": lambda x: x.dt.isocalendar().week,
-        "quarter": lambda x: x.dt.quarter,
-        "is_weekend": lambda x: x.dt.weekday >= 5,
-        "dayofyear": lambda x: x.dt.dayofyear,
-        "is_month_start": lambda x: x.dt.is_month_start,
-        "is_month_end": lambda x: x.dt.is_month_end,
-    }
-
     if datetime_col not in dataframe.columns:
         raise ValueError(f"Column '{datetime_col}' not found in DataFrame.")
 
     if isinstance(col_types, str):
         col_types = [col_types]
 
-    unsupported = [ct for ct in col_types if ct not in supported_types]
+    unsupported = [ct for ct in col_types if ct not in DATETIME_FEATURES]
     if unsupported:
         raise ValueError(
-            f"Unsupported col_type(s): {unsupported}. Must be one of: {list(supported_types)}"
+            f"Unsupported col_type(s): {unsupported}. Must be one of: {list(DATETIME_FEATURES)}"
         )
 
-    dataframe = dataframe.copy()
-
-    if not pd.api.types.is_datetime64_any_dtype(dataframe[datetime_col]):
-        # Check for consistent format
-        sample = dataframe[datetime_col].dropna().astype(str)
-        has_dash = sample.str.contains("-").any()
-        has_slash = sample.str.contains("/").any()
-
-        if has_dash and has_slash:
-            raise ValueError(
-                f"Inconsistent datetime format detected in column '{datetime_col}'. "
-                "Mix of '-' and '/' found. Please standardize format before applying datetime expansion."
-            )
+    # only whole columns are added or replaced, so a shallow copy leaves the
+    # caller's frame untouched without copying its data
+    result = dataframe if inplace else dataframe.copy(deep=False)
 
-        try:
-            dataframe[datetime_col] = pd.to_datetime(dataframe[datetime_col])
-        except Exception as e:
-            raise ValueError(f"Could not convert '{datetime_col}' to datetime: {e}")
+    if not pd.api.types.is_datetime64_any_dtype(result[datetime_col]):
+        result[datetime_col] = _parse_unique(result, datetime_col)
 
+    codes, days, missing = _day_codes(result[datetime_col])
     for col_type in col_types:
-        new_col = f"{datetime_col}_{col_type}"
-        dataframe[new_col] = supported_types[col_type](dataframe[datetime_col])
+        feature, dtype = DATETIME_FEATURES[col_type]
+        values = _broadcast(feature(days), dtype, codes, missing)
+        result[f"{datetime_col}_{col_type}"] = pd.Series(values, index=result.index)
 
-    return dataframe
+    if not inplace:
+        return result
@@ -0,0 +1,176 @@
+import numpy as np
+import pandas as pd
+
+from jcds.eda.cache import cached
+from jcds.eda.profile import iter_file_chunks
+
+
+def hash_rows(dataframe):
+    """
+    Return a 64-bit hash of every row of a DataFrame.
+
+    Equal rows always hash equal; different rows collide with negligible
+    probability. The index is not part of the hash.
+
+    Parameters
+    ----------
+    dataframe : pd.DataFrame
+
+    Returns
+    -------
+    numpy.ndarray of uint64
+    """
+    return pd.util.hash_pandas_object(dataframe, index=False).to_numpy()
+
+
+def _exact_duplicates(rows, return_groups):
+    """
+    Mark exact duplicates among candidate rows and optionally group them.
+
+    Returns a boolean array flagging rows that repeat an earlier row, and an
+    array of group ids (-1 for rows without a duplicate) or None.
+    """
+    dupes = rows.duplicated().to_numpy()
+    if not return_groups:
+        return dupes, None
+
+    keys = [rows.iloc[:, i] for i in range(rows.shape[1])]
+    groups = rows.groupby(keys, dropna=False, sort=False).ngroup().to_numpy()
+    sizes = np.bincount(groups)
+    groups = np.where(sizes[groups] > 1, groups, -1)
+    in_group = groups >= 0
+    groups[in_group] = pd.factorize(groups[in_group])[0]
+    return dupes, groups
+
+
+def _find_duplicates(hashes, fetch_rows, verify, return_groups):
+    """
+    Shared core of `show_dupes` and `show_file_dupes`.
+
+    Only rows whose hash occurs more than once are candidates. With `verify`,
+    `fetch_rows(positions)` must return those rows, in order, for the exact
+    comparison; the full data is never compared.
+    """
+    candidates = np.flatnonzero(pd.Series(hashes).duplicated(keep=False).to_numpy())
+
+    if not len(candidates):
+        dupes = np.zeros(0, dtype=bool)
+        groups = np.zeros(0, dtype=np.int64)
+    elif verify:
+        dupes, groups = _exact_duplicates(fetch_rows(candidates), return_groups)
+    else:
+        keys = pd.Series(hashes[candidates])
+        dupes = keys.duplicated().to_numpy()
+        groups = pd.factorize(keys)[0] if return_groups else None
+
+    if not return_groups:
+        return int(dupes.sum())
+    group_ids = np.full(len(hashes), -1, dtype=np.int64)
+    group_ids[candidates] = groups
+    return group_ids
+
+
+@cached
+def show_dupes(dataframe, verify=True, return_groups=False):
+    """
+    Return the number of duplicate rows in the given DataFrame.
+
+    Rows are hashed with `pd.util.hash_pandas_object` and only rows whose hash
+    occurs more than once are compared exactly, which is much lighter than
+    `DataFrame.duplicated()` on wide frames with object columns.
+
+    Parameters
+    ----------
+    dataframe : pd.DataFrame
+        The input pandas DataFrame.
+    verify : bool, optional
+        If True (default), confirm hash matches by comparing the candidate
+        rows. If False, trust the 64-bit hashes.
+    return_groups : bool, optional
+        If True, return duplicate group ids instead of the count.
+        Default is False.
+
+    Returns
+    -------
+    int or pd.Series
+        The count of duplicated rows in the DataFrame (rows repeating an
+        earlier row, as `DataFrame.duplicated()` counts them). With
+        `return_groups=True`, a Series aligned to the index giving every
+        row the id of its duplicate group, or -1 if the row is unique.
+
+    """
+    hashes = hash_rows(dataframe)
+    result = _find_duplicates(
+        hashes,
+        lambda positions: dataframe.iloc[positions],
+        verify,
+        return_groups,
+    )
+    if return_groups:
+        return pd.Series(result, index=dataframe.index, name="dupe_group")
+    return result
+
+
+@cached
+def show_file_dupes(
+    filepath,
+    chunksize=100_000,
+    file_type=None,
+    verify=True,
+    return_groups=False,
+    **kwargs,
+):
+    """
+    Count duplicate rows of a CSV or Parquet file without loading it whole.
+
+    The file is streamed once to hash every row, keeping only 8 bytes per
+    row. If any hashes repeat and `verify` is True, it is streamed a second
+    time to collect just the candidate rows for the exact comparison.
+
+    Parameters
+    ----------
+    filepath : str or Path
+        Path to a CSV or Parquet file.
+    chunksize : int, optional
+        Number of rows per chunk. Default is 100,000.
+    file_type : {'csv', 'parquet'} or None, optional
+        File format. If None, inferred from the file extension.
+    verify : bool, optional
+        If True (default), confirm hash matches by comparing candidate rows.
+    return_groups : bool, optional
+        If True, return duplicate group ids instead of the count.
+        Default is False.
+    **kwargs
+        Additional keyword arguments passed to `pd.read_csv` (CSV only).
+        CSV values are read as text by default (``dtype=str``) so that a
+        column parsed differently in two chunks still hashes consistently.
+
+    Returns
+    -------
+    int or pd.Series
+        The count of duplicated rows, or with `return_groups=True` a Series
+        of group ids (-1 for unique rows) indexed by row position.
+    """
+    kwargs.setdefault("dtype", str)
+
+    def chunks():
+        return iter_file_chunks(filepath, chunksize=chunksize, file_type=file_type, **kwargs)
+
+    hashes = [hash_rows(chunk) for chunk in chunks()]
+    hashes = np.concatenate(hashes) if hashes else np.zeros(0, dtype=np.uint64)
+
+    def fetch_rows(positions):
+        parts = []
+        start = 0
+        for chunk in chunks():
+            stop = start + len(chunk)
+            lo, hi = np.searchsorted(positions, [start, stop])
+            if hi > lo:
+                parts.append(chunk.iloc[positions[lo:hi] - start])
+            start = stop
+        return pd.concat(parts, ignore_index=True)
+
+    result = _find_duplicates(hashes, fetch_rows, verify, return_groups)
+    if return_groups:
+        return pd.Series(result, name="dupe_group")
+    return result
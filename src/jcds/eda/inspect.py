@@ -1,8 +1,41 @@
+from functools import partial
+
 import pandas as pd
 import pandas.api.types as ptypes
 
+from jcds.eda.profile import (
+    DTYPE_CLASSES,
+    dtype_class,
+    is_single_type,
+    python_type_counts,
+)
+from jcds.eda.cache import cached
+from jcds.eda.datetime import _remember_format, infer_datetime_format
+from jcds.eda.duplicates import show_dupes  # noqa: F401 (moved, kept importable)
+from jcds.eda.parallel import map_columns
+from jcds.eda.sketches import approx_nunique
+
 # from IPython.display import Markdown, display
 
+
+def _require_stat(profile, stat, func_name):
+    """
+    Raise if `profile` lacks a statistic `func_name` reads from it.
+
+    Profiles built from a Parquet footer (`profile_parquet_metadata`) have no
+    value counts (`nunique` is None) and usually no row-level null counts.
+    """
+    if stat in ("rows_any_na", "rows_all_na"):
+        missing = getattr(profile, stat) is None
+    else:
+        missing = any(getattr(stats, stat) is None for stats in profile)
+    if missing:
+        raise ValueError(
+            f"{func_name}() needs '{stat}', which this profile does not have "
+            "(e.g. one from profile_parquet_metadata). Build the profile with "
+            "profile_dataframe or profile_file instead."
+        )
+
 # def eda_guide_markdown():
 #     md_text = """
 # # 🧭 EDA Guide Overview
@@ -49,17 +82,66 @@ import pandas.api.types as ptypes
 # Visualizations
 
 
-def show_memory_use(dataframe):
+# rows checked by `show_binary_list` before hashing a whole column
+BINARY_PROBE_ROWS = 1000
+
+
+# Per-column workers for `map_columns`. They are module-level functions so
+# that they can be sent to a process pool.
+
+
+def _nunique(series, dropna=True, approx=False, error=0.01):
+    if approx:
+        return approx_nunique(series, error=error, dropna=dropna)
+    return series.nunique(dropna=dropna)
+
+
+def _top_share(series):
+    return series.value_counts(normalize=True, dropna=False).values[0]
+
+
+def _binary_kind(series):
+    # more than two values in the first rows rules the column out without hashing all of it
+    if series.iloc[:BINARY_PROBE_ROWS].nunique() > 2:
+        return None
+    unique_vals = series.unique()
+    unique_vals_no_nan = pd.Series(unique_vals).dropna().unique()
+    if len(unique_vals_no_nan) != 2:
+        return None
+    if pd.isna(unique_vals).any():
+        return "binary_with_nan"
+    return "binary_columns"
+
+
+def _mixed_type_counts(series, sample=None):
+    if is_single_type(series, sample=sample):
+        return {}
+    return python_type_counts(series, sample=sample)
+
+
+def _unique_summary(series, n_modes=2, dropna=False):
+    vcount = series.value_counts(dropna=dropna)
+    return {
+        "unique_count": series.nunique(dropna=dropna),
+        "top_modes": list(vcount.head(n_modes).items()),
+    }
+
+
+@cached
+def show_memory_use(dataframe, profile=None):
     """
     Returns memory usage of the dataframe in megabytes (MB)
     """
-    memory_usage = dataframe.memory_usage(deep=True).sum()
+    if profile is not None:
+        memory_usage = profile.memory_bytes
+    else:
+        memory_usage = dataframe.memory_usage(deep=True).sum()
     # convert from bytes to megabytes
     memory_usage = memory_usage / 1024**2
     return float(memory_usage)
 
 
-def show_shape(dataframe):
+def show_shape(dataframe, profile=None):
     """
     Return the shape (number of rows and columns) of the given DataFrame.
 
@@ -67,6 +149,9 @@ def show_shape(dataframe):
     ----------
     dataframe : pd.DataFrame
         The input pandas DataFrame.
+    profile : FrameProfile, optional
+        Precomputed profile from `profile_dataframe`. If given, statistics are
+        read from it instead of rescanning `dataframe`.
 
     Returns
     -------
@@ -74,10 +159,13 @@ def show_shape(dataframe):
         A tuple containing the number of rows and columns in the DataFrame.
 
     """
+    if profile is not None:
+        return profile.n_rows, profile.n_cols
     return dataframe.shape
 
 
-def show_dimensions(dataframe):
+@cached
+def show_dimensions(dataframe, profile=None):
     """
     Return structural and memory usage information for the DataFrame.
 
@@ -85,6 +173,9 @@ def show_dimensions(dataframe):
     ----------
     dataframe : pd.DataFrame
         The input pandas DataFrame.
+    profile : FrameProfile, optional
+        Precomputed profile from `profile_dataframe`. If given, statistics are
+        read from it instead of rescanning `dataframe`.
 
     Returns
     -------
@@ -95,33 +186,19 @@ def show_dimensions(dataframe):
         - size (int): Total number of data cells (rows × columns)
         - memory_use (float): Approximate memory usage in megabytes (MB)
     """
-    rows, cols = dataframe.shape
-    size = dataframe.size
-    memory_use = dataframe.memory_usage(deep=True).sum()
+    if profile is not None:
+        rows, cols = profile.n_rows, profile.n_cols
+        size = profile.size
+        memory_use = profile.memory_bytes
+    else:
+        rows, cols = dataframe.shape
+        size = dataframe.size
+        memory_use = dataframe.memory_usage(deep=True).sum()
     # convert from bytes to megabytes, round to 2 dec places
     memory_use = round((memory_use / 1024**2), 2)
     return rows, cols, size, memory_use
 
 
-def show_dupes(dataframe):
-    """
-    Return the number of duplicate rows in the given DataFrame.
-
-    Parameters
-    ----------
-    dataframe : pd.DataFrame
-        The input pandas DataFrame.
-
-    Returns
-    -------
-    int
-        The count of duplicated rows in the DataFrame.
-
-    """
-    dupes = dataframe.duplicated()
-    return dupes.sum()
-
-
 def show_catvar(dataframe):
     """
     Identify and return a list of categorical variables in the DataFrame.
@@ -137,7 +214,7 @@ def show_catvar(dataframe):
         A list of column names that have categorical or object data types.
 
     """
-    cat_features = dataframe.select_dtypes(
+    cat_features = dataframe.iloc[:0].select_dtypes(
         include=["category", "object"]
     ).columns.tolist()
     return cat_features
@@ -159,13 +236,17 @@ def show_convar(dataframe):
 
     """
 
-    cont_features = dataframe.select_dtypes(
+    # select on an empty slice: only the dtypes matter, not a copy of the data
+    cont_features = dataframe.iloc[:0].select_dtypes(
         exclude=["category", "object", "datetimetz", "datetime64"]
     ).columns.tolist()
     return cont_features
 
 
-def show_lowcardvars(dataframe, max_unique=10, verbose=False):
+@cached
+def show_lowcardvars(
+    dataframe, max_unique=10, verbose=False, profile=None, approx=False, error=0.01
+):
     """
     Return a list of categorical variables with unique values less than or equal to the specified threshold.
 
@@ -177,6 +258,16 @@ def show_lowcardvars(dataframe, max_unique=10, verbose=False):
         The maximum number of unique values allowed for a variable to be considered low cardinality. Default is 10.
     verbose : bool, optional
         Whether to print a summary message (default is False).
+    profile : FrameProfile, optional
+        Precomputed profile from `profile_dataframe`. If given, statistics are
+        read from it instead of rescanning `dataframe`.
+    approx : bool, optional
+        If True, estimate distinct counts with a HyperLogLog sketch instead of
+        an exact `nunique()`, trading a small error for near-constant memory.
+        Default is False.
+    error : float, optional
+        Target relative error of the sketch when `approx=True`. Default is 0.01.
+
     Returns
     -------
     list of tuple
@@ -187,14 +278,21 @@ def show_lowcardvars(dataframe, max_unique=10, verbose=False):
         print(f"Categorical variables with cardinality <= {max_unique}")
     col_list = []
     cols = show_catvar(dataframe)
-    for col in cols:
-        count = dataframe[col].nunique()
+    if profile is not None:
+        _require_stat(profile, "nunique", "show_lowcardvars")
+        counts = [profile[col].nunique for col in cols]
+    else:
+        counts = map_columns(
+            partial(_nunique, approx=approx, error=error), dataframe, cols
+        )
+    for col, count in zip(cols, counts):
         if count <= max_unique:
             col_list.append((col, count))
     return col_list
 
 
-def show_constantvars(dataframe, verbose=False):
+@cached
+def show_constantvars(dataframe, verbose=False, profile=None, approx=False, error=0.01):
     """
     Identify columns with only one unique value (including NaNs).
 
@@ -203,6 +301,15 @@ def show_constantvars(dataframe, verbose=False):
     dataframe : pd.DataFrame
     verbose : bool, optional
         Whether to print a summary message (default is False).
+    profile : FrameProfile, optional
+        Precomputed profile from `profile_dataframe`. If given, statistics are
+        read from it instead of rescanning `dataframe`.
+    approx : bool, optional
+        If True, estimate distinct counts with a HyperLogLog sketch instead of
+        an exact `nunique()`, trading a small error for near-constant memory.
+        Default is False.
+    error : float, optional
+        Target relative error of the sketch when `approx=True`. Default is 0.01.
     Returns
     -------
     list of str
@@ -210,14 +317,18 @@ def show_constantvars(dataframe, verbose=False):
     """
     if verbose:
         print("Columns (only one unique value)")
-    col_list = []
-    for col in dataframe.columns:
-        if dataframe[col].nunique(dropna=False) == 1:
-            col_list.append(col)
-    return col_list
+    if profile is not None:
+        _require_stat(profile, "nunique_with_na", "show_constantvars")
+        return [stats.name for stats in profile if stats.nunique_with_na == 1]
+
+    counts = map_columns(
+        partial(_nunique, dropna=False, approx=approx, error=error), dataframe
+    )
+    return [col for col, count in zip(dataframe.columns, counts) if count == 1]
 
 
-def show_nearconstvars(dataframe, threshold=0.95, verbose=False):
+@cached
+def show_nearconstvars(dataframe, threshold=0.95, verbose=False, profile=None):
     """
     Finds columns where a single value makes up more than `threshold` proportion of the data.
 
@@ -229,6 +340,9 @@ def show_nearconstvars(dataframe, threshold=0.95, verbose=False):
         The proportion above which a column is considered near-constant (default is 0.95).
     verbose : bool, optional
         Whether to print a summary message (default is False).
+    profile : FrameProfile, optional
+        Precomputed profile from `profile_dataframe`. If given, statistics are
+        read from it instead of rescanning `dataframe`.
 
     Returns
     -------
@@ -238,16 +352,25 @@ def show_nearconstvars(dataframe, threshold=0.95, verbose=False):
     if verbose:
         print(f"Columns with cardinality <= {threshold*100:.1f}% ")
 
-    near_constant = []
-    for col in dataframe.columns:
-        top_freq = dataframe[col].value_counts(normalize=True, dropna=False).values[0]
-        if top_freq >= threshold:
-            near_constant.append(col)
+    if profile is not None:
+        # top values are collected together with the unique counts
+        _require_stat(profile, "nunique", "show_nearconstvars")
+        return [
+            stats.name
+            for stats in profile
+            if stats.top_values and stats.top_values[0][1] / profile.n_rows >= threshold
+        ]
 
-    return near_constant
+    top_freqs = map_columns(_top_share, dataframe)
+    return [
+        col for col, top_freq in zip(dataframe.columns, top_freqs) if top_freq >= threshold
+    ]
 
 
-def show_highcardvars(dataframe, percent_unique=90, verbose=False):
+@cached
+def show_highcardvars(
+    dataframe, percent_unique=90, verbose=False, profile=None, approx=False, error=0.01
+):
     """
     Identify categorical columns with high cardinality (>= percent_unique).
 
@@ -259,6 +382,16 @@ def show_highcardvars(dataframe, percent_unique=90, verbose=False):
         Minimum % of unique values (vs. total rows) to consider high-cardinality.
     verbose : bool, optional
         Whether to print a summary message (default is False).
+    profile : FrameProfile, optional
+        Precomputed profile from `profile_dataframe`. If given, statistics are
+        read from it instead of rescanning `dataframe`.
+    approx : bool, optional
+        If True, estimate distinct counts with a HyperLogLog sketch instead of
+        an exact `nunique()`, trading a small error for near-constant memory.
+        Default is False.
+    error : float, optional
+        Target relative error of the sketch when `approx=True`. Default is 0.01.
+
     Returns
     -------
     list of tuples
@@ -270,17 +403,24 @@ def show_highcardvars(dataframe, percent_unique=90, verbose=False):
         print(f"Cateogrical variables with cardinality >= {percent_unique}%")
 
     col_list = []
-    total_rows = show_shape(dataframe)[0]
+    total_rows = show_shape(dataframe, profile=profile)[0]
     cat_cols = show_catvar(dataframe)
-    for col in cat_cols:
-        count = dataframe[col].nunique()
+    if profile is not None:
+        _require_stat(profile, "nunique", "show_highcardvars")
+        counts = [profile[col].nunique for col in cat_cols]
+    else:
+        counts = map_columns(
+            partial(_nunique, approx=approx, error=error), dataframe, cat_cols
+        )
+    for col, count in zip(cat_cols, counts):
         percent = (count / total_rows) * 100
         if percent >= percent_unique:
             col_list.append((col, percent))
     return col_list
 
 
-def show_binary_list(dataframe, dropna=True):
+@cached
+def show_binary_list(dataframe, dropna=True, profile=None, columns=None):
     """
     Identify binary columns in a DataFrame, optionally considering missing values.
 
@@ -290,6 +430,11 @@ def show_binary_list(dataframe, dropna=True):
         The input pandas DataFrame.
     dropna : bool, optional
         If True, NaN values are excluded when determining binary columns. Default is True.
+    profile : FrameProfile, optional
+        Precomputed profile from `profile_dataframe`. If given, statistics are
+        read from it instead of rescanning `dataframe`.
+    columns : list of str, optional
+        Only check these columns. Default is all columns.
 
     Returns
     -------
@@ -302,20 +447,30 @@ def show_binary_list(dataframe, dropna=True):
 
     binary_cols = []
     binary_with_nan = []
-    for col in dataframe.columns:
-        unique_vals = dataframe[col].unique()
-        unique_vals_no_nan = pd.Series(unique_vals).dropna().unique()
-
-        if len(unique_vals_no_nan) == 2:
-            if pd.isna(unique_vals).any():
-                binary_with_nan.append(col)
-            else:
-                binary_cols.append(col)
+    if profile is not None:
+        _require_stat(profile, "nunique", "show_binary_list")
+        for stats in profile:
+            if columns is not None and stats.name not in columns:
+                continue
+            if stats.nunique == 2:
+                if stats.null_count:
+                    binary_with_nan.append(stats.name)
+                else:
+                    binary_cols.append(stats.name)
+        return {"binary_columns": binary_cols, "binary_with_nan": binary_with_nan}
+
+    cols = dataframe.columns if columns is None else list(columns)
+    for col, kind in zip(cols, map_columns(_binary_kind, dataframe, columns=columns)):
+        if kind == "binary_with_nan":
+            binary_with_nan.append(col)
+        elif kind == "binary_columns":
+            binary_cols.append(col)
 
     return {"binary_columns": binary_cols, "binary_with_nan": binary_with_nan}
 
 
-def count_rows_with_any_na(dataframe):
+@cached
+def count_rows_with_any_na(dataframe, profile=None):
     """
     Count the number of rows in the DataFrame that contain at least one missing (NaN) value.
 
@@ -323,6 +478,9 @@ def count_rows_with_any_na(dataframe):
     ----------
     dataframe : pd.DataFrame
         The input pandas DataFrame.
+    profile : FrameProfile, optional
+        Precomputed profile from `profile_dataframe`. If given, statistics are
+        read from it instead of rescanning `dataframe`.
 
     Returns
     -------
@@ -331,10 +489,15 @@ def count_rows_with_any_na(dataframe):
 
     """
 
+    if profile is not None:
+        _require_stat(profile, "rows_any_na", "count_rows_with_any_na")
+        return profile.rows_any_na
+
     return dataframe.isna().any(axis=1).sum()
 
 
-def count_rows_with_all_na(dataframe):
+@cached
+def count_rows_with_all_na(dataframe, profile=None):
     """
     Count the number of rows in the DataFrame where all values are missing (NaN).
 
@@ -342,6 +505,9 @@ def count_rows_with_all_na(dataframe):
     ----------
     dataframe : pd.DataFrame
         The input pandas DataFrame.
+    profile : FrameProfile, optional
+        Precomputed profile from `profile_dataframe`. If given, statistics are
+        read from it instead of rescanning `dataframe`.
 
     Returns
     -------
@@ -350,10 +516,15 @@ def count_rows_with_all_na(dataframe):
 
     """
 
+    if profile is not None:
+        _require_stat(profile, "rows_all_na", "count_rows_with_all_na")
+        return profile.rows_all_na
+
     return dataframe.isna().all(axis=1).sum()
 
 
-def count_cols_with_any_na(dataframe):
+@cached
+def count_cols_with_any_na(dataframe, profile=None):
     """
     Count the number of columns in the DataFrame that contain at least one missing (NaN) value.
 
@@ -361,6 +532,9 @@ def count_cols_with_any_na(dataframe):
     ----------
     dataframe : pd.DataFrame
         The input pandas DataFrame.
+    profile : FrameProfile, optional
+        Precomputed profile from `profile_dataframe`. If given, statistics are
+        read from it instead of rescanning `dataframe`.
 
     Returns
     -------
@@ -369,10 +543,14 @@ def count_cols_with_any_na(dataframe):
 
     """
 
+    if profile is not None:
+        return sum(stats.null_count > 0 for stats in profile)
+
     return dataframe.isna().any(axis=0).sum()
 
 
-def count_cols_with_all_na(dataframe):
+@cached
+def count_cols_with_all_na(dataframe, profile=None):
     """
     Count the number of columns in the DataFrame where all values are missing (NaN).
 
@@ -380,6 +558,9 @@ def count_cols_with_all_na(dataframe):
     ----------
     dataframe : pd.DataFrame
         The input pandas DataFrame.
+    profile : FrameProfile, optional
+        Precomputed profile from `profile_dataframe`. If given, statistics are
+        read from it instead of rescanning `dataframe`.
 
     Returns
     -------
@@ -388,10 +569,14 @@ def count_cols_with_all_na(dataframe):
 
     """
 
+    if profile is not None:
+        return sum(stats.count == 0 for stats in profile)
+
     return dataframe.isna().all(axis=0).sum()
 
 
-def count_total_na(dataframe):
+@cached
+def count_total_na(dataframe, profile=None):
     """
     Calculate the total number of missing (NaN) values in the entire DataFrame.
 
@@ -399,6 +584,9 @@ def count_total_na(dataframe):
     ----------
     dataframe : pd.DataFrame
         The input pandas DataFrame.
+    profile : FrameProfile, optional
+        Precomputed profile from `profile_dataframe`. If given, statistics are
+        read from it instead of rescanning `dataframe`.
 
     Returns
     -------
@@ -407,10 +595,16 @@ def count_total_na(dataframe):
 
     """
 
+    if profile is not None:
+        return profile.total_na
+
     return dataframe.isna().sum().sum()
 
 
-def count_unique_values(dataframe, columns, n_modes=2, dropna=False, ascending=False):
+@cached
+def count_unique_values(
+    dataframe, columns, n_modes=2, dropna=False, ascending=False, profile=None
+):
     """
     For each specified column, report:
       - unique_count: total unique entries (incl. NaN if dropna=False)
@@ -425,6 +619,9 @@ def count_unique_values(dataframe, columns, n_modes=2, dropna=False, ascending=F
         How many top values (modes) to return per column. Default is 2.
     dropna : bool, optional
         Whether to exclude NaNs from counts and mode ranking. Default is False.
+    profile : FrameProfile, optional
+        Precomputed profile from `profile_dataframe`. If given, statistics are
+        read from it instead of rescanning `dataframe`.
 
     Returns
     -------
@@ -442,11 +639,20 @@ def count_unique_values(dataframe, columns, n_modes=2, dropna=False, ascending=F
     for col in cols:
         if col not in dataframe.columns:
             raise KeyError(f"Column not found: {col}")
-        ucount = dataframe[col].nunique(dropna=dropna)
-        vcount = dataframe[col].value_counts(dropna=dropna)
-        top_modes = list(vcount.head(n_modes).items())
-        result[col] = {"unique_count": ucount, "top_modes": top_modes}
-    return result
+        if profile is not None:
+            stats = profile[col]
+            top_modes = stats.top_modes(n_modes, dropna=dropna)
+            if top_modes is not None:
+                ucount = stats.nunique if dropna else stats.nunique_with_na
+                result[col] = {"unique_count": ucount, "top_modes": top_modes}
+
+    # columns the profile could not answer are scanned
+    remaining = [col for col in cols if col not in result]
+    summaries = map_columns(
+        partial(_unique_summary, n_modes=n_modes, dropna=dropna), dataframe, remaining
+    )
+    result.update(zip(remaining, summaries))
+    return {col: result[col] for col in cols}
 
 
 def show_datetime_columns(dataframe):
@@ -471,56 +677,128 @@ def show_datetime_columns(dataframe):
     return dt_cols
 
 
-def show_possible_datetime_columns(dataframe, sample_size=5):
+@cached
+def _possible_datetime_formats(dataframe, sample_size, profile, threshold):
+    """Sniff a datetime format for each object column; {column: format}."""
+    formats = {}
+    for col in dataframe.select_dtypes(include="object").columns:
+        if profile is not None and not len(dataframe):
+            values = pd.Series(profile[col].sample_values, dtype="object")
+        else:
+            values = dataframe[col]
+        fmt = infer_datetime_format(values, sample_size=sample_size, threshold=threshold)
+        if fmt is not None:
+            formats[col] = fmt
+    return formats
+
+
+def show_possible_datetime_columns(
+    dataframe, sample_size=1000, profile=None, threshold=0.8, return_formats=False
+):
     """
     Identify object columns that may contain datetime-like strings.
 
+    A random sample of each object column is parsed against a small set of
+    candidate formats (see `infer_datetime_format`). The winning format is
+    recorded in ``dataframe.attrs["datetime_formats"]`` so that
+    `convert_to_datetime` and `create_dt_cols` can parse the whole column
+    with it instead of inferring the format value by value.
+
     Parameters
     ----------
     dataframe : pd.DataFrame
         The input DataFrame.
     sample_size : int
-        Number of values to sample for date parsing test.
+        Number of values to sample for date parsing test. Default is 1000.
+    profile : FrameProfile, optional
+        Precomputed profile from `profile_dataframe`. Only used when
+        `dataframe` holds no rows (a streamed file's schema), in which case
+        the sample values stored in the profile are tested.
+    threshold : float, optional
+        Share of sampled values that must parse as dates. Default is 0.8.
+    return_formats : bool, optional
+        If True, return a dict mapping each column to its format.
+        Default is False.
 
     Returns
     -------
-    list of str
-        Columns that appear to contain datetime-like strings.
+    list of str or dict
+        Columns that appear to contain datetime-like strings, or, with
+        `return_formats=True`, a dict of column name to format string.
     """
-    possible_date_cols = []
+    # the sniffing is cached; recording the formats must happen on every call
+    formats = _possible_datetime_formats(dataframe, sample_size, profile, threshold)
+    for col, fmt in formats.items():
+        _remember_format(dataframe, col, fmt)
 
-    for col in dataframe.select_dtypes(include="object").columns:
-        sample_values = dataframe[col].dropna().head(sample_size)
-        parse_attempts = sample_values.apply(
-            lambda x: pd.to_datetime(x, errors="coerce", utc=True)
-        )
-        success_ratio = parse_attempts.notna().mean()
-        if success_ratio >= 0.8:  # 80% of values parse as dates
-            possible_date_cols.append(col)
+    if return_formats:
+        return formats
+    return list(formats)
+
+
+@cached
+def show_mixed_type_columns(df, profile=None, sample=None, return_counts=False):
+    """
+    Identify columns whose non-null values are of more than one Python type.
 
-    return possible_date_cols
+    Only object and categorical columns can hold mixed types, so other dtypes
+    are skipped without looking at their values. Object columns are first
+    checked with `pandas.api.types.infer_dtype` and only counted value by
+    value when that check cannot rule out a mix.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The input DataFrame.
+    profile : FrameProfile, optional
+        Precomputed profile from `profile_dataframe`. If given, statistics are
+        read from it instead of rescanning `df`.
+    sample : int, optional
+        If given, check at most this many randomly chosen non-null values per
+        object column. Faster on very large columns, but a rare second type
+        can be missed. Ignored when `profile` is given. Default is None.
+    return_counts : bool, optional
+        If True, return the type histogram of each mixed column instead of
+        just its name. Default is False.
 
+    Returns
+    -------
+    list of str or dict
+        Column names holding mixed Python types, or, with `return_counts=True`,
+        a dict mapping those names to ``{type name: count}``.
+    """
+    if profile is not None:
+        type_counts = {stats.name: stats.type_counts for stats in profile}
+    else:
+        counts = map_columns(partial(_mixed_type_counts, sample=sample), df)
+        type_counts = dict(zip(df.columns, counts))
 
-def show_mixed_type_columns(df):
-    mixed_cols = []
-    for col in df.columns:
-        types = df[col].dropna().map(lambda x: type(x).__name__).nunique()
-        if types > 1:
-            mixed_cols.append(col)
-    return mixed_cols
+    mixed = {col: dict(counts) for col, counts in type_counts.items() if len(counts) > 1}
+    if return_counts:
+        return mixed
+    return list(mixed)
 
 
-def count_id_like_columns(dataframe, threshold=0.95):
+@cached
+def count_id_like_columns(
+    dataframe, threshold=0.95, profile=None, approx=False, error=0.01
+):
     """
     Count number of columns with high uniqueness (e.g., IDs).
+
+    With `approx=True` each column's distinct count is estimated with a
+    HyperLogLog sketch of relative error `error` instead of `nunique()`.
     """
-    total_rows = show_shape(dataframe)[0]
-    return sum(
-        dataframe[col].nunique() / total_rows >= threshold for col in dataframe.columns
-    )
+    total_rows = show_shape(dataframe, profile=profile)[0]
+    if profile is not None:
+        _require_stat(profile, "nunique", "count_id_like_columns")
+        return sum(stats.nunique / total_rows >= threshold for stats in profile)
+    counts = map_columns(partial(_nunique, approx=approx, error=error), dataframe)
+    return sum(count / total_rows >= threshold for count in counts)
 
 
-def get_dtype_summary(dataframe):
+@cached
+def get_dtype_summary(dataframe, profile=None):
     """
     Returns a dictionary summarizing the count of common data types.
 
@@ -528,44 +806,30 @@ def get_dtype_summary(dataframe):
     ----------
     dataframe : pd.DataFrame
         The input DataFrame.
+    profile : FrameProfile, optional
+        Precomputed profile from `profile_dataframe`. If given, statistics are
+        read from it instead of rescanning `dataframe`.
 
     Returns
     -------
     dict
         Keys are data types (as strings), values are column counts.
     """
-    type_counts = {
-        "object": 0,
-        "int": 0,
-        "float": 0,
-        "bool": 0,
-        "category": 0,
-        "datetime": 0,
-        "other": 0,
-    }
+    type_counts = {key: 0 for key in DTYPE_CLASSES}
+
+    if profile is not None:
+        for stats in profile:
+            type_counts[stats.dtype_class] += 1
+        return type_counts
 
     for col in dataframe.columns:
-        dtype = dataframe[col].dtype
-
-        if ptypes.is_bool_dtype(dtype):
-            type_counts["bool"] += 1
-        elif ptypes.is_integer_dtype(dtype):
-            type_counts["int"] += 1
-        elif ptypes.is_float_dtype(dtype):
-            type_counts["float"] += 1
-        elif isinstance(dtype, pd.CategoricalDtype):
-            type_counts["category"] += 1
-        elif ptypes.is_datetime64_any_dtype(dtype):
-            type_counts["datetime"] += 1
-        elif ptypes.is_object_dtype(dtype):
-            type_counts["object"] += 1
-        else:
-            type_counts["other"] += 1
+        type_counts[dtype_class(dataframe[col].dtype)] += 1
 
     return type_counts
 
 
-def show_missing_summary(dataframe, sort=True, threshold=0.0):
+@cached
+def show_missing_summary(dataframe, sort=True, threshold=0.0, profile=None):
     """
     Summarize missing values in the DataFrame.
 
@@ -577,6 +841,9 @@ def show_missing_summary(dataframe, sort=True, threshold=0.0):
         If True, sorts the result by descending missing count. Default is True.
     threshold : float, optional
         Minimum percentage (0–100) of missing values to include a column. Default is 0.0.
+    profile : FrameProfile, optional
+        Precomputed profile from `profile_dataframe`. If given, statistics are
+        read from it instead of rescanning `dataframe`.
 
     Returns
     -------
@@ -584,9 +851,14 @@ def show_missing_summary(dataframe, sort=True, threshold=0.0):
         A dictionary where keys are column names and values are tuples of
         (missing count, percent missing), filtered by the threshold.
     """
-    null_counts = dataframe.isnull().sum()
+    if profile is not None:
+        null_counts = pd.Series(
+            {stats.name: stats.null_count for stats in profile}, dtype="int64"
+        )
+    else:
+        null_counts = dataframe.isnull().sum()
     null_counts = null_counts[null_counts > 0]
-    total_rows = len(dataframe)
+    total_rows = profile.n_rows if profile is not None else len(dataframe)
 
     summary = {}
     for col, count in null_counts.items():
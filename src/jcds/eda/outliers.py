@@ -1,56 +1,463 @@
+import warnings
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pandas.api.types as ptypes
+
 from jcds.eda.inspect import show_convar, show_binary_list
+from jcds.eda.profile import iter_file_chunks, profile_file
 from jcds.utils import deprecated
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 
 
-def detect_outliers_iqr(dataframe, threshold=1.5, return_mask=False):
+MASK_FORMATS = ("dense", "sparse", "index")
+
+
+def outlier_columns(dataframe, profile=None):
     """
-    Detect outliers in numeric (non-binary) columns using the IQR method.
+    Return the numeric, non-binary columns: the ones outlier rules apply to.
 
     Parameters
     ----------
     dataframe : pd.DataFrame
-        The input DataFrame.
+        The input DataFrame, or an empty schema frame when `profile` is given.
+    profile : FrameProfile, optional
+        Profile used to find binary columns without reading the data.
+
+    Returns
+    -------
+    list
+    """
+    numeric_cols = show_convar(dataframe)
+    binary_info = show_binary_list(dataframe, profile=profile, columns=numeric_cols)
+    binary_cols = set(binary_info["binary_columns"] + binary_info["binary_with_nan"])
+    return [col for col in numeric_cols if col not in binary_cols]
+
+
+def iqr_fences(q1, q3, threshold=1.5):
+    """
+    Return the (lower, upper) outlier bounds for the given quartiles.
+
+    Parameters
+    ----------
+    q1, q3 : float
+        First and third quartiles.
+    threshold : float, optional
+        The IQR multiplier. Default is 1.5.
+
+    Returns
+    -------
+    tuple of float
+    """
+    iqr = q3 - q1
+    return q1 - threshold * iqr, q3 + threshold * iqr
+
+
+def _outside(series, lower, upper):
+    is_outlier = (series < lower) | (series > upper)
+    return np.flatnonzero(is_outlier.to_numpy(dtype=bool, na_value=False))
+
+
+def _file_outlier_positions(filepath, threshold, chunksize, error):
+    """
+    Stream a file twice: sketch the quartiles, then find the rows outside the fences.
+
+    Returns the positions per checked column, the row count and the column labels.
+    """
+    profile = profile_file(filepath, chunksize=chunksize, quantile_error=error)
+    schema = profile.schema()
+    fences = {}
+    for col in outlier_columns(schema, profile):
+        sketch = profile[col].quantile_sketch
+        q1, q3 = sketch.quantile([0.25, 0.75]) if sketch is not None else (np.nan, np.nan)
+        fences[col] = iqr_fences(q1, q3, threshold)
+
+    found = {col: [] for col in fences}
+    offset = 0
+    for chunk in iter_file_chunks(filepath, chunksize):
+        for col, (lower, upper) in fences.items():
+            found[col].append(_outside(chunk[col], lower, upper) + offset)
+        offset += len(chunk)
+    positions = {
+        col: np.concatenate(parts) if parts else np.array([], dtype=np.intp)
+        for col, parts in found.items()
+    }
+    return positions, profile.n_rows, schema.columns
+
+
+def _sparse_flags(positions, n_rows):
+    flags = np.zeros(n_rows, dtype=bool)
+    flags[positions] = True
+    return pd.arrays.SparseArray(flags, fill_value=False)
+
+
+def detect_outliers_iqr(
+    dataframe,
+    threshold=1.5,
+    return_mask=False,
+    mask_format="dense",
+    chunksize=100_000,
+    error=0.01,
+):
+    """
+    Detect outliers in numeric (non-binary) columns using the IQR method.
+
+    In-memory frames go through the same 'iqr' engine and column selection
+    as `detect_outliers(method="iqr")`.
+
+    Parameters
+    ----------
+    dataframe : pd.DataFrame or str or Path
+        The input DataFrame, or the path to a CSV or Parquet file. Files are
+        streamed twice: once to sketch the quartiles of every column (see
+        `QuantileSketch`) and once to find the rows outside the bounds.
     threshold : float, optional
         The IQR multiplier to determine outlier bounds. Default is 1.5.
     return_mask : bool, optional
         If True, returns a boolean mask DataFrame. If False, returns outlier counts.
+    mask_format : {'dense', 'sparse', 'index'}, optional
+        Form of the mask when `return_mask=True`. 'dense' (default) is a
+        boolean DataFrame shaped like `dataframe`. 'sparse' has the same
+        shape but stores only the True cells (`pd.SparseDtype(bool)`), and
+        'index' is a dict {column: index labels of the outlier rows} for the
+        checked columns. The last two take memory proportional to the
+        number of outliers rather than to the size of the frame.
+    chunksize : int, optional
+        Rows per chunk when `dataframe` is a file path. Default is 100,000.
+    error : float, optional
+        Rank error of the quartile sketches when `dataframe` is a file path.
+        Default is 0.01. In-memory frames use exact quartiles.
 
     Returns
     -------
     dict or pd.DataFrame
         If return_mask is False: a dict {column: count of outliers}
-        If return_mask is True: a DataFrame with boolean values (True = outlier)
+        If return_mask is True: the mask in the form given by `mask_format`
+        (True = outlier). For file paths, the rows are labelled by position.
     """
-    numeric_cols = show_convar(dataframe)
-    binary_info = show_binary_list(dataframe)
-    binary_cols = binary_info["binary_columns"] + binary_info["binary_with_nan"]
+    if mask_format not in MASK_FORMATS:
+        raise ValueError(f"mask_format must be one of {MASK_FORMATS}.")
+
+    if isinstance(dataframe, (str, Path)):
+        positions, n_rows, columns = _file_outlier_positions(
+            dataframe, threshold, chunksize, error
+        )
+        index = pd.RangeIndex(n_rows)
+    else:
+        _, positions, _ = _run_engine(
+            dataframe, "iqr", _checked_columns(dataframe), threshold=threshold
+        )
+        index, columns = dataframe.index, dataframe.columns
+
+    if not return_mask:
+        return {col: len(rows) for col, rows in positions.items()}
+    if mask_format == "index":
+        return {col: index[rows] for col, rows in positions.items()}
 
-    # filter out binary cols
-    outlier_cols = []
-    for col in numeric_cols:
-        if col not in binary_cols:
-            outlier_cols.append(col)
+    n_rows = len(index)
+    empty = np.array([], dtype=np.intp)
+    if mask_format == "sparse":
+        flags = [_sparse_flags(positions.get(col, empty), n_rows) for col in columns]
+        outlier_mask = pd.DataFrame(dict(enumerate(flags)), index=index)
+        outlier_mask.columns = columns
+        return outlier_mask
 
-    outlier_counts = {}
-    outlier_mask = pd.DataFrame(False, index=dataframe.index, columns=dataframe.columns)
+    flags = np.zeros((n_rows, len(columns)), dtype=bool)
+    for j, col in enumerate(columns):
+        flags[positions.get(col, empty), j] = True
+    return pd.DataFrame(flags, index=index, columns=columns)
 
-    for col in outlier_cols:
-        Q1 = dataframe[col].quantile(0.25)
-        Q3 = dataframe[col].quantile(0.75)
-        IQR = Q3 - Q1
-        lower = Q1 - threshold * IQR
-        upper = Q3 + threshold * IQR
 
-        is_outlier = (dataframe[col] < lower) | (dataframe[col] > upper)
-        outlier_mask[col] = is_outlier
+# cells (rows * columns) converted to float64 at once by the vectorized engines
+OUTLIER_BLOCK_CELLS = 10_000_000
 
-        if not return_mask:
-            outlier_counts[col] = int(is_outlier.sum())
+# rows scored per `IsolationForest.decision_function` call
+ISOLATION_SCORE_ROWS = 1_000_000
+
+# rescales a median absolute deviation to a normal standard deviation
+MAD_SCALE = 1.4826
+
+# rescales a mean absolute deviation, used when the MAD is zero
+MEAN_AD_SCALE = 1.253314
+
+OUTLIER_ENGINES = {}
+
+
+@dataclass
+class OutlierResult:
+    """
+    Outliers found by `detect_outliers`, whatever the engine.
+
+    Attributes
+    ----------
+    method : str
+        Name of the engine that produced the result.
+    counts : dict
+        {column: number of outlier rows} for the checked columns.
+    bounds : pd.DataFrame
+        'lower' and 'upper' bound per checked column, in nanoseconds for
+        timedelta columns. NaN for engines that do not work with per-column
+        bounds, such as 'isolation_forest'.
+    mask : pd.DataFrame
+        Boolean `pd.SparseDtype` frame shaped like the input (True = outlier).
+        Only the outlier cells are stored.
+    scores : pd.Series or None
+        Per-row anomaly scores for engines that produce them (lower is more
+        anomalous), otherwise None.
+    """
+
+    method: str
+    counts: dict
+    bounds: pd.DataFrame
+    mask: pd.DataFrame = field(repr=False)
+    scores: pd.Series = field(default=None, repr=False)
+
+    def rows(self, column):
+        """Return the index labels of the outlier rows of `column`."""
+        return self.mask.index[self.mask[column].array.sp_index.indices]
+
+
+def register_outlier_engine(name):
+    """
+    Register an outlier engine for `detect_outliers(method=name)`.
+
+    The engine takes the DataFrame, the list of columns to check and any
+    keyword arguments given to `detect_outliers`, and returns a tuple
+    ``(bounds, positions, scores)``: a DataFrame with 'lower' and 'upper'
+    per column, a dict {column: row positions of the outliers} and a Series
+    of row scores (or None).
+    """
+
+    def decorator(func):
+        OUTLIER_ENGINES[name] = func
+        return func
+
+    return decorator
+
+
+def _checked_columns(dataframe):
+    """Columns the engines check by default: numeric or timedelta, non-binary."""
+    return [
+        col
+        for col in outlier_columns(dataframe)
+        if ptypes.is_numeric_dtype(dataframe[col].dtype)
+        or ptypes.is_timedelta64_dtype(dataframe[col].dtype)
+    ]
+
+
+def _float_block(dataframe, rows, columns):
+    """
+    Copy the given rows and columns to a float64 array in a single take.
+
+    Timedeltas become nanoseconds, with NaT as NaN.
+    """
+    positions = dataframe.columns.get_indexer(columns)
+    block = dataframe.iloc[rows, positions]
+    values = block.to_numpy(dtype=np.float64, na_value=np.nan)
+    for j, dtype in enumerate(block.dtypes):
+        if ptypes.is_timedelta64_dtype(dtype):
+            values[block.iloc[:, j].isna().to_numpy(), j] = np.nan
+    return values
+
+
+def _column_blocks(dataframe, columns):
+    """Yield (columns, float64 array) slices of at most `OUTLIER_BLOCK_CELLS` cells."""
+    width = max(1, OUTLIER_BLOCK_CELLS // max(len(dataframe), 1))
+    for start in range(0, len(columns), width):
+        part = columns[start : start + width]
+        yield part, _float_block(dataframe, slice(None), part)
+
+
+def _fence_engine(dataframe, columns, fences, threshold):
+    """
+    Apply a per-column bounds rule to a whole block of columns.
+
+    `fences(values, threshold)` returns the lower and upper bound of every
+    column of a 2-D array; the comparison against the bounds is done on the
+    same array, so each column slice is converted once.
+    """
+    lower, upper, positions = [], [], {}
+    for part, values in _column_blocks(dataframe, columns):
+        with warnings.catch_warnings():
+            # all-null columns have no bounds and no outliers
+            warnings.simplefilter("ignore", RuntimeWarning)
+            low, high = fences(values, threshold)
+        flags = (values < low) | (values > high)
+        for j, col in enumerate(part):
+            positions[col] = np.flatnonzero(flags[:, j])
+        lower.append(low)
+        upper.append(high)
+    bounds = pd.DataFrame(
+        {"lower": np.concatenate(lower), "upper": np.concatenate(upper)},
+        index=pd.Index(columns),
+    )
+    return bounds, positions, None
+
+
+def _iqr_bounds(values, threshold):
+    q1, q3 = np.nanquantile(values, [0.25, 0.75], axis=0)
+    return iqr_fences(q1, q3, threshold)
+
+
+def _mad_bounds(values, threshold):
+    median = np.nanmedian(values, axis=0)
+    deviation = values - median
+    np.abs(deviation, out=deviation)
+    # reordering within a column does not change its mean, used below
+    scale = MAD_SCALE * np.nanmedian(deviation, axis=0, overwrite_input=True)
+    # a column that is mostly one value has a MAD of zero
+    flat = scale == 0
+    if flat.any():
+        scale[flat] = MEAN_AD_SCALE * np.nanmean(deviation[:, flat], axis=0)
+    return median - threshold * scale, median + threshold * scale
+
+
+def _zscore_bounds(values, threshold):
+    # masked reductions skip the copies np.nanmean/np.nanstd make
+    valid = ~np.isnan(values)
+    mean = np.mean(values, axis=0, where=valid)
+    std = np.std(values, axis=0, ddof=1, where=valid)
+    return mean - threshold * std, mean + threshold * std
+
+
+@register_outlier_engine("iqr")
+def _iqr_engine(dataframe, columns, threshold=1.5):
+    """Values more than `threshold` IQRs outside the quartiles."""
+    return _fence_engine(dataframe, columns, _iqr_bounds, threshold)
+
+
+@register_outlier_engine("mad")
+def _mad_engine(dataframe, columns, threshold=3.5):
+    """Values whose modified z-score (median and scaled MAD) exceeds `threshold`."""
+    return _fence_engine(dataframe, columns, _mad_bounds, threshold)
+
+
+@register_outlier_engine("zscore")
+def _zscore_engine(dataframe, columns, threshold=3.0):
+    """Values more than `threshold` standard deviations from the mean."""
+    return _fence_engine(dataframe, columns, _zscore_bounds, threshold)
+
+
+@register_outlier_engine("isolation_forest")
+def _isolation_forest_engine(
+    dataframe,
+    columns,
+    contamination="auto",
+    n_estimators=100,
+    sample_size=100_000,
+    n_jobs=None,
+    random_state=0,
+):
+    """
+    Rows isolated quickly by a scikit-learn `IsolationForest`.
+
+    The forest is fitted on a random sample of `sample_size` rows and then
+    scores every row in batches, using `n_jobs` workers. Missing values are
+    replaced by the sample median of their column.
+    """
+    from sklearn.ensemble import IsolationForest
+
+    n_rows = len(dataframe)
+    rng = np.random.default_rng(random_state)
+    if n_rows > sample_size:
+        sample_rows = np.sort(rng.choice(n_rows, size=sample_size, replace=False))
+    else:
+        sample_rows = np.arange(n_rows)
+    sample = _float_block(dataframe, sample_rows, columns)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        fill = np.nan_to_num(np.nanmedian(sample, axis=0))
+
+    def _filled(values):
+        rows, cols = np.nonzero(np.isnan(values))
+        values[rows, cols] = fill[cols]
+        return values
+
+    forest = IsolationForest(
+        n_estimators=n_estimators,
+        contamination=contamination,
+        n_jobs=n_jobs,
+        random_state=random_state,
+    ).fit(_filled(sample))
+
+    scores = np.empty(n_rows)
+    for start in range(0, n_rows, ISOLATION_SCORE_ROWS):
+        values = _filled(
+            _float_block(dataframe, slice(start, start + ISOLATION_SCORE_ROWS), columns)
+        )
+        scores[start : start + len(values)] = forest.decision_function(values)
+
+    flagged = np.flatnonzero(scores < 0)
+    bounds = pd.DataFrame(np.nan, index=pd.Index(columns), columns=["lower", "upper"])
+    positions = {col: flagged for col in columns}
+    return bounds, positions, pd.Series(scores, index=dataframe.index, name="score")
+
+
+def _run_engine(dataframe, method, columns, **kwargs):
+    """Call an engine, or return empty results when there is nothing to check."""
+    if columns and len(dataframe):
+        return OUTLIER_ENGINES[method](dataframe, columns, **kwargs)
+    bounds = pd.DataFrame(np.nan, index=pd.Index(columns), columns=["lower", "upper"])
+    return bounds, {col: np.array([], dtype=np.intp) for col in columns}, None
+
+
+def detect_outliers(dataframe, method="iqr", columns=None, **kwargs):
+    """
+    Detect outliers in numeric (non-binary) columns with a pluggable engine.
+
+    Parameters
+    ----------
+    dataframe : pd.DataFrame
+        The input DataFrame.
+    method : str, optional
+        Name of a registered engine (see `register_outlier_engine`):
+
+        - 'iqr' (default): outside ``threshold`` IQRs of the quartiles
+          (``threshold=1.5``).
+        - 'mad': modified z-score, from the median and the scaled median
+          absolute deviation, above ``threshold`` (``threshold=3.5``).
+        - 'zscore': more than ``threshold`` standard deviations from the
+          mean (``threshold=3.0``).
+        - 'isolation_forest': rows flagged by a scikit-learn
+          `IsolationForest` over all checked columns together
+          (``contamination``, ``n_estimators``, ``sample_size``,
+          ``n_jobs``, ``random_state``). A flagged row is marked in every
+          checked column.
+    columns : list, optional
+        Numeric or timedelta columns to check. Default is every such
+        non-binary column.
+    **kwargs
+        Options of the engine, as listed above.
+
+    Returns
+    -------
+    OutlierResult
+        Counts, bounds and a sparse mask, in the same form for every engine.
+
+    Raises
+    ------
+    ValueError
+        If `method` is not a registered engine.
+    """
+    if method not in OUTLIER_ENGINES:
+        raise ValueError(f"method must be one of {tuple(OUTLIER_ENGINES)}.")
+    columns = _checked_columns(dataframe) if columns is None else list(columns)
+    bounds, positions, scores = _run_engine(dataframe, method, columns, **kwargs)
+
+    n_rows = len(dataframe)
+    empty = np.array([], dtype=np.intp)
+    flags = [_sparse_flags(positions.get(col, empty), n_rows) for col in dataframe.columns]
+    mask = pd.DataFrame(dict(enumerate(flags)), index=dataframe.index)
+    mask.columns = dataframe.columns
+    return OutlierResult(
+        method=method,
+        counts={col: len(positions[col]) for col in columns},
+        bounds=bounds,
+        mask=mask,
+        scores=scores,
+    )
 
-    return outlier_mask if return_mask else outlier_counts
 
 @deprecated( 
     reason="Use jcds.charts.outlier_boxplots() instead.", 
@@ -74,11 +481,10 @@ def plot_outlier_boxplots(dataframe, threshold=1.5, figsize=(14, 5)):
     -------
     None
     """
-    numeric_cols = show_convar(dataframe)
-    binary_info = show_binary_list(dataframe)
-    binary_cols = binary_info["binary_columns"] + binary_info["binary_with_nan"]
+    import matplotlib.pyplot as plt
+    import seaborn as sns
 
-    outlier_cols = [col for col in numeric_cols if col not in binary_cols]
+    outlier_cols = outlier_columns(dataframe)
 
     if not outlier_cols:
         print("No numeric (non-binary) columns available for boxplot.")
@@ -0,0 +1,95 @@
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+
+# below this many cells (rows * columns) the pool overhead outweighs the gain
+PARALLEL_MIN_CELLS = 1_000_000
+
+EXECUTORS = ("serial", "thread", "process")
+
+_config = {"executor": "thread", "n_jobs": None}
+
+
+def set_executor(executor="thread", n_jobs=None):
+    """
+    Choose how per-column work in `jcds.eda` is spread across cores.
+
+    Parameters
+    ----------
+    executor : {'thread', 'process', 'serial'} or concurrent.futures.Executor, optional
+        'thread' (the default) uses a thread pool; most pandas column
+        kernels release the GIL for numeric data. 'process' uses a process
+        pool, which also parallelizes object columns but pays for copying
+        every column to a worker. 'serial' runs in the calling thread. An
+        `Executor` instance is used as given and left open, which avoids
+        starting a new pool on every call.
+    n_jobs : int or None, optional
+        Number of workers. None uses `os.cpu_count()`.
+
+    Raises
+    ------
+    ValueError
+        If `executor` or `n_jobs` is not valid.
+    """
+    if not isinstance(executor, Executor) and executor not in EXECUTORS:
+        raise ValueError(f"executor must be one of {EXECUTORS} or an Executor.")
+    if n_jobs is not None and n_jobs < 1:
+        raise ValueError("n_jobs must be a positive integer or None.")
+    _config["executor"] = executor
+    _config["n_jobs"] = n_jobs
+
+
+def get_executor():
+    """
+    Return the current executor settings.
+
+    Returns
+    -------
+    dict
+        ``{"executor": ..., "n_jobs": ...}`` as set by `set_executor`.
+    """
+    return dict(_config)
+
+
+def map_columns(func, dataframe, columns=None, min_cells=None):
+    """
+    Apply `func` to each column of a DataFrame using the configured executor.
+
+    Parameters
+    ----------
+    func : callable
+        Called with one column (a Series). Must be picklable (a module-level
+        function or a `functools.partial` of one) for the process executor.
+    dataframe : pd.DataFrame
+    columns : list, optional
+        Columns to process, in order. Default is all columns.
+    min_cells : int, optional
+        Frames with fewer cells run serially. Default is `PARALLEL_MIN_CELLS`.
+
+    Returns
+    -------
+    list
+        One result per column, in column order.
+    """
+    if columns is None:
+        series = [column for _, column in dataframe.items()]
+    else:
+        series = [dataframe[col] for col in columns]
+
+    if min_cells is None:
+        min_cells = PARALLEL_MIN_CELLS
+    executor = _config["executor"]
+    n_jobs = _config["n_jobs"] or os.cpu_count() or 1
+    if (
+        executor == "serial"
+        or n_jobs == 1
+        or len(series) < 2
+        or len(dataframe) * len(series) < min_cells
+    ):
+        return [func(column) for column in series]
+
+    if isinstance(executor, Executor):
+        return list(executor.map(func, series))
+    pool = ThreadPoolExecutor if executor == "thread" else ProcessPoolExecutor
+    with pool(max_workers=min(n_jobs, len(series))) as workers:
+        return list(workers.map(func, series))
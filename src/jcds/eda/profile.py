@@ -0,0 +1,929 @@
+import math
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pandas.api.types as ptypes
+
+from jcds.eda.cache import cached
+from jcds.eda.parallel import map_columns
+from jcds.eda.sketches import HyperLogLog, QuantileSketch, hash_values
+
+
+DTYPE_CLASSES = ("object", "int", "float", "bool", "category", "datetime", "other")
+
+# rows sampled per chunk for value counts when profiling with approx=True
+APPROX_SAMPLE_ROWS = 100_000
+
+# infer_dtype results that can only come from a single kind of Python value
+# (str and numpy.str_, float and numpy.float64, ... count as one kind)
+_SINGLE_KIND_INFERRED = frozenset(
+    {
+        "string",
+        "bytes",
+        "floating",
+        "integer",
+        "decimal",
+        "complex",
+        "boolean",
+        "datetime64",
+        "datetime",
+        "date",
+        "timedelta64",
+        "timedelta",
+        "time",
+        "period",
+        "interval",
+    }
+)
+
+
+@dataclass
+class ColumnStats:
+    """
+    Per-column statistics collected in a single scan of the column.
+
+    Attributes
+    ----------
+    name : hashable
+        Column label.
+    dtype : str
+        The pandas dtype as a string.
+    dtype_class : str
+        One of "object", "int", "float", "bool", "category", "datetime" or "other".
+    count : int
+        Number of non-null values.
+    null_count : int
+        Number of null values.
+    nunique : int
+        Number of distinct non-null values.
+    nunique_with_na : int
+        Number of distinct values counting nulls, as `Series.nunique(dropna=False)`.
+    top_values : list of tuple
+        Most frequent (value, count) pairs, nulls included, most frequent first.
+    python_types : frozenset of str
+        Names of the Python types found among the non-null values.
+    type_counts : dict
+        Number of non-null values per Python type name.
+    memory_bytes : int
+        Deep memory usage of the column values in bytes.
+    min, max : scalar or None
+        Smallest and largest non-null value for numeric and datetime columns.
+    mean, std : float or None
+        Mean and sample standard deviation for numeric columns.
+    sample_values : list
+        The first non-null values seen, used for format sniffing.
+    nunique_exact : bool
+        False when `nunique` is a HyperLogLog estimate, either because the
+        profile was built with `approx=True` or because the distinct values
+        outgrew `max_tracked` while streaming. `top_values` counts are then
+        approximate too.
+    quantile_sketch : QuantileSketch or None
+        Sketch of the values of a numeric column, kept when the profile was
+        built with `quantile_error`; answers quantile queries after streaming.
+    """
+
+    name: object
+    dtype: str
+    dtype_class: str
+    count: int
+    null_count: int
+    nunique: int
+    nunique_with_na: int
+    top_values: list = field(default_factory=list)
+    python_types: frozenset = frozenset()
+    type_counts: dict = field(default_factory=dict)
+    memory_bytes: int = 0
+    min: object = None
+    max: object = None
+    mean: float = None
+    std: float = None
+    sample_values: list = field(default_factory=list)
+    nunique_exact: bool = True
+    quantile_sketch: object = None
+
+    def top_modes(self, n, dropna=False):
+        """
+        Return the top `n` (value, count) pairs, or None if the stored values
+        are not enough to answer exactly.
+        """
+        values = self.top_values
+        complete = self.nunique_exact and len(values) >= self.nunique_with_na
+        if dropna:
+            values = [(v, c) for v, c in values if not pd.isna(v)]
+        if len(values) >= n or complete:
+            return values[:n]
+        return None
+
+
+@dataclass
+class FrameProfile:
+    """
+    Statistics for a whole DataFrame, built by `profile_dataframe` or `profile_file`.
+
+    Attributes
+    ----------
+    n_rows : int
+        Number of rows.
+    columns : dict
+        Mapping of column name to `ColumnStats`, in column order.
+    rows_any_na : int
+        Number of rows with at least one null value.
+    rows_all_na : int
+        Number of rows where every value is null.
+    index_bytes : int
+        Deep memory usage of the index in bytes.
+    """
+
+    n_rows: int
+    columns: dict
+    rows_any_na: int
+    rows_all_na: int
+    index_bytes: int = 0
+
+    def __getitem__(self, column):
+        return self.columns[column]
+
+    def __iter__(self):
+        return iter(self.columns.values())
+
+    @property
+    def n_cols(self):
+        return len(self.columns)
+
+    @property
+    def size(self):
+        return self.n_rows * self.n_cols
+
+    @property
+    def total_na(self):
+        return sum(stats.null_count for stats in self)
+
+    @property
+    def memory_bytes(self):
+        return self.index_bytes + sum(stats.memory_bytes for stats in self)
+
+    def schema(self):
+        """
+        Return an empty DataFrame with the profiled columns and dtypes.
+
+        Useful for dtype-based helpers such as `show_catvar` when the data
+        itself was streamed and never held in memory.
+        """
+        return pd.DataFrame(
+            {stats.name: pd.Series(dtype=stats.dtype) for stats in self}
+        )
+
+
+def dtype_class(dtype):
+    """
+    Classify a pandas dtype into one of the summary buckets used by `get_dtype_summary`.
+
+    Parameters
+    ----------
+    dtype : numpy.dtype or pandas extension dtype
+
+    Returns
+    -------
+    str
+        One of "object", "int", "float", "bool", "category", "datetime" or "other".
+    """
+    if ptypes.is_bool_dtype(dtype):
+        return "bool"
+    elif ptypes.is_integer_dtype(dtype):
+        return "int"
+    elif ptypes.is_float_dtype(dtype):
+        return "float"
+    elif isinstance(dtype, pd.CategoricalDtype):
+        return "category"
+    elif ptypes.is_datetime64_any_dtype(dtype):
+        return "datetime"
+    elif ptypes.is_object_dtype(dtype):
+        return "object"
+    return "other"
+
+
+def _common_dtype(left, right):
+    """Return the dtype a column gets when chunks of dtype `left` and `right` are combined."""
+    if left is None or left == right:
+        return right
+    if isinstance(left, np.dtype) and isinstance(right, np.dtype):
+        if left.kind in "biuf" and right.kind in "biuf":
+            return np.result_type(left, right)
+    return np.dtype("object")
+
+
+def _has_moments(dtype):
+    return ptypes.is_numeric_dtype(dtype) and not ptypes.is_bool_dtype(dtype)
+
+
+def _type_name(series, na_mask):
+    """Return the Python type name of the first non-null value of `series`."""
+    first = series.iloc[[int(na_mask.argmin())]]
+    return first.map(lambda x: type(x).__name__).iloc[0]
+
+
+def is_single_type(series, sample=None, random_state=0):
+    """
+    Return True if the non-null values of `series` are known to share one type.
+
+    A cheap check that needs no null mask: non-object columns always pass,
+    object columns pass when `infer_dtype` reports a single kind of value.
+    False means the column needs a closer look with `python_type_counts`.
+    """
+    if not ptypes.is_object_dtype(series.dtype):
+        return not isinstance(series.dtype, pd.CategoricalDtype)
+    values = series.to_numpy()
+    if sample is not None and len(values) > sample:
+        rng = np.random.default_rng(random_state)
+        values = values[np.sort(rng.choice(len(values), sample, replace=False))]
+    inferred = ptypes.infer_dtype(values, skipna=True)
+    return inferred == "empty" or inferred in _SINGLE_KIND_INFERRED
+
+
+def python_type_counts(series, sample=None, na_mask=None, random_state=0):
+    """
+    Count the Python types of the non-null values of a column.
+
+    Only object columns can hold more than one type. Other dtypes are answered
+    from the dtype alone, and object columns are first checked with
+    `pandas.api.types.infer_dtype`, which runs in C and settles the common
+    single-type case without creating a Python object per cell. Only columns
+    it reports as mixed are counted value by value.
+
+    Parameters
+    ----------
+    series : pd.Series
+        The column to inspect.
+    sample : int or None, optional
+        If given, check at most this many randomly chosen rows of an object
+        column; the counts then refer to the non-null values in the sample.
+        Default is None (check every value).
+    na_mask : numpy.ndarray, optional
+        Precomputed boolean null mask of `series`.
+    random_state : int, optional
+        Seed for the sample. Default is 0.
+
+    Returns
+    -------
+    dict
+        Mapping of type name to number of values, e.g. ``{"int": 3, "str": 1}``.
+    """
+    if (
+        sample is not None
+        and len(series) > sample
+        and ptypes.is_object_dtype(series.dtype)
+    ):
+        rng = np.random.default_rng(random_state)
+        rows = np.sort(rng.choice(len(series), sample, replace=False))
+        series = series.iloc[rows]
+        na_mask = na_mask[rows] if na_mask is not None else None
+    if na_mask is None:
+        na_mask = series.isna().to_numpy()
+    count = len(series) - int(na_mask.sum())
+    if not count:
+        return {}
+
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        used = np.bincount(codes[codes >= 0], minlength=len(series.cat.categories))
+        counts = Counter()
+        for value, n in zip(series.cat.categories, used):
+            if n:
+                counts[type(value).__name__] += int(n)
+        return dict(counts)
+    if not ptypes.is_object_dtype(series.dtype):
+        return {_type_name(series, na_mask): count}
+
+    values = series.to_numpy()[~na_mask]
+    if ptypes.infer_dtype(values, skipna=False) in _SINGLE_KIND_INFERRED:
+        return {type(values[0]).__name__: len(values)}
+    return {t.__name__: n for t, n in Counter(map(type, values)).items()}
+
+
+class ColumnAccumulator:
+    """
+    Mergeable partial statistics for one column.
+
+    Feed it one or more chunks of the same column with `update`, combine
+    accumulators built on separate chunks with `merge`, then call `finalize`
+    to get a `ColumnStats`.
+
+    Parameters
+    ----------
+    name : hashable
+        Column label.
+    top_n : int, optional
+        Number of most frequent values to report. Default is 5.
+    sample_size : int, optional
+        Number of leading non-null values to keep. Default is 5.
+    max_tracked : int or None, optional
+        Maximum number of distinct values to keep counts for. When exceeded,
+        only the most frequent values are kept and `nunique` falls back to a
+        HyperLogLog estimate. None (the default) keeps every value.
+    approx : bool, optional
+        If True, estimate `nunique` with a HyperLogLog sketch and count values
+        on a sample of at most `APPROX_SAMPLE_ROWS` rows per chunk instead of
+        building a full hash table. Default is False.
+    error : float, optional
+        Target relative error of the HyperLogLog sketch. Default is 0.01.
+    quantile_error : float or None, optional
+        If given, numeric columns also feed a `QuantileSketch` with this rank
+        error. Default is None.
+    """
+
+    def __init__(
+        self,
+        name,
+        top_n=5,
+        sample_size=5,
+        max_tracked=None,
+        approx=False,
+        error=0.01,
+        quantile_error=None,
+    ):
+        self.name = name
+        self.top_n = top_n
+        self.sample_size = sample_size
+        self.max_tracked = max_tracked
+        self.approx = approx
+        self.error = error
+        self.hll = HyperLogLog(error) if approx or max_tracked is not None else None
+        self.quantile_error = quantile_error
+        self.quantiles = None
+        self.dtype = None
+        self.n_rows = 0
+        self.null_count = 0
+        self.counts = None
+        self.n_updates = 0
+        self.overflowed = False
+        self.type_counts = Counter()
+        self.memory_bytes = 0
+        self.min = None
+        self.max = None
+        self.n_moments = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.sample_values = []
+
+    def update(self, series):
+        """
+        Add one chunk of the column.
+
+        Parameters
+        ----------
+        series : pd.Series
+
+        Returns
+        -------
+        numpy.ndarray
+            Boolean null mask of the chunk.
+        """
+        chunk = self.spawn()
+        na_mask = chunk._absorb(series)
+        self.merge(chunk)
+        return na_mask
+
+    def spawn(self):
+        """
+        Return an empty accumulator with the same settings.
+
+        It only collects the sample values this accumulator still lacks. Fill
+        it from one chunk (possibly in another thread or process) and `merge`
+        it back.
+        """
+        return ColumnAccumulator(
+            self.name,
+            self.top_n,
+            max(self.sample_size - len(self.sample_values), 0),
+            self.max_tracked,
+            self.approx,
+            self.error,
+            self.quantile_error,
+        )
+
+    def _absorb(self, series):
+        """Fill this empty accumulator from one Series and return its null mask."""
+        na_mask = series.isna().to_numpy()
+        null_count = int(na_mask.sum())
+        count = len(series) - null_count
+
+        self.dtype = series.dtype
+        self.n_rows = len(series)
+        self.null_count = null_count
+        self.n_updates = 1
+        self.memory_bytes = int(series.memory_usage(deep=True, index=False))
+
+        if self.hll is not None:
+            self.hll.update_hashes(hash_values(series)[~na_mask])
+
+        if self.approx and len(series) > APPROX_SAMPLE_ROWS:
+            rng = np.random.default_rng(0)
+            rows = rng.choice(len(series), APPROX_SAMPLE_ROWS, replace=False)
+            counts = series.iloc[np.sort(rows)].value_counts(dropna=False)
+            counts = (counts * (len(series) / APPROX_SAMPLE_ROWS)).round().astype("int64")
+            self.overflowed = True
+        else:
+            counts = series.value_counts(dropna=False)
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # unobserved categories are reported with a count of zero
+            counts = counts[counts > 0]
+            counts.index = counts.index.astype(object)
+        self.counts = counts
+
+        self.type_counts.update(python_type_counts(series, na_mask=na_mask))
+
+        if count and (
+            _has_moments(series.dtype) or ptypes.is_datetime64_any_dtype(series.dtype)
+        ):
+            self.min = series.min()
+            self.max = series.max()
+        if count and _has_moments(series.dtype):
+            self.n_moments = count
+            self.mean = float(series.mean())
+            self.m2 = float(series.var(ddof=0)) * count
+            if self.quantile_error is not None:
+                self.quantiles = QuantileSketch(self.quantile_error).update(series)
+
+        if self.sample_size:
+            positions = np.flatnonzero(~na_mask)[: self.sample_size]
+            self.sample_values = series.iloc[positions].tolist()
+        return na_mask
+
+    def merge(self, other):
+        """
+        Fold the statistics of another accumulator for the same column into this one.
+
+        Parameters
+        ----------
+        other : ColumnAccumulator
+
+        Returns
+        -------
+        ColumnAccumulator
+            This accumulator.
+        """
+        self.dtype = _common_dtype(self.dtype, other.dtype)
+        self.n_rows += other.n_rows
+        self.null_count += other.null_count
+        self.n_updates += other.n_updates
+        self.overflowed = self.overflowed or other.overflowed
+        self.type_counts.update(other.type_counts)
+        self.memory_bytes += other.memory_bytes
+        if other.hll is not None:
+            if self.hll is None:
+                self.hll = HyperLogLog(other.error)
+            self.hll.merge(other.hll)
+
+        if self.counts is None:
+            self.counts = other.counts
+        elif other.counts is not None:
+            self.counts = self.counts.add(other.counts, fill_value=0).astype("int64")
+        if self.max_tracked is not None and self.counts is not None:
+            if self.counts.index.notna().sum() > self.max_tracked:
+                self.counts = self.counts.sort_values(ascending=False).head(
+                    self.max_tracked
+                )
+                self.overflowed = True
+
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+        if other.quantiles is not None:
+            if self.quantiles is None:
+                self.quantiles = QuantileSketch(other.quantile_error)
+            self.quantiles.merge(other.quantiles)
+
+        if other.n_moments:
+            n = self.n_moments + other.n_moments
+            delta = other.mean - self.mean
+            self.mean += delta * other.n_moments / n
+            self.m2 += other.m2 + delta**2 * self.n_moments * other.n_moments / n
+            self.n_moments = n
+
+        room = self.sample_size - len(self.sample_values)
+        if room > 0:
+            self.sample_values.extend(other.sample_values[:room])
+        return self
+
+    def finalize(self):
+        """
+        Return the `ColumnStats` for everything seen so far.
+
+        Returns
+        -------
+        ColumnStats
+        """
+        counts = self.counts if self.counts is not None else pd.Series(dtype="int64")
+        if self.n_updates > 1:
+            counts = counts.sort_values(ascending=False, kind="stable")
+
+        dtype = self.dtype if self.dtype is not None else np.dtype("object")
+        type_counts = dict(self.type_counts)
+        if len(type_counts) > 1 and not (
+            ptypes.is_object_dtype(dtype) or isinstance(dtype, pd.CategoricalDtype)
+        ):
+            # chunks parsed as int and float end up as one float column
+            name = _type_name(pd.Series([0], dtype=dtype), np.array([False]))
+            type_counts = {name: sum(type_counts.values())}
+
+        mean = std = None
+        if self.n_moments and _has_moments(dtype):
+            mean = self.mean
+            if self.n_moments > 1:
+                std = math.sqrt(self.m2 / (self.n_moments - 1))
+        has_range = mean is not None or ptypes.is_datetime64_any_dtype(dtype)
+
+        exact = self.hll is None or not (self.approx or self.overflowed)
+        null_keys = len(counts) - int(counts.index.notna().sum())
+        if exact:
+            nunique = len(counts) - null_keys
+        else:
+            nunique = len(self.hll)
+            null_keys = max(null_keys, int(self.null_count > 0))
+        return ColumnStats(
+            name=self.name,
+            dtype=str(dtype),
+            dtype_class=dtype_class(dtype),
+            count=self.n_rows - self.null_count,
+            null_count=self.null_count,
+            nunique=nunique,
+            nunique_with_na=nunique + null_keys,
+            top_values=list(counts.head(self.top_n).items()),
+            python_types=frozenset(type_counts),
+            type_counts=type_counts,
+            memory_bytes=self.memory_bytes,
+            min=self.min if has_range else None,
+            max=self.max if has_range else None,
+            mean=mean,
+            std=std,
+            sample_values=list(self.sample_values),
+            nunique_exact=exact,
+            quantile_sketch=self.quantiles if mean is not None else None,
+        )
+
+
+def _absorb_column(chunks, series):
+    """`map_columns` worker: fill the empty accumulator for one column."""
+    chunk = chunks[series.name]
+    return chunk, chunk._absorb(series)
+
+
+class ProfileAccumulator:
+    """
+    Mergeable partial statistics for a whole DataFrame.
+
+    Feed it DataFrame chunks with `update`, combine accumulators built on
+    separate partitions with `merge`, and call `finalize` for a `FrameProfile`.
+    Memory use is bounded by the chunk size plus the tracked value counts.
+
+    Parameters
+    ----------
+    top_n : int, optional
+        Number of most frequent values to report per column. Default is 5.
+    sample_size : int, optional
+        Number of leading non-null values to keep per column. Default is 5.
+    max_tracked : int or None, optional
+        Maximum number of distinct values to count per column. Default is None (no limit).
+    approx : bool, optional
+        If True, estimate distinct counts with HyperLogLog sketches and count
+        values on a row sample. Default is False.
+    error : float, optional
+        Target relative error of the HyperLogLog sketches. Default is 0.01.
+    quantile_error : float or None, optional
+        If given, keep a `QuantileSketch` with this rank error for each
+        numeric column. Default is None.
+    """
+
+    def __init__(
+        self,
+        top_n=5,
+        sample_size=5,
+        max_tracked=None,
+        approx=False,
+        error=0.01,
+        quantile_error=None,
+    ):
+        self.top_n = top_n
+        self.sample_size = sample_size
+        self.max_tracked = max_tracked
+        self.approx = approx
+        self.error = error
+        self.quantile_error = quantile_error
+        self.columns = {}
+        self.n_rows = 0
+        self.rows_any_na = 0
+        self.rows_all_na = 0
+        self.index_bytes = 0
+
+    def _column(self, name):
+        if name not in self.columns:
+            self.columns[name] = ColumnAccumulator(
+                name,
+                self.top_n,
+                self.sample_size,
+                self.max_tracked,
+                self.approx,
+                self.error,
+                self.quantile_error,
+            )
+        return self.columns[name]
+
+    def update(self, dataframe):
+        """
+        Add one chunk of rows.
+
+        Parameters
+        ----------
+        dataframe : pd.DataFrame
+
+        Returns
+        -------
+        ProfileAccumulator
+            This accumulator.
+        """
+        n_rows = len(dataframe)
+        any_na = np.zeros(n_rows, dtype=bool)
+        all_na = np.ones(n_rows, dtype=bool)
+        chunks = {col: self._column(col).spawn() for col in dataframe.columns}
+        results = map_columns(partial(_absorb_column, chunks), dataframe)
+        for col, (chunk, na_mask) in zip(dataframe.columns, results):
+            self._column(col).merge(chunk)
+            any_na |= na_mask
+            all_na &= na_mask
+
+        self.n_rows += n_rows
+        self.rows_any_na += int(any_na.sum())
+        self.rows_all_na += int(all_na.sum())
+        self.index_bytes += int(dataframe.index.memory_usage(deep=True))
+        return self
+
+    def merge(self, other):
+        """
+        Fold another accumulator, built on different rows of the same columns, into this one.
+
+        Parameters
+        ----------
+        other : ProfileAccumulator
+
+        Returns
+        -------
+        ProfileAccumulator
+            This accumulator.
+        """
+        for name, column in other.columns.items():
+            self._column(name).merge(column)
+        self.n_rows += other.n_rows
+        self.rows_any_na += other.rows_any_na
+        self.rows_all_na += other.rows_all_na
+        self.index_bytes += other.index_bytes
+        return self
+
+    def finalize(self):
+        """
+        Return the `FrameProfile` for everything seen so far.
+
+        Returns
+        -------
+        FrameProfile
+        """
+        return FrameProfile(
+            n_rows=self.n_rows,
+            columns={name: column.finalize() for name, column in self.columns.items()},
+            rows_any_na=self.rows_any_na,
+            rows_all_na=self.rows_all_na,
+            index_bytes=self.index_bytes,
+        )
+
+
+def profile_column(series, top_n=5):
+    """
+    Collect the statistics for a single column in one pass.
+
+    Parameters
+    ----------
+    series : pd.Series
+        The column to profile.
+    top_n : int, optional
+        Number of most frequent values to keep. Default is 5.
+
+    Returns
+    -------
+    ColumnStats
+    """
+    column = ColumnAccumulator(series.name, top_n=top_n)
+    column.update(series)
+    return column.finalize()
+
+
+@cached
+def profile_dataframe(dataframe, top_n=5, approx=False, error=0.01, quantile_error=None):
+    """
+    Build a `FrameProfile` by walking each column of the DataFrame once.
+
+    The profile holds null counts, distinct counts, the most frequent values,
+    dtype class and Python types per column, plus the row-level missing counts.
+    Inspect functions accept it through their `profile` argument so that a
+    report can read every statistic from a single scan.
+
+    Parameters
+    ----------
+    dataframe : pd.DataFrame
+        The input DataFrame.
+    top_n : int, optional
+        Number of most frequent values to keep per column. Default is 5.
+    approx : bool, optional
+        If True, estimate distinct counts with HyperLogLog sketches instead of
+        exact hash tables. Default is False.
+    error : float, optional
+        Target relative error when `approx=True`. Default is 0.01.
+    quantile_error : float or None, optional
+        If given, keep a `QuantileSketch` with this rank error for each
+        numeric column (`ColumnStats.quantile_sketch`). Default is None.
+
+    Returns
+    -------
+    FrameProfile
+    """
+    accumulator = ProfileAccumulator(
+        top_n=top_n, approx=approx, error=error, quantile_error=quantile_error
+    )
+    return accumulator.update(dataframe).finalize()
+
+
+def iter_file_chunks(filepath, chunksize=100_000, file_type=None, columns=None, **kwargs):
+    """
+    Yield a CSV or Parquet file as a sequence of DataFrames.
+
+    Parameters
+    ----------
+    filepath : str or Path
+        Path to a CSV or Parquet file.
+    chunksize : int, optional
+        Number of rows per chunk. Default is 100,000.
+    file_type : {'csv', 'parquet'} or None, optional
+        File format. If None, inferred from the file extension.
+    columns : list, optional
+        Read only these columns. Parquet skips the others on disk.
+    **kwargs
+        Additional keyword arguments passed to `pd.read_csv` (CSV only).
+
+    Yields
+    ------
+    pd.DataFrame
+    """
+    filepath = Path(filepath)
+    if file_type is None:
+        file_type = "parquet" if filepath.suffix.lower() in (".parquet", ".pq") else "csv"
+
+    if file_type == "csv":
+        if columns is not None:
+            kwargs["usecols"] = columns
+        with pd.read_csv(filepath, chunksize=chunksize, **kwargs) as reader:
+            yield from reader
+    elif file_type == "parquet":
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(filepath)
+        for batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+    else:
+        raise ValueError("Unsupported file type. Use 'csv' or 'parquet'.")
+
+
+@cached
+def profile_file(
+    filepath,
+    chunksize=100_000,
+    file_type=None,
+    top_n=5,
+    max_tracked=100_000,
+    approx=False,
+    error=0.01,
+    quantile_error=None,
+    **kwargs,
+):
+    """
+    Build a `FrameProfile` for a CSV or Parquet file without loading it whole.
+
+    The file is streamed in chunks (CSV batches or Parquet record batches) and
+    each chunk is folded into a `ProfileAccumulator`, so peak memory is bounded
+    by `chunksize` and `max_tracked` rather than by the file size.
+
+    Parameters
+    ----------
+    filepath : str or Path
+        Path to a CSV or Parquet file.
+    chunksize : int, optional
+        Number of rows per chunk. Default is 100,000.
+    file_type : {'csv', 'parquet'} or None, optional
+        File format. If None, inferred from the file extension.
+    top_n : int, optional
+        Number of most frequent values to keep per column. Default is 5.
+    max_tracked : int or None, optional
+        Maximum number of distinct values to count per column. Columns with
+        more distinct values report a HyperLogLog estimate. Default is 100,000.
+    approx : bool, optional
+        If True, estimate distinct counts for every column. Default is False.
+    error : float, optional
+        Target relative error of the HyperLogLog sketches. Default is 0.01.
+    quantile_error : float or None, optional
+        If given, keep a `QuantileSketch` with this rank error for each
+        numeric column, so quantiles of the file can be read from the
+        profile. Default is None.
+    **kwargs
+        Additional keyword arguments passed to `pd.read_csv` (CSV only).
+
+    Returns
+    -------
+    FrameProfile
+    """
+    accumulator = ProfileAccumulator(
+        top_n=top_n,
+        max_tracked=max_tracked,
+        approx=approx,
+        error=error,
+        quantile_error=quantile_error,
+    )
+    for chunk in iter_file_chunks(filepath, chunksize, file_type, **kwargs):
+        accumulator.update(chunk)
+
+    profile = accumulator.finalize()
+    # a fully loaded file gets a single RangeIndex, not one per chunk
+    profile.index_bytes = int(pd.RangeIndex(profile.n_rows).memory_usage(deep=True))
+    return profile
+
+
+def profile_parquet_metadata(filepath):
+    """
+    Build a `FrameProfile` from a Parquet footer, without reading any data.
+
+    Row counts, null counts, min/max and dtypes come from the file metadata
+    (see `jcds.dataio.parquet_metadata`), so the profile answers shape,
+    missing-value and range questions through the `profile=` argument of the
+    inspect functions, e.g. ``count_total_na(profile.schema(), profile=profile)``.
+    It serves `show_shape`, `count_total_na`, `count_cols_with_any_na` and
+    `count_cols_with_all_na`. Functions that need unique or top-value counts
+    (`show_lowcardvars`, `show_highcardvars`, `show_constantvars`,
+    `show_nearconstvars`, `show_binary_list`, `count_id_like_columns`) raise
+    a ValueError for it, as do the row-level `count_rows_with_*_na` unless
+    the footer determines those counts.
+
+    Parameters
+    ----------
+    filepath : str or Path
+        Path to a Parquet file.
+
+    Returns
+    -------
+    FrameProfile
+        Statistics that the footer cannot provide are None: unique counts,
+        `rows_any_na` / `rows_all_na` (unless no column has nulls, or there
+        is a single column), and `min` / `max` for columns written without
+        statistics. `top_values` and `sample_values` are empty and
+        `memory_bytes` is 0.
+
+    Raises
+    ------
+    ValueError
+        If a column's null count is missing from the footer.
+    """
+    import pyarrow.parquet as pq
+
+    from jcds.dataio.io_utils import parquet_metadata
+
+    schema = pq.read_schema(filepath).empty_table().to_pandas()
+    stats = parquet_metadata(filepath).set_index("column")
+    n_rows = pq.ParquetFile(filepath).metadata.num_rows
+
+    columns = {}
+    for name, dtype in schema.dtypes.items():
+        null_count = stats.at[name, "null_count"]
+        if null_count is None or pd.isna(null_count):
+            raise ValueError(f"No null count for column {name!r} in {filepath}.")
+        null_count = int(null_count)
+        columns[name] = ColumnStats(
+            name=name,
+            dtype=str(dtype),
+            dtype_class=dtype_class(dtype),
+            count=n_rows - null_count,
+            null_count=null_count,
+            nunique=None,
+            nunique_with_na=None,
+            min=stats.at[name, "min"],
+            max=stats.at[name, "max"],
+            nunique_exact=False,
+        )
+
+    null_counts = [column.null_count for column in columns.values()]
+    if not any(null_counts):
+        rows_any_na = rows_all_na = 0
+    elif len(null_counts) == 1:
+        rows_any_na = rows_all_na = null_counts[0]
+    else:
+        rows_any_na = rows_all_na = None
+    return FrameProfile(n_rows, columns, rows_any_na, rows_all_na)
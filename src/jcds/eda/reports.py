@@ -1,10 +1,14 @@
+from pathlib import Path
+
 import pandas as pd
 import numpy as np
 
+from jcds.eda.data_profile import DataProfile, register_renderer
+from jcds.eda.profile import profile_file
 from jcds.utils import deprecated
 
 
-def dqr_cont(dataframe):
+def dqr_cont(dataframe, verbose=True, chunksize=100_000, error=0.01):
     """
     Generate a data quality report for continuous features in a given DataFrame.
 
@@ -15,19 +19,35 @@ def dqr_cont(dataframe):
     - Cardinality (number of unique values)
     - Descriptive statistics (mean, standard deviation, min, max)
 
+    A CSV or Parquet file path is streamed in chunks instead of loaded. Its
+    percentiles come from a `QuantileSketch` and are approximate (within
+    `error` in rank), and the cardinality of a column with more than
+    100,000 distinct values is a HyperLogLog estimate (see `profile_file`).
+    Counts, missing values, mean, std, min and max are exact. Columns with
+    no numeric summary (bool or datetime) appear in the quality table only.
+
     Parameters
     ----------
-    dataframe : pandas.DataFrame
-        The DataFrame containing the data to be analyzed.
-    list_of_features : list of str
-        The list of column names (features) for which the data quality report is generated.
+    dataframe : pandas.DataFrame or str or Path
+        The DataFrame containing the data to be analyzed, or a path to a
+        CSV or Parquet file.
+    verbose : bool, optional
+        Whether to print the report. Default is True.
+    chunksize : int, optional
+        Rows per chunk when `dataframe` is a file path. Default is 100,000.
+    error : float, optional
+        Rank error of the percentiles when `dataframe` is a file path.
+        Default is 0.01.
 
     Returns
     -------
-    None
-        This function prints the data quality report to the console.
+    DataProfile
+        The feature list and row count in `summary`, and the "quality" and
+        "describe" tables in `tables`.
 
     """
+    if isinstance(dataframe, (str, Path)):
+        return _dqr_cont_file(dataframe, verbose, chunksize, error)
 
     # Initialize variables
     round_to = 2
@@ -45,13 +65,6 @@ def dqr_cont(dataframe):
     # Total rows
     total_rows = dataframe.shape[0]
 
-    if len(list_of_features) == 0:
-        print("This dataset does not have any non-categorical features.")
-        return
-
-    print("The non-categorical features are: ")
-    print(list_of_features)
-
     for feature in list_of_features:
         # Get stats for each feature
         total_count = dataframe[feature].count()
@@ -76,23 +89,86 @@ def dqr_cont(dataframe):
     }
     df = pd.DataFrame(data)
 
-    # Get descriptive statistics and transpose
-    stats = np.round(dataframe[list_of_features].describe(), round_to)
-    transposed_stats = stats.T
+    tables = {}
+    if list_of_features:
+        # Get descriptive statistics and transpose
+        stats = np.round(dataframe[list_of_features].describe(), round_to)
+        tables = {"quality": df, "describe": stats.T}
 
-    # Print results
-    print("Data Quality for Continous Features")
-    print(f"Total Features: {len(list_of_features)} / {total_rows} rows")
-    display(df)
+    result = DataProfile(
+        "dqr_cont",
+        {"features": list_of_features, "total_rows": total_rows},
+        tables,
+    )
+    if verbose:
+        result.show()
+    return result
 
-    print("\n")
-    print("Descriptive Stats")
-    display(transposed_stats)
 
-    return
+def _dqr_cont_file(filepath, verbose, chunksize, error):
+    """Build the `dqr_cont` report for a file from a streamed profile."""
+    round_to = 2
+    profile = profile_file(filepath, chunksize=chunksize, quantile_error=error)
+    list_of_features = (
+        profile.schema().select_dtypes(exclude=["category", "object"]).columns.tolist()
+    )
+    total_rows = profile.n_rows
+
+    rows = []
+    for feature in list_of_features:
+        stats = profile[feature]
+        rows.append(
+            {
+                "Feature": feature,
+                "Count": stats.count,
+                "Missing": stats.null_count,
+                "% missing": np.round(stats.null_count / total_rows * 100, round_to),
+                "Cardinality": stats.nunique_with_na,
+            }
+        )
+    df = pd.DataFrame(
+        rows, columns=["Feature", "Count", "Missing", "% missing", "Cardinality"]
+    )
+
+    tables = {"quality": df}
+    described = {
+        feature: profile[feature].quantile_sketch.describe()
+        for feature in list_of_features
+        if profile[feature].quantile_sketch is not None
+    }
+    if described:
+        stats = np.round(pd.DataFrame(described), round_to)
+        tables["describe"] = stats.T
+
+    result = DataProfile(
+        "dqr_cont",
+        {"features": list_of_features, "total_rows": total_rows},
+        tables,
+    )
+    if verbose:
+        result.show()
+    return result
+
+
+@register_renderer("dqr_cont")
+def _render_dqr_cont(result, show_columns):
+    list_of_features = result.summary["features"]
+    if len(list_of_features) == 0:
+        return ["This dataset does not have any non-categorical features."]
+
+    lines = [
+        "The non-categorical features are: ",
+        str(list_of_features),
+        "Data Quality for Continous Features",
+        f"Total Features: {len(list_of_features)} / {result.summary['total_rows']} rows",
+        result.tables["quality"],
+    ]
+    if "describe" in result.tables:
+        lines += ["\n", "Descriptive Stats", result.tables["describe"]]
+    return lines
 
 
-def dqr_cat(dataframe):
+def dqr_cat(dataframe, verbose=True):
     """
     Generate a data quality report for categorical features in a given DataFrame.
 
@@ -109,13 +185,14 @@ def dqr_cat(dataframe):
     ----------
     dataframe : pandas.DataFrame
         The DataFrame containing the data to be analyzed.
-    list_of_features : list of str
-        The list of column names (features) for which the data quality report is generated.
+    verbose : bool, optional
+        Whether to print the report. Default is True.
 
     Returns
     -------
-    None
-        This function prints the data quality report to the console.
+    DataProfile
+        The feature list and row count in `summary`, and the "quality",
+        "mode1", "mode2" and "describe" tables in `tables`.
 
     """
 
@@ -141,13 +218,6 @@ def dqr_cat(dataframe):
     # Total rows
     total_rows = dataframe.shape[0]
 
-    if len(list_of_features) == 0:
-        print("This dataset does not have any categorical columns.")
-        return
-
-    print("The categorical features are: ")
-    print(list_of_features)
-
     for feature in list_of_features:
 
         total_count = dataframe[feature].count()
@@ -213,34 +283,50 @@ def dqr_cat(dataframe):
     df1 = pd.DataFrame(data_mode1)
     df2 = pd.DataFrame(data_mode2)
 
-    # Get descriptive statistics and transpose
-    stats = dataframe[list_of_features].describe(include="object")
-    transposed_stats = stats.T
-
-    # Print results
-    print("Data Quality Report for Categorical Features")
-    print(f"Total features: {len(list_of_features)} / {total_rows} rows")
-    print("============================================")
-    print("Stats")
-    print("-----")
-    display(df)
-
-    print("\n")
-    print("Mode 1")
-    print("------")
-    display(df1)
-
-    print("\n")
-    print("Mode 2")
-    print("------")
-    display(df2)
-
-    print("\n")
-    print("Descriptive Stats")
-    print("-----------------")
-    display(transposed_stats)
-
-    return
+    tables = {}
+    if list_of_features:
+        # Get descriptive statistics and transpose
+        stats = dataframe[list_of_features].describe(include="object")
+        tables = {"quality": df, "mode1": df1, "mode2": df2, "describe": stats.T}
+
+    result = DataProfile(
+        "dqr_cat",
+        {"features": list_of_features, "total_rows": total_rows},
+        tables,
+    )
+    if verbose:
+        result.show()
+    return result
+
+
+@register_renderer("dqr_cat")
+def _render_dqr_cat(result, show_columns):
+    list_of_features = result.summary["features"]
+    if len(list_of_features) == 0:
+        return ["This dataset does not have any categorical columns."]
+
+    return [
+        "The categorical features are: ",
+        str(list_of_features),
+        "Data Quality Report for Categorical Features",
+        f"Total features: {len(list_of_features)} / {result.summary['total_rows']} rows",
+        "============================================",
+        "Stats",
+        "-----",
+        result.tables["quality"],
+        "\n",
+        "Mode 1",
+        "------",
+        result.tables["mode1"],
+        "\n",
+        "Mode 2",
+        "------",
+        result.tables["mode2"],
+        "\n",
+        "Descriptive Stats",
+        "-----------------",
+        result.tables["describe"],
+    ]
 
 
 def display_all_col_head(dataframe, head=5):
@@ -269,6 +355,8 @@ def display_all_col_head(dataframe, head=5):
 
     """
 
+    from IPython.display import display
+
     with pd.option_context("display.max_columns", None):
         display(dataframe.head(head))
 
@@ -0,0 +1,464 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+
+def _bit_length(values):
+    """
+    Vectorized `int.bit_length` for an array of uint64 values.
+
+    Exact below 2**53; above that the float conversion can round a value just
+    under a power of two up, which shifts one HyperLogLog rank with negligible
+    probability.
+    """
+    return np.frexp(values.astype(np.float64))[1]
+
+
+def hash_values(values):
+    """
+    Return 64-bit hashes of a Series or array, as used by the sketches.
+
+    Parameters
+    ----------
+    values : pd.Series, pd.Index or array-like
+
+    Returns
+    -------
+    numpy.ndarray of uint64
+    """
+    # categorize=False hashes every value directly instead of factorizing
+    # first, which would build the very hash table the sketches avoid
+    if isinstance(values, (pd.Series, pd.Index)):
+        return pd.util.hash_pandas_object(
+            values, index=False, categorize=False
+        ).to_numpy()
+    return pd.util.hash_array(np.asarray(values), categorize=False)
+
+
+class HyperLogLog:
+    """
+    HyperLogLog sketch for approximate distinct counts in constant memory.
+
+    The sketch keeps `2**p` one-byte registers, where `p` is chosen from the
+    requested relative error (standard error ≈ 1.04 / sqrt(2**p)). Sketches
+    built with the same error on different chunks can be merged.
+
+    Parameters
+    ----------
+    error : float, optional
+        Target relative standard error of the estimate. Default is 0.01
+        (16 KB of registers).
+
+    Examples
+    --------
+    >>> hll = HyperLogLog(error=0.01).update(pd.Series(range(100_000)))
+    >>> abs(hll.estimate() - 100_000) < 3_000
+    True
+    """
+
+    def __init__(self, error=0.01):
+        if not 0 < error < 1:
+            raise ValueError("error must be between 0 and 1.")
+        p = math.ceil(math.log2((1.04 / error) ** 2))
+        self.p = min(max(p, 4), 18)
+        self.m = 1 << self.p
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+
+    @property
+    def relative_error(self):
+        """Standard relative error of the estimate for this register count."""
+        return 1.04 / math.sqrt(self.m)
+
+    def update(self, values):
+        """
+        Add the values of a Series or array to the sketch.
+
+        Parameters
+        ----------
+        values : pd.Series, pd.Index or array-like
+            Values to add. Nulls are hashed like any other value, so drop
+            them first if they should not be counted.
+
+        Returns
+        -------
+        HyperLogLog
+            This sketch.
+        """
+        return self.update_hashes(hash_values(values))
+
+    def update_hashes(self, hashes):
+        """
+        Add precomputed 64-bit hashes (see `hash_values`) to the sketch.
+
+        Parameters
+        ----------
+        hashes : numpy.ndarray of uint64
+
+        Returns
+        -------
+        HyperLogLog
+            This sketch.
+        """
+        if len(hashes) == 0:
+            return self
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        width = 64 - self.p
+        index = (hashes >> np.uint64(width)).astype(np.intp)
+        rest = hashes & np.uint64((1 << width) - 1)
+        rank = (width - _bit_length(rest) + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+        return self
+
+    def merge(self, other):
+        """
+        Fold another sketch of the same precision into this one.
+
+        Parameters
+        ----------
+        other : HyperLogLog
+
+        Returns
+        -------
+        HyperLogLog
+            This sketch.
+        """
+        if other.p != self.p:
+            raise ValueError("Cannot merge HyperLogLog sketches of different precision.")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self):
+        """
+        Return the estimated number of distinct values added.
+
+        Returns
+        -------
+        float
+        """
+        m = self.m
+        if m >= 128:
+            alpha = 0.7213 / (1 + 1.079 / m)
+        else:
+            alpha = {16: 0.673, 32: 0.697, 64: 0.709}[m]
+        raw = alpha * m * m / np.sum(np.exp2(-self.registers.astype(np.float64)))
+
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            # linear counting is more accurate for small cardinalities
+            return m * math.log(m / zeros)
+        return float(raw)
+
+    def __len__(self):
+        return int(round(self.estimate()))
+
+
+def approx_nunique(series, error=0.01, dropna=True):
+    """
+    Estimate `Series.nunique()` with a HyperLogLog sketch.
+
+    Parameters
+    ----------
+    series : pd.Series
+        The column to count.
+    error : float, optional
+        Target relative error of the estimate. Default is 0.01.
+    dropna : bool, optional
+        Whether to exclude nulls from the count. Default is True.
+
+    Returns
+    -------
+    int
+        Estimated number of distinct values.
+    """
+    na_mask = series.isna().to_numpy()
+    hll = HyperLogLog(error).update_hashes(hash_values(series)[~na_mask])
+    count = len(hll)
+    if not dropna and na_mask.any():
+        count += 1
+    return count
+
+
+# compactor capacity per unit of rank error; calibrated so that the largest
+# rank error over all quantiles stays below `error` in repeated trials
+KLL_CAPACITY_FACTOR = 4.0
+
+# each lower compactor level holds this fraction of the level above
+KLL_DECAY = 2 / 3
+
+
+def _float_values(values):
+    """Non-null values of a Series or array as a float64 array."""
+    if isinstance(values, (pd.Series, pd.Index)):
+        values = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    values = np.asarray(values, dtype=np.float64)
+    return values[~np.isnan(values)]
+
+
+class QuantileSketch:
+    """
+    KLL sketch for approximate quantiles of a numeric column in bounded memory.
+
+    Values are kept in a stack of compactors: when a level fills up it is
+    sorted and every other value (from a random offset) moves up a level,
+    where it stands for twice as many values. Any quantile is then answered
+    within a rank error of about `error` (e.g. the 0.25 quantile of a
+    million values lies between ranks 240,000 and 260,000 for
+    ``error=0.01``), using O(1 / error) memory regardless of the number of
+    values. Until the first compaction the sketch holds every value and
+    answers exactly, matching `pd.Series.quantile`. Sketches built with the
+    same error on different chunks or partitions can be merged.
+
+    Count, mean, standard deviation, min and max are tracked exactly.
+
+    Parameters
+    ----------
+    error : float, optional
+        Target rank error as a fraction of the number of values. Default is
+        0.01 (a few thousand stored values).
+    random_state : int, optional
+        Seed for the compaction offsets. Default is 0.
+
+    Examples
+    --------
+    >>> sketch = QuantileSketch(error=0.01).update(np.arange(1_000_000))
+    >>> abs(sketch.quantile(0.5) - 500_000) < 10_000
+    True
+    """
+
+    def __init__(self, error=0.01, random_state=0):
+        if not 0 < error < 1:
+            raise ValueError("error must be between 0 and 1.")
+        self.error = error
+        self.k = max(8, math.ceil(KLL_CAPACITY_FACTOR / error))
+        self.levels = [np.zeros(0)]
+        self.count = 0
+        self.min = np.nan
+        self.max = np.nan
+        self.mean = 0.0
+        self.m2 = 0.0
+        self._rng = np.random.default_rng(random_state)
+
+    def _capacity(self, level):
+        depth = len(self.levels) - 1 - level
+        return max(2, math.ceil(self.k * KLL_DECAY**depth))
+
+    def _add_moments(self, count, mean, m2, low, high):
+        n = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / n
+        self.m2 += m2 + delta**2 * self.count * count / n
+        self.count = n
+        self.min = low if np.isnan(self.min) else min(self.min, low)
+        self.max = high if np.isnan(self.max) else max(self.max, high)
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.zeros(0))
+                items = np.sort(items)
+                # an odd item out stays at this level
+                keep = len(items) % 2
+                offset = keep + int(self._rng.integers(2))
+                self.levels[level] = items[:keep]
+                self.levels[level + 1] = np.concatenate(
+                    [self.levels[level + 1], items[offset::2]]
+                )
+            level += 1
+
+    def update(self, values):
+        """
+        Add the values of a Series or array to the sketch.
+
+        Parameters
+        ----------
+        values : pd.Series, pd.Index or array-like
+            Numeric values. Nulls are ignored.
+
+        Returns
+        -------
+        QuantileSketch
+            This sketch.
+        """
+        values = _float_values(values)
+        if len(values) == 0:
+            return self
+        self._add_moments(
+            len(values),
+            float(values.mean()),
+            float(values.var()) * len(values),
+            float(values.min()),
+            float(values.max()),
+        )
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """
+        Fold another sketch of the same error into this one.
+
+        Parameters
+        ----------
+        other : QuantileSketch
+
+        Returns
+        -------
+        QuantileSketch
+            This sketch.
+        """
+        if other.k != self.k:
+            raise ValueError("Cannot merge quantile sketches built with different errors.")
+        if other.count == 0:
+            return self
+        self._add_moments(other.count, other.mean, other.m2, other.min, other.max)
+        for level, items in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(np.zeros(0))
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self._compress()
+        return self
+
+    @property
+    def exact(self):
+        """True while the sketch still holds every value added."""
+        return len(self.levels) == 1
+
+    @property
+    def std(self):
+        """Sample standard deviation (ddof=1) of the values added."""
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else np.nan
+
+    def _weighted_items(self):
+        items = np.concatenate(self.levels)
+        weights = np.concatenate(
+            [np.full(len(level), 2**h, dtype=np.int64) for h, level in enumerate(self.levels)]
+        )
+        order = np.argsort(items, kind="stable")
+        return items[order], np.cumsum(weights[order])
+
+    def quantile(self, q=0.5):
+        """
+        Return approximate quantiles of the values added.
+
+        Parameters
+        ----------
+        q : float or array-like of float
+            Quantiles between 0 and 1.
+
+        Returns
+        -------
+        float or numpy.ndarray
+            NaN if the sketch is empty.
+        """
+        q_arr = np.asarray(q, dtype=np.float64)
+        if np.any((q_arr < 0) | (q_arr > 1)):
+            raise ValueError("Quantiles must be between 0 and 1.")
+        if self.count == 0:
+            result = np.full(q_arr.shape, np.nan)
+        elif self.exact:
+            result = np.quantile(self.levels[0], q_arr)
+        else:
+            items, cumulative = self._weighted_items()
+            rows = np.searchsorted(cumulative, q_arr * cumulative[-1], side="left")
+            result = items[np.minimum(rows, len(items) - 1)]
+            # the extremes are known exactly
+            result = np.where(q_arr == 0, self.min, np.where(q_arr == 1, self.max, result))
+        return float(result) if result.ndim == 0 else result
+
+    def rank(self, value):
+        """
+        Return the approximate fraction of values less than or equal to `value`.
+
+        Parameters
+        ----------
+        value : float
+
+        Returns
+        -------
+        float
+        """
+        if self.count == 0:
+            return np.nan
+        items, cumulative = self._weighted_items()
+        position = np.searchsorted(items, value, side="right")
+        return float(cumulative[position - 1] / cumulative[-1]) if position else 0.0
+
+    def describe(self, percentiles=(0.25, 0.5, 0.75)):
+        """
+        Summary statistics laid out like `pd.Series.describe()`.
+
+        Parameters
+        ----------
+        percentiles : sequence of float, optional
+            Percentiles to include. Default is the quartiles.
+
+        Returns
+        -------
+        pd.Series
+            count, mean, std, min, the percentiles and max. Percentiles are
+            approximate once the sketch has compacted; the rest is exact.
+        """
+        percentiles = list(percentiles)
+        labels = [f"{100 * p:g}%" for p in percentiles]
+        values = [float(self.count), self.mean if self.count else np.nan, self.std, self.min]
+        values += list(np.atleast_1d(self.quantile(percentiles))) + [self.max]
+        return pd.Series(values, index=["count", "mean", "std", "min", *labels, "max"])
+
+    def box_stats(self, threshold=1.5, label=None):
+        """
+        Box-plot statistics in the format of `matplotlib.axes.Axes.bxp`.
+
+        Parameters
+        ----------
+        threshold : float, optional
+            IQR multiplier for the whiskers. Default is 1.5.
+        label : str, optional
+            Label of the box.
+
+        Returns
+        -------
+        dict
+            'med', 'q1', 'q3', 'mean', 'whislo', 'whishi', 'fliers' and
+            'label'. The whiskers are the IQR bounds clipped to the data
+            range rather than the most extreme values inside them, and no
+            fliers are listed.
+        """
+        q1, median, q3 = self.quantile([0.25, 0.5, 0.75])
+        iqr = q3 - q1
+        return {
+            "label": label,
+            "med": median,
+            "q1": q1,
+            "q3": q3,
+            "mean": self.mean if self.count else np.nan,
+            "whislo": max(self.min, q1 - threshold * iqr),
+            "whishi": min(self.max, q3 + threshold * iqr),
+            "fliers": [],
+        }
+
+    def __len__(self):
+        return self.count
+
+
+def approx_quantile(series, q=0.5, error=0.01):
+    """
+    Estimate `Series.quantile(q)` with a `QuantileSketch`.
+
+    Parameters
+    ----------
+    series : pd.Series
+        A numeric column.
+    q : float or array-like of float, optional
+        Quantiles between 0 and 1. Default is 0.5.
+    error : float, optional
+        Target rank error of the estimate. Default is 0.01.
+
+    Returns
+    -------
+    float or numpy.ndarray
+    """
+    return QuantileSketch(error).update(series).quantile(q)
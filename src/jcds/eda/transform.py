@@ -1,6 +1,7 @@
 import pandas as pd
 import re
 
+from jcds.eda.datetime import parse_datetime_column
 from jcds.utils import deprecated 
 
 @deprecated(
@@ -309,7 +310,9 @@ def convert_to_datetime(dataframe, columns, format=None, errors="raise", inplace
     columns : str or list of str
         Column name or list of column names to convert.
     format : str, optional
-        Datetime format string to use, passed to pandas.to_datetime.
+        Datetime format string to use, passed to pandas.to_datetime. If None, a
+        format recorded by `show_possible_datetime_columns` is reused when
+        available. "infer" sniffs the format from a sample first.
     errors : {'raise', 'coerce', 'ignore'}, default 'raise'
         How to handle parsing errors, passed to pandas.to_datetime.
     inplace : bool, optional
@@ -336,7 +339,7 @@ def convert_to_datetime(dataframe, columns, format=None, errors="raise", inplace
 
     # Convert each column
     for col in cols:
-        df[col] = pd.to_datetime(df[col], format=format, errors=errors)
+        df[col] = parse_datetime_column(df, col, format=format, errors=errors)
 
     return df
 
@@ -412,21 +415,8 @@ def convert_to_bool(dataframe, columns, true_values=None, false_values=None, err
     if missing:
         raise KeyError(f"Columns not found in DataFrame: {missing}")
 
-    default_true = {'true', '1', 'yes', 'y', 't'}
-    default_false = {'false', '0', 'no', 'n', 'f'}
-    trues = set(v.lower() for v in (true_values or default_true))
-    falses = set(v.lower() for v in (false_values or default_false))
+    from jcds.transform.convert import _bool_series
 
     for col in cols:
-        series = df[col].astype(str).str.strip().str.lower()
-        result = pd.Series(pd.NA, index=series.index, dtype='boolean')
-        mask_true = series.isin(trues)
-        mask_false = series.isin(falses)
-        result[mask_true] = True
-        result[mask_false] = False
-        unknown = ~(mask_true | mask_false)
-        if errors == 'raise' and unknown.any():
-            bad_vals = series[unknown].unique()
-            raise ValueError(f"Unrecognized boolean values in column {col}: {bad_vals}")
-        df[col] = result
+        df[col] = _bool_series(df[col], true_values, false_values, errors)
     return df
\ No newline at end of file
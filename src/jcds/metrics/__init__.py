@@ -1,10 +1,10 @@
 import inspect
 
 # Import your functions from internal files
-from .confusion import mc_confusion
+from .confusion import mc_confusion, ConfusionAccumulator, confusion_from_file
 
 
-__all__ = ["mc_confusion"]
+__all__ = ["mc_confusion", "ConfusionAccumulator", "confusion_from_file"]
 
 
 # Dynamically generated help function
@@ -1,16 +1,64 @@
 import pandas as pd
 import numpy as np
 
-def mc_confusion(cm, rnd=5):
+
+METRICS = ['Accuracy', 'Error rate', 'Sensitivity (Recall)',
+           'Specificity', 'Precision', 'F1', 'F2', 'F0.5']
+
+
+def _ratio(numerator, denominator):
+    """Elementwise numerator / denominator, 0 where the denominator is 0."""
+    numerator = np.asarray(numerator, dtype=np.float64)
+    denominator = np.asarray(denominator, dtype=np.float64)
+    out = np.zeros(np.broadcast(numerator, denominator).shape)
+    return np.divide(numerator, denominator, out=out, where=denominator != 0)
+
+
+def _fbeta(precision, recall, beta):
+    beta2 = beta ** 2
+    return _ratio((1 + beta2) * precision * recall, beta2 * precision + recall)
+
+
+def _rate_metrics(tp, fp, fn, tn):
+    """All metrics of `METRICS` for arrays of one-vs-rest counts."""
+    total = tp + fp + fn + tn
+    accuracy = _ratio(tp + tn, total)
+    recall = _ratio(tp, tp + fn)
+    precision = _ratio(tp, tp + fp)
+    return {
+        'Accuracy': accuracy,
+        'Error rate': 1 - accuracy,
+        'Sensitivity (Recall)': recall,
+        'Specificity': _ratio(tn, tn + fp),
+        'Precision': precision,
+        'F1': _fbeta(precision, recall, 1),
+        'F2': _fbeta(precision, recall, 2),
+        'F0.5': _fbeta(precision, recall, 0.5),
+    }
+
+
+def mc_confusion(cm, rnd=5, averages=False, labels=None, verbose=True):
     """
     Calculate and return various performance metrics from a confusion matrix.
 
+    Every metric is computed for all classes at once from the diagonal, row
+    and column sums of the matrix.
+
     Parameters
     ----------
     cm : numpy.ndarray
-        Confusion matrix as a NumPy array of any size.
+        Confusion matrix as a NumPy array of any size, with true classes as
+        rows and predicted classes as columns.
     rnd : int, optional
         Number of decimal places to round the performance metrics. Default is 5.
+    averages : bool, optional
+        If True, add 'Macro' (unweighted mean over classes), 'Micro' (from
+        the one-vs-rest counts summed over classes) and 'Weighted' (mean
+        weighted by each class's number of true rows) columns. Default is False.
+    labels : list, optional
+        Class names for the columns. Default is 'Class 0', 'Class 1', ...
+    verbose : bool, optional
+        Whether to print the confusion matrix. Default is True.
 
     Returns
     -------
@@ -32,46 +80,198 @@ def mc_confusion(cm, rnd=5):
     >>> cm = np.array([[50, 10, 5],
     ...                [5, 35, 5],
     ...                [5, 10, 40]])
-    >>> cm_performance(cm)
+    >>> mc_confusion(cm, averages=True)
 
     """
-
-    # Initialize lists to hold metrics for each class
+    cm = np.asarray(cm)
     classes = cm.shape[0]
-    metrics = ['Accuracy', 'Error rate', 'Sensitivity (Recall)', 
-               'Specificity', 'Precision', 'F1', 'F2', 'F0.5']
-    performance_dict = {metric: [] for metric in metrics}
-
-    # Calculate metrics for each class
-    for i in range(classes):
-        TP = cm[i, i]
-        FN = np.sum(cm[i, :]) - TP
-        FP = np.sum(cm[:, i]) - TP
-        TN = np.sum(cm) - (TP + FP + FN)
-
-        accuracy = (TP + TN) / np.sum(cm)
-        error_rate = 1 - accuracy
-        sensitivity_recall = TP / (TP + FN) if (TP + FN) != 0 else 0
-        specificity = TN / (TN + FP) if (TN + FP) != 0 else 0
-        precision = TP / (TP + FP) if (TP + FP) != 0 else 0
-        f1 = (2 * precision * sensitivity_recall) / (precision + sensitivity_recall) if (precision + sensitivity_recall) != 0 else 0
-        f2 = (5 * precision * sensitivity_recall) / ((4 * precision) + sensitivity_recall) if ((4 * precision) + sensitivity_recall) != 0 else 0
-        f05 = (1.25 * precision * sensitivity_recall) / ((0.25 * precision) + sensitivity_recall) if ((0.25 * precision) + sensitivity_recall) != 0 else 0
-
-        performance_dict['Accuracy'].append(accuracy)
-        performance_dict['Error rate'].append(error_rate)
-        performance_dict['Sensitivity (Recall)'].append(sensitivity_recall)
-        performance_dict['Specificity'].append(specificity)
-        performance_dict['Precision'].append(precision)
-        performance_dict['F1'].append(f1)
-        performance_dict['F2'].append(f2)
-        performance_dict['F0.5'].append(f05)
-
-    # Convert to DataFrame with classes as columns
-    performance_df = pd.DataFrame(performance_dict, 
-                                  index=[f'Class {i}' for i in range(classes)])
-    performance_df = performance_df.T.round(rnd)  # Transpose and round
-
-    print("Confusion Matrix:")
-    print(cm)
+    if labels is None:
+        labels = [f'Class {i}' for i in range(classes)]
+
+    # one-vs-rest counts for every class from three reductions
+    tp = np.diag(cm)
+    support = cm.sum(axis=1)
+    fn = support - tp
+    fp = cm.sum(axis=0) - tp
+    tn = cm.sum() - (tp + fp + fn)
+
+    performance = _rate_metrics(tp, fp, fn, tn)
+    performance_df = pd.DataFrame(performance, index=list(labels)).T
+
+    if averages:
+        micro = _rate_metrics(tp.sum(), fp.sum(), fn.sum(), tn.sum())
+        weights = support if support.sum() else None
+        performance_df['Macro'] = [performance[name].mean() for name in METRICS]
+        performance_df['Micro'] = [float(micro[name]) for name in METRICS]
+        performance_df['Weighted'] = [
+            np.average(performance[name], weights=weights) for name in METRICS
+        ]
+
+    performance_df = performance_df.round(rnd)
+
+    if verbose:
+        print("Confusion Matrix:")
+        print(cm)
     return performance_df
+
+
+class ConfusionAccumulator:
+    """
+    Build a confusion matrix incrementally from batches of labels.
+
+    Each batch is counted with a single `np.bincount`, so only the current
+    batch of labels is held in memory. Accumulators built on separate parts
+    of the data can be combined with `merge`.
+
+    Parameters
+    ----------
+    labels : list, optional
+        The classes, in matrix order. Labels outside this list raise an
+        error. If None, labels must be non-negative integers, which are
+        used as matrix positions; the matrix grows to the largest one seen.
+
+    Attributes
+    ----------
+    matrix : numpy.ndarray
+        Counts with true classes as rows and predicted classes as columns.
+    count : int
+        Number of (true, predicted) pairs added.
+
+    Examples
+    --------
+    >>> acc = ConfusionAccumulator()
+    >>> for batch in batches:
+    ...     acc.update(batch["y"], batch["pred"])
+    >>> acc.metrics(averages=True)
+    """
+
+    def __init__(self, labels=None):
+        self.labels = None if labels is None else pd.Index(labels)
+        n_classes = 0 if labels is None else len(self.labels)
+        self.matrix = np.zeros((n_classes, n_classes), dtype=np.int64)
+        self.count = 0
+
+    def _codes(self, values):
+        values = np.asarray(values)
+        if self.labels is not None:
+            codes = self.labels.get_indexer(values)
+            if (codes < 0).any():
+                unknown = pd.unique(values[codes < 0])[:5]
+                raise ValueError(f"Labels not in `labels`: {list(unknown)}")
+            return codes
+        if not np.issubdtype(values.dtype, np.integer) or (len(values) and values.min() < 0):
+            raise ValueError("Labels must be non-negative integers unless `labels` is given.")
+        return values.astype(np.int64, copy=False)
+
+    def _grow(self, n_classes):
+        if n_classes > len(self.matrix):
+            grown = np.zeros((n_classes, n_classes), dtype=np.int64)
+            grown[: len(self.matrix), : len(self.matrix)] = self.matrix
+            self.matrix = grown
+
+    def update(self, y_true, y_pred):
+        """
+        Add a batch of true and predicted labels.
+
+        Parameters
+        ----------
+        y_true, y_pred : array-like
+            Labels of equal length.
+
+        Returns
+        -------
+        ConfusionAccumulator
+            This accumulator.
+        """
+        true_codes = self._codes(y_true)
+        pred_codes = self._codes(y_pred)
+        if len(true_codes) != len(pred_codes):
+            raise ValueError("y_true and y_pred must have the same length.")
+        if not len(true_codes):
+            return self
+        if self.labels is None:
+            self._grow(int(max(true_codes.max(), pred_codes.max())) + 1)
+        n_classes = len(self.matrix)
+        # one flat count over (true, pred) cells instead of a loop per class
+        cells = true_codes * n_classes + pred_codes
+        self.matrix += np.bincount(cells, minlength=n_classes * n_classes).reshape(
+            n_classes, n_classes
+        )
+        self.count += len(true_codes)
+        return self
+
+    def merge(self, other):
+        """
+        Fold another accumulator into this one.
+
+        Parameters
+        ----------
+        other : ConfusionAccumulator
+
+        Returns
+        -------
+        ConfusionAccumulator
+            This accumulator.
+        """
+        if (self.labels is None) != (other.labels is None) or (
+            self.labels is not None and not self.labels.equals(other.labels)
+        ):
+            raise ValueError("Cannot merge accumulators with different labels.")
+        self._grow(len(other.matrix))
+        n_classes = len(other.matrix)
+        self.matrix[:n_classes, :n_classes] += other.matrix
+        self.count += other.count
+        return self
+
+    def metrics(self, rnd=5, averages=True):
+        """
+        Return `mc_confusion` metrics for the accumulated matrix.
+
+        Parameters
+        ----------
+        rnd : int, optional
+            Number of decimal places. Default is 5.
+        averages : bool, optional
+            Include the 'Macro', 'Micro' and 'Weighted' columns. Default is True.
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        labels = None if self.labels is None else list(self.labels)
+        return mc_confusion(
+            self.matrix, rnd=rnd, averages=averages, labels=labels, verbose=False
+        )
+
+
+def confusion_from_file(
+    filepath, y_true, y_pred, labels=None, chunksize=1_000_000, file_type=None
+):
+    """
+    Count a confusion matrix from two label columns of a CSV or Parquet file.
+
+    Only the two columns are read, one chunk at a time.
+
+    Parameters
+    ----------
+    filepath : str or Path
+        Path to a CSV or Parquet file.
+    y_true, y_pred : str
+        Names of the true and predicted label columns.
+    labels : list, optional
+        Passed to `ConfusionAccumulator`.
+    chunksize : int, optional
+        Number of rows per chunk. Default is 1,000,000.
+    file_type : {'csv', 'parquet'} or None, optional
+        File format. If None, inferred from the file extension.
+
+    Returns
+    -------
+    ConfusionAccumulator
+    """
+    from jcds.eda.profile import iter_file_chunks
+
+    accumulator = ConfusionAccumulator(labels)
+    for chunk in iter_file_chunks(filepath, chunksize, file_type, columns=[y_true, y_pred]):
+        accumulator.update(chunk[y_true].to_numpy(), chunk[y_pred].to_numpy())
+    return accumulator
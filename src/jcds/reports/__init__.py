@@ -3,8 +3,16 @@ import jcds.utils
 
 # Import your functions from internal files
 from .reports import data_info, data_cardinality, data_quality, catvar_report
+from jcds.eda.data_profile import DataProfile
 
 help = jcds.utils._make_module_help(sys.modules[__name__])
 
 # Declare what this module exports
-__all__ = ["data_info", "data_cardinality", "data_quality", "catvar_report", "help"]
+__all__ = [
+    "data_info",
+    "data_cardinality",
+    "data_quality",
+    "catvar_report",
+    "DataProfile",
+    "help",
+]
@@ -1,13 +1,13 @@
-import pandas as pd
+from pathlib import Path
 
 # from IPython.display import display, HTML
-from tabulate import tabulate
 
 from jcds.eda import (
     show_memory_use,
     show_shape,
     show_dimensions,
     show_dupes,
+    show_file_dupes,
     show_convar,
     show_catvar,
     show_binary_list,
@@ -26,155 +26,273 @@ from jcds.eda import (
     count_total_na,
     count_unique_values,
 )
+from jcds.eda.cache import cached
+from jcds.eda.data_profile import DataProfile, register_renderer
+from jcds.eda.profile import profile_dataframe, profile_file
 
 # from jcds.utils.formatting import render_html_block
 
 
+def _profile_source(dataframe, chunksize, **kwargs):
+    """
+    Profile a DataFrame, or stream a CSV/Parquet file path in chunks.
+
+    Returns the frame the dtype-based helpers should look at (an empty
+    schema frame for files) together with its `FrameProfile`.
+    """
+    if isinstance(dataframe, (str, Path)):
+        profile = profile_file(dataframe, chunksize=chunksize, **kwargs)
+        return profile.schema(), profile
+    return dataframe, profile_dataframe(dataframe, **kwargs)
+
+
+def _count_dupes(source, dataframe, chunksize):
+    """Count duplicate rows of an in-memory frame or, streaming, of a file."""
+    if isinstance(source, (str, Path)):
+        return show_file_dupes(source, chunksize=chunksize)
+    return show_dupes(dataframe)
+
+
 
-def data_info(dataframe, show_columns=True):
+def data_info(dataframe, show_columns=True, chunksize=100_000, verbose=True):
     """
     Summarize the dataset's shape, memory usage, duplicates, and variable types.
 
     Parameters
     ----------
-    dataframe : pandas.DataFrame
-        The input dataset.
+    dataframe : pandas.DataFrame or str or Path
+        The input dataset, or the path to a CSV or Parquet file. Files are
+        streamed in chunks, so they never need to fit in memory.
 
     show_columns : bool, optional
         Whether to display the list of columns in each category.
 
+    chunksize : int, optional
+        Rows per chunk when `dataframe` is a file path. Default is 100,000.
+
+    verbose : bool, optional
+        Whether to print the report. Default is True.
+
     Returns
     -------
-    None
-        Prints summary information to the console.
+    DataProfile
+        The computed summary; the printed report is rendered from it.
     """
-    # Threshold constants
-    ID_LIKE_COLS_THRESHOLD = 0.95
-
-    print("\nSHAPE:")
-    memory_use = show_memory_use(dataframe)
-    shape = show_shape(dataframe)
-    print(f"There are {shape[0]} rows and {shape[1]} columns ({memory_use:.2f} MB).")
+    result = _data_info(dataframe, chunksize)
+    if verbose:
+        result.show(show_columns)
+    return result
 
-    print("\nDUPLICATES:")
-    dupes = show_dupes(dataframe)
-    print(f"There are {dupes} duplicated rows.")
 
-    print("\nCOLUMNS/VARIABLES:")
+@cached
+def _data_info(dataframe, chunksize):
+    """Compute the `data_info` profile; cached when caching is enabled."""
+    # Threshold constants
+    ID_LIKE_COLS_THRESHOLD = 0.95
 
-    print("Column dType Summary:")
-    dtype_summary = get_dtype_summary(dataframe)
-    for key, value in dtype_summary.items():
+    source = dataframe
+    dataframe, profile = _profile_source(dataframe, chunksize)
+    shape = show_shape(dataframe, profile=profile)
+
+    result = DataProfile(
+        "data_info",
+        {
+            "rows": shape[0],
+            "columns": shape[1],
+            "memory_mb": show_memory_use(dataframe, profile=profile),
+            "duplicates": _count_dupes(source, dataframe, chunksize),
+            "dtype_summary": get_dtype_summary(dataframe, profile=profile),
+            "numeric_columns": show_convar(dataframe),
+            "categorical_columns": show_catvar(dataframe),
+            "datetime_columns": show_datetime_columns(dataframe),
+            "possible_datetime_columns": show_possible_datetime_columns(
+                dataframe, profile=profile
+            ),
+            "id_like_threshold": ID_LIKE_COLS_THRESHOLD,
+            "id_like_columns": count_id_like_columns(
+                dataframe, threshold=ID_LIKE_COLS_THRESHOLD, profile=profile
+            ),
+            "mixed_type_columns": show_mixed_type_columns(dataframe, profile=profile),
+        },
+    )
+    return result
+
+
+@register_renderer("data_info")
+def _render_data_info(result, show_columns):
+    s = result.summary
+    lines = [
+        "\nSHAPE:",
+        f"There are {s['rows']} rows and {s['columns']} columns ({s['memory_mb']:.2f} MB).",
+        "\nDUPLICATES:",
+        f"There are {s['duplicates']} duplicated rows.",
+        "\nCOLUMNS/VARIABLES:",
+        "Column dType Summary:",
+    ]
+    for key, value in s["dtype_summary"].items():
         if value > 0:
-            print(f" * {key}: {value}")
+            lines.append(f" * {key}: {value}")
 
-    convar = show_convar(dataframe)
-    print(f"There are {len(convar)} numerical (int/float/bool) variables.")
+    convar = s["numeric_columns"]
+    lines.append(f"There are {len(convar)} numerical (int/float/bool) variables.")
     if show_columns:
-        print(f" * Columns: {convar}")
+        lines.append(f" * Columns: {convar}")
 
-    catvar = show_catvar(dataframe)
-    print(f"There are {len(catvar)} categorical (nominal/ordinal) variables.")
+    catvar = s["categorical_columns"]
+    lines.append(f"There are {len(catvar)} categorical (nominal/ordinal) variables.")
     if show_columns:
-        print(f" * Columns: {catvar}")
+        lines.append(f" * Columns: {catvar}")
 
-    print("\nDATETIME COLUMNS:")
-    dt_cols = show_datetime_columns(dataframe)
-    possible_dt_cols = show_possible_datetime_columns(dataframe)
-    print(
-        f"There are {len(dt_cols)} datetime variables and {len(possible_dt_cols)} possible datetime variables."
+    lines.append("\nDATETIME COLUMNS:")
+    lines.append(
+        f"There are {len(s['datetime_columns'])} datetime variables and {len(s['possible_datetime_columns'])} possible datetime variables."
     )
 
-    print("\nOTHER COLUMN/VARIABLE INFO:")
-    id_like_columns = count_id_like_columns(dataframe, threshold=ID_LIKE_COLS_THRESHOLD)
-    print(
-        f"ID Like Columns (threshold = {ID_LIKE_COLS_THRESHOLD * 100}%): {id_like_columns}"
+    lines.append("\nOTHER COLUMN/VARIABLE INFO:")
+    lines.append(
+        f"ID Like Columns (threshold = {s['id_like_threshold'] * 100}%): {s['id_like_columns']}"
     )
 
-    mixed_columns = show_mixed_type_columns(dataframe)
-    print(f"Columns with mixed datatypes: {len(mixed_columns)}")
+    mixed_columns = s["mixed_type_columns"]
+    lines.append(f"Columns with mixed datatypes: {len(mixed_columns)}")
     if show_columns:
-        print(f" * Columns: {mixed_columns}")
-
-
-def data_cardinality(dataframe, show_columns=True):
+        lines.append(f" * Columns: {mixed_columns}")
+    return lines
+
+
+def data_cardinality(
+    dataframe,
+    show_columns=True,
+    chunksize=100_000,
+    approx=False,
+    error=0.01,
+    verbose=True,
+):
     """
     Summarizes the cardinality of the columns in the dataset.
 
     Parameters
     ----------
-    dataframe : pandas.DataFrame
-        The input dataset.
+    dataframe : pandas.DataFrame or str or Path
+        The input dataset, or the path to a CSV or Parquet file. Files are
+        streamed in chunks, so they never need to fit in memory.
 
     show_columns : bool, optional
         Whether to display the list of columns in each category.
 
+    chunksize : int, optional
+        Rows per chunk when `dataframe` is a file path. Default is 100,000.
+
+    approx : bool, optional
+        If True, estimate distinct counts with HyperLogLog sketches instead of
+        exact `nunique()` calls. Default is False.
+
+    error : float, optional
+        Target relative error of the sketches when `approx=True`. Default is 0.01.
+
+    verbose : bool, optional
+        Whether to print the report. Default is True.
+
     Returns
     -------
-    None
-        Prints summary information to the console.
+    DataProfile
+        The computed summary; the printed report is rendered from it.
     """
+    result = _data_cardinality(dataframe, chunksize, approx, error)
+    if verbose:
+        result.show(show_columns)
+    return result
+
+
+@cached
+def _data_cardinality(dataframe, chunksize, approx, error):
+    """Compute the `data_cardinality` profile; cached when caching is enabled."""
     # Threshold constants
     NEAR_CONST_THRESHOLD = 0.95
     LOW_CARD_MAX_UNIQUE = 10
     HIGH_CARD_PERCENT_UNIQUE = 90
 
-    print("CARDINALITY REPORT")
+    dataframe, profile = _profile_source(
+        dataframe, chunksize, approx=approx, error=error
+    )
+
+    result = DataProfile(
+        "data_cardinality",
+        {
+            "columns": show_shape(dataframe, profile=profile)[1],
+            "binary": show_binary_list(dataframe, profile=profile),
+            "constant_columns": show_constantvars(dataframe, profile=profile),
+            "near_constant_threshold": NEAR_CONST_THRESHOLD,
+            "near_constant_columns": show_nearconstvars(
+                dataframe, threshold=NEAR_CONST_THRESHOLD, verbose=False, profile=profile
+            ),
+            "low_cardinality_max_unique": LOW_CARD_MAX_UNIQUE,
+            "low_cardinality": show_lowcardvars(
+                dataframe, max_unique=LOW_CARD_MAX_UNIQUE, verbose=False, profile=profile
+            ),
+            "high_cardinality_percent": HIGH_CARD_PERCENT_UNIQUE,
+            "high_cardinality": show_highcardvars(
+                dataframe,
+                percent_unique=HIGH_CARD_PERCENT_UNIQUE,
+                verbose=False,
+                profile=profile,
+            ),
+        },
+    )
+    return result
 
-    shape = show_shape(dataframe)
-    print(f"\nTotal columns analyzed: {shape[1]}")
 
-    print("\n[BINARY COLUMNS]")
-    binary_list = show_binary_list(dataframe)
-    for key, value in binary_list.items():
+@register_renderer("data_cardinality")
+def _render_data_cardinality(result, show_columns):
+    s = result.summary
+    lines = ["CARDINALITY REPORT", f"\nTotal columns analyzed: {s['columns']}"]
+
+    lines.append("\n[BINARY COLUMNS]")
+    for key, value in s["binary"].items():
         total = len(value)
-        print(f"There are {total} {key.replace('_', ' ')}.")
+        lines.append(f"There are {total} {key.replace('_', ' ')}.")
         if show_columns:
             if total > 0:
-                print(f" * Columns: {value}")
+                lines.append(f" * Columns: {value}")
 
-    print("\n[CONSTANT/NEAR CONSTANT COLUMNS]")
-    const_var = show_constantvars(dataframe)
-    print(f"There are {len(const_var)} constant columns.")
+    lines.append("\n[CONSTANT/NEAR CONSTANT COLUMNS]")
+    const_var = s["constant_columns"]
+    lines.append(f"There are {len(const_var)} constant columns.")
     if show_columns:
         if len(const_var) > 0:
-            print(f" * Columns: {const_var}")
+            lines.append(f" * Columns: {const_var}")
 
-    near_constvar = show_nearconstvars(
-        dataframe, threshold=NEAR_CONST_THRESHOLD, verbose=False
-    )
-    print(
-        f"There are {len(near_constvar)} near-constant columns with >= {NEAR_CONST_THRESHOLD * 100:.0f}% of values being the same."
+    threshold = s["near_constant_threshold"]
+    near_constvar = s["near_constant_columns"]
+    lines.append(
+        f"There are {len(near_constvar)} near-constant columns with >= {threshold * 100:.0f}% of values being the same."
     )
     if show_columns:
         if len(near_constvar) > 0:
-            print(f" * Columns: {near_constvar}")
+            lines.append(f" * Columns: {near_constvar}")
 
-    print("\n[LOW CARDINALITY CATEGORICAL COLUMNS]")
-    lowcardvars = show_lowcardvars(
-        dataframe, max_unique=LOW_CARD_MAX_UNIQUE, verbose=False
-    )
-    print(
-        f" * There are {len(lowcardvars)} low cardinality columns with <= {LOW_CARD_MAX_UNIQUE} unique values."
+    lines.append("\n[LOW CARDINALITY CATEGORICAL COLUMNS]")
+    lowcardvars = s["low_cardinality"]
+    lines.append(
+        f" * There are {len(lowcardvars)} low cardinality columns with <= {s['low_cardinality_max_unique']} unique values."
     )
     if show_columns:
-        print("Columns:")
+        lines.append("Columns:")
         for col, n in lowcardvars:
-            print(f" * {col}: {n} unique values")
+            lines.append(f" * {col}: {n} unique values")
 
-    print("\n[HIGH CARDINALITY CATEGORICAL COLUMNS]")
-    highcardvars = show_highcardvars(
-        dataframe, percent_unique=HIGH_CARD_PERCENT_UNIQUE, verbose=False
-    )
-    print(
-        f" * There are {len(highcardvars)} high cardinality variables with >={HIGH_CARD_PERCENT_UNIQUE}% unique values."
+    lines.append("\n[HIGH CARDINALITY CATEGORICAL COLUMNS]")
+    highcardvars = [tuple(item) for item in s["high_cardinality"]]
+    lines.append(
+        f" * There are {len(highcardvars)} high cardinality variables with >={s['high_cardinality_percent']}% unique values."
     )
     if show_columns:
         if len(highcardvars) > 0:
-            print(f" * Columns: {highcardvars}")
+            lines.append(f" * Columns: {highcardvars}")
+    return lines
 
 
-def data_quality(dataframe, show_columns=True):
+def data_quality(dataframe, show_columns=True, chunksize=100_000, verbose=True):
     """
     Print a comprehensive data quality report for the given DataFrame.
 
@@ -188,97 +306,152 @@ def data_quality(dataframe, show_columns=True):
     - Mixed data types within columns
     - High-cardinality categorical columns
 
+    Every column is scanned once by `profile_dataframe`; the individual checks
+    read their statistics from that profile.
+
     Parameters
     ----------
-    dataframe : pandas.DataFrame
-        The input dataset to evaluate.
+    dataframe : pandas.DataFrame or str or Path
+        The input dataset to evaluate, or the path to a CSV or Parquet file.
+        Files are streamed in chunks, so they never need to fit in memory.
 
     show_columns : bool, optional (default=False)
         If True, prints the list of columns associated with each quality issue (e.g. columns with missing values, constants).
 
+    chunksize : int, optional
+        Rows per chunk when `dataframe` is a file path. Default is 100,000.
+
+    verbose : bool, optional
+        Whether to print the report. Default is True.
+
     Returns
     -------
-    None
-        Outputs the report directly to the console.
+    DataProfile
+        The computed diagnostics; the printed report is rendered from it.
     """
+    result = _data_quality(dataframe, chunksize)
+    if verbose:
+        result.show(show_columns)
+    return result
+
+
+@cached
+def _data_quality(dataframe, chunksize):
+    """Compute the `data_quality` profile; cached when caching is enabled."""
     NEAR_CONSTANT_COLUMNS_THRESHOLD = 0.95
     HIGH_CARDINALITY_PERCENT = 60
-    print("DATA QUALITY REPORT")
-    print("====================")
+    source = dataframe
+    dataframe, profile = _profile_source(dataframe, chunksize)
+
+    rows, cols, dataframe_size, memory_usage = show_dimensions(
+        dataframe, profile=profile
+    )
+    result = DataProfile(
+        "data_quality",
+        {
+            "size": dataframe_size,
+            "memory_mb": memory_usage,
+            "rows": rows,
+            "columns": cols,
+            "total_missing": count_total_na(dataframe, profile=profile),
+            "rows_missing_any": count_rows_with_any_na(dataframe, profile=profile),
+            "rows_missing_all": count_rows_with_all_na(dataframe, profile=profile),
+            "duplicates": _count_dupes(source, dataframe, chunksize),
+            "missing_columns": show_missing_summary(
+                dataframe, sort=True, threshold=0.0, profile=profile
+            ),
+            "constant_columns": show_constantvars(dataframe, profile=profile),
+            "near_constant_threshold": NEAR_CONSTANT_COLUMNS_THRESHOLD,
+            "near_constant_columns": show_nearconstvars(
+                dataframe,
+                threshold=NEAR_CONSTANT_COLUMNS_THRESHOLD,
+                verbose=False,
+                profile=profile,
+            ),
+            "mixed_type_columns": show_mixed_type_columns(dataframe, profile=profile),
+            "high_cardinality_percent": HIGH_CARDINALITY_PERCENT,
+            "high_cardinality": show_highcardvars(
+                dataframe,
+                percent_unique=HIGH_CARDINALITY_PERCENT,
+                verbose=False,
+                profile=profile,
+            ),
+        },
+    )
+    return result
 
-    # shape
-    rows, cols, dataframe_size, memory_usage = show_dimensions(dataframe)
-    print(f"\n * Total entries (rows * cols): {dataframe_size}")
-    print(f" * Memory usage: {memory_usage} MB")
-    print(f" * Rows: {rows}")
-    print(f" * Columns: {cols}")
 
-    # missing data summary
-    print("\nMISSING DATA:")
+@register_renderer("data_quality")
+def _render_data_quality(result, show_columns):
+    s = result.summary
+    lines = [
+        "DATA QUALITY REPORT",
+        "====================",
+        f"\n * Total entries (rows * cols): {s['size']}",
+        f" * Memory usage: {s['memory_mb']} MB",
+        f" * Rows: {s['rows']}",
+        f" * Columns: {s['columns']}",
+    ]
 
-    total_missing = count_total_na(dataframe)
-    print(
-        f" * Total entries: {total_missing} missing ({(total_missing / dataframe_size) * 100:.1f}%)"
+    # missing data summary
+    lines.append("\nMISSING DATA:")
+    total_missing = s["total_missing"]
+    lines.append(
+        f" * Total entries: {total_missing} missing ({(total_missing / s['size']) * 100:.1f}%)"
     )
 
     # missing rows
-    print("\nROWS:")
-    print("----------")
-    rows_missing_any = count_rows_with_any_na(dataframe)
-    rows_missing_all = count_rows_with_all_na(dataframe)
-    print(f" * Rows missing any: {rows_missing_any}")
-    print(f" * Rows missing all: {rows_missing_all}")
+    lines.append("\nROWS:")
+    lines.append("----------")
+    lines.append(f" * Rows missing any: {s['rows_missing_any']}")
+    lines.append(f" * Rows missing all: {s['rows_missing_all']}")
 
     # duplicate rows
-    duplicates = show_dupes(dataframe)
-    print(f"\nDUPLICATES: {duplicates}")
+    lines.append(f"\nDUPLICATES: {s['duplicates']}")
 
     # missing columns
-    print("\nCOLUMNS:")
-    print("----------------")
-    missing_summary = show_missing_summary(dataframe, sort=True, threshold=0.0)
+    lines.append("\nCOLUMNS:")
+    lines.append("----------------")
+    missing_summary = s["missing_columns"]
     key_list = list(missing_summary.keys())
-    print(f"Columns missing any: {len(missing_summary)}")
+    lines.append(f"Columns missing any: {len(missing_summary)}")
     if show_columns and missing_summary:
         for key, value in missing_summary.items():
-            print(f"\t'{key}': {value[0]} missing ({value[1]:.1f}%)")
-        print(f"Column list: {key_list}")
+            lines.append(f"\t'{key}': {value[0]} missing ({value[1]:.1f}%)")
+        lines.append(f"Column list: {key_list}")
 
     # constant columns
-    constant_cols = show_constantvars(dataframe)
-    print(f"\nCONSTANT: {len(constant_cols)}")
+    constant_cols = s["constant_columns"]
+    lines.append(f"\nCONSTANT: {len(constant_cols)}")
     if show_columns and constant_cols:
-        print(f"Column list: {constant_cols}")
+        lines.append(f"Column list: {constant_cols}")
 
     # near constant columns
-    near_constant_columns = show_nearconstvars(
-        dataframe, threshold=NEAR_CONSTANT_COLUMNS_THRESHOLD, verbose=False
-    )
-    print(f"\nNEAR CONSTANT: {len(near_constant_columns)}")
-    print(f"\t({NEAR_CONSTANT_COLUMNS_THRESHOLD * 100:.0f}% of values are the same)")
+    near_constant_columns = s["near_constant_columns"]
+    lines.append(f"\nNEAR CONSTANT: {len(near_constant_columns)}")
+    lines.append(f"\t({s['near_constant_threshold'] * 100:.0f}% of values are the same)")
     if show_columns and near_constant_columns:
-        print(f"\tColumn list: {near_constant_columns}")
+        lines.append(f"\tColumn list: {near_constant_columns}")
 
     # mixed data types
-    mixed_data_columns = show_mixed_type_columns(dataframe)
-    print(f"\nMIXED DATATYPES: {len(mixed_data_columns)}")
+    mixed_data_columns = s["mixed_type_columns"]
+    lines.append(f"\nMIXED DATATYPES: {len(mixed_data_columns)}")
     if show_columns and mixed_data_columns:
-        print(f"\tColumn list: {mixed_data_columns}")
+        lines.append(f"\tColumn list: {mixed_data_columns}")
 
     # high cardinality
-    high_card_columns = show_highcardvars(
-        dataframe, percent_unique=HIGH_CARDINALITY_PERCENT, verbose=False
-    )
-    print(f"\nHIGH CARDINALITY: {len(high_card_columns)}")
-    print(f"\t({HIGH_CARDINALITY_PERCENT}% >= unique values)")
+    high_card_columns = s["high_cardinality"]
+    lines.append(f"\nHIGH CARDINALITY: {len(high_card_columns)}")
+    lines.append(f"\t({s['high_cardinality_percent']}% >= unique values)")
     if show_columns and high_card_columns:
         for col in high_card_columns:
-            print(f"\t* '{col[0]}': {col[1]:.1f}%")
+            lines.append(f"\t* '{col[0]}': {col[1]:.1f}%")
 
     # outlier detection?
+    return lines
 
 
-def catvar_report(dataframe, columns=None):
+def catvar_report(dataframe, columns=None, verbose=True):
     """
     Display a summary report for categorical variables in a DataFrame.
 
@@ -289,26 +462,37 @@ def catvar_report(dataframe, columns=None):
     columns : str or list of str or None, optional
         Name of a single categorical column (str), a list of column names (list of str),
         or None to report on all detected categorical columns. Default is None.
+    verbose : bool, optional
+        Whether to print the report. Default is True.
 
     Returns
     -------
-    pandas.DataFrame or None
-        - If no valid categorical columns are selected, returns an empty DataFrame.
-        - Otherwise, prints a report for each column and returns None.
+    DataProfile
+        Per-column statistics under ``summary["features"]``; empty if no
+        valid categorical columns were selected.
 
     Notes
     -----
     - Detects categorical columns via `show_catvar(dataframe)`.
-    - Computes missing-value stats with `show_missing_summary(dataframe, sort=False, threshold=0.0)`.
-    - Computes unique counts and top two modes via `count_unique_values(dataframe, col)`.
+    - Profiles the selected columns once with `profile_dataframe`, then reads
+      missing-value stats (`show_missing_summary`) and unique counts and top two
+      modes (`count_unique_values`) from that profile.
     - The report includes, for each column:
         • Non-missing count and missing count (%).
         • Cardinality (number of unique values).
         • Top two modes with their frequencies and percentage of non-missing.
     - Docstring generated with assistance from ChatGPT
     """
+    result = _catvar_report(dataframe, columns)
+    if verbose:
+        result.show()
+    return result
+
+
+@cached
+def _catvar_report(dataframe, columns):
+    """Compute the `catvar_report` profile; cached when caching is enabled."""
     categorical_columns = show_catvar(dataframe)
-    columns_missing_values = show_missing_summary(dataframe, sort=False, threshold=0.0)
 
     if isinstance(columns, str):
         cols = [columns]
@@ -322,32 +506,58 @@ def catvar_report(dataframe, columns=None):
     for c in cols:
         if c in categorical_columns:
             valid_columns.append(c)
-    if not valid_columns:
-        print("No valid categorical columns selected.")
-        return pd.DataFrame()
 
     total_rows = len(dataframe)
+    features = {}
+    if valid_columns:
+        profile = profile_dataframe(dataframe[valid_columns])
+        columns_missing_values = show_missing_summary(
+            dataframe, sort=False, threshold=0.0, profile=profile
+        )
 
     for col in valid_columns:
 
         missing_count, pct_missing = columns_missing_values.get(col, (0, 0.0))
         # Calculate non_missing values
         non_missing = total_rows - missing_count
-        unique_values = count_unique_values(dataframe, col)
-        unique_count = unique_values[col]["unique_count"]
-        mode1 = unique_values[col]["top_modes"][0]
-        freq1 = mode1[1]
-        pct_freq1 = round(mode1[1] / non_missing * 100, 1)
-        mode2 = unique_values[col]["top_modes"][1]
-        freq2 = mode2[1]
-        pct_freq2 = round(mode2[1] / non_missing * 100, 1)
-
-        print(f"\nFeature: '{col}'")
-        print(f"===================================================================")
-        print(
-            f"Total: {non_missing}\t\t\tMissing: {missing_count} ({pct_missing*100}%)\t\t\tCardinality (Unique Values): {unique_count}"
+        unique_values = count_unique_values(dataframe, col, profile=profile)
+        modes = [
+            (value, freq, round(freq / non_missing * 100, 1))
+            for value, freq in unique_values[col]["top_modes"][:2]
+        ]
+        # a column with a single value has no second mode
+        modes += [(None, 0, 0.0)] * (2 - len(modes))
+
+        features[col] = {
+            "non_missing": non_missing,
+            "missing": missing_count,
+            "pct_missing": pct_missing,
+            "unique_count": unique_values[col]["unique_count"],
+            "modes": modes,
+        }
+
+    result = DataProfile(
+        "catvar_report", {"total_rows": total_rows, "features": features}
+    )
+    return result
+
+
+@register_renderer("catvar_report")
+def _render_catvar_report(result, show_columns):
+    s = result.summary
+    if not s["features"]:
+        return ["No valid categorical columns selected."]
+
+    lines = []
+    for col, stats in s["features"].items():
+        mode1, mode2 = stats["modes"][:2]
+        lines.append(f"\nFeature: '{col}'")
+        lines.append(f"===================================================================")
+        lines.append(
+            f"Total: {stats['non_missing']}\t\t\tMissing: {stats['missing']} ({stats['pct_missing']*100}%)\t\t\tCardinality (Unique Values): {stats['unique_count']}"
         )
-        print(f"Mode 1: {mode1[0]} \t\tFrequency: {freq1} ({pct_freq1}%)")
-        print(f"Mode 2: {mode2[0]} \t\tFequency: {freq2} ({pct_freq2}%)")
+        lines.append(f"Mode 1: {mode1[0]} \t\tFrequency: {mode1[1]} ({mode1[2]}%)")
+        lines.append(f"Mode 2: {mode2[0]} \t\tFequency: {mode2[1]} ({mode2[2]}%)")
 
-    print(f"\nTotal rows: {total_rows}")
+    lines.append(f"\nTotal rows: {s['total_rows']}")
+    return lines
@@ -1,11 +1,11 @@
 import sys
 import jcds.utils
 
-from .convert import to_int, to_float, to_numeric, to_str, to_categorical, to_bool, to_datetime, to_object
+from .convert import astype_plan, to_int, to_float, to_numeric, to_str, to_categorical, to_bool, to_datetime, to_object
 from .clean import clean_column_names, rename_column, delete_columns
 
 __all__ = [
-    "to_int", "to_float", "to_numeric", "to_str",
+    "astype_plan", "to_int", "to_float", "to_numeric", "to_str",
     "to_categorical", "to_bool", "to_datetime", "to_object",
     "clean_column_names", "rename_column", "delete_columns",
     "help",
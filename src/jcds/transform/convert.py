@@ -1,5 +1,206 @@
+import copy
+import inspect
+from functools import partial
+
+import numpy as np
 import pandas as pd
 
+from jcds.eda.datetime import parse_datetime_column
+from jcds.eda.parallel import map_columns
+
+
+# integer columns spanning fewer values than this are mapped by offset in to_bool
+SMALL_INT_RANGE = 256
+
+
+def _int_series(series, unsigned=False, errors="raise"):
+    kind = "unsigned" if unsigned else "integer"
+    return pd.to_numeric(series, downcast=kind, errors=errors)
+
+
+def _float_series(series, errors="raise"):
+    return pd.to_numeric(series, errors=errors, downcast="float")
+
+
+def _numeric_series(series, errors="raise", downcast=None):
+    return pd.to_numeric(series, errors=errors, downcast=downcast)
+
+
+def _str_series(series):
+    return series.astype(str)
+
+
+def _category_series(series, ordered=False):
+    return series.astype(pd.CategoricalDtype(ordered=ordered))
+
+
+def _bool_series(series, true_values=None, false_values=None, errors="raise"):
+    default_true = {"true", "1", "yes", "y", "t"}
+    default_false = {"false", "0", "no", "n", "f"}
+    trues = set(v.lower() for v in (true_values or default_true))
+    falses = set(v.lower() for v in (false_values or default_false))
+
+    # normalize the distinct values only, then broadcast back through the codes
+    values = series.to_numpy() if isinstance(series.dtype, np.dtype) else None
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        uniques = list(series.cat.categories) + [np.nan]  # code -1 (missing) takes the last slot
+    elif values is not None and values.dtype == bool:
+        codes = values.view(np.int8)
+        uniques = [False, True]
+    elif values is not None and values.dtype.kind in "iu" and len(values) and (
+        int(values.max()) - int(values.min()) < SMALL_INT_RANGE
+    ):
+        # flags such as 0/1: offsets into the value range, no hashing
+        low = int(values.min())
+        codes = values.astype(np.intp) - low
+        uniques = list(range(low, int(values.max()) + 1))
+    else:
+        codes, uniques = pd.factorize(series, use_na_sentinel=False)
+        uniques = list(uniques)
+    labels = np.array([str(v).strip().lower() for v in uniques], dtype=object)
+    state = np.full(len(labels), -1, dtype=np.int8)
+    state[[label in trues for label in labels]] = 1
+    state[[label in falses for label in labels]] = 0
+
+    by_row = state.take(codes)
+    unknown = by_row == -1
+    if errors == "raise" and unknown.any():
+        present = np.zeros(len(labels), dtype=bool)
+        present[codes] = True
+        bad_vals = labels[present & (state == -1)]
+        raise ValueError(f"Unrecognized boolean values in column {series.name}: {bad_vals}")
+    values = pd.arrays.BooleanArray(by_row == 1, unknown)
+    return pd.Series(values, index=series.index, name=series.name)
+
+
+def _datetime_series(series, format=None, errors="raise", attrs=None):
+    # formats recorded in (or sniffed into) `attrs` are shared with the caller's frame
+    frame = series.to_frame()
+    if attrs is not None:
+        frame.attrs = attrs
+    parsed = parse_datetime_column(frame, series.name, format=format, errors=errors)
+    if attrs is not None:
+        attrs.update(frame.attrs)
+    return parsed
+
+
+def _object_series(series):
+    return series.astype("object")
+
+
+# conversion name -> per-column converter, shared by astype_plan and the to_* functions
+CONVERSIONS = {
+    "int": _int_series,
+    "float": _float_series,
+    "numeric": _numeric_series,
+    "str": _str_series,
+    "category": _category_series,
+    "bool": _bool_series,
+    "datetime": _datetime_series,
+    "object": _object_series,
+}
+
+
+def _normalize_plan(dataframe, plan):
+    """Validate a conversion plan and return it as {column: (name, options)}."""
+    missing = set(plan) - set(dataframe.columns)
+    if missing:
+        raise ValueError(f"Columns not found in DataFrame: {missing}")
+    normalized = {}
+    for col, target in plan.items():
+        name, options = (target, {}) if isinstance(target, str) else target
+        if name not in CONVERSIONS:
+            raise ValueError(
+                f"Unknown conversion {name!r} for column {col!r}. Use one of {list(CONVERSIONS)}."
+            )
+        try:
+            inspect.signature(CONVERSIONS[name]).bind(None, **options)
+        except TypeError as e:
+            raise TypeError(
+                f"Invalid options for {name!r} conversion of column {col!r}: {e}"
+            ) from e
+        normalized[col] = (name, dict(options))
+    return normalized
+
+
+def _convert_column(series, plan):
+    name, options = plan[series.name]
+    return CONVERSIONS[name](series, **options)
+
+
+def _convert(dataframe, plan, attrs):
+    """Convert the planned columns of `dataframe` and return {column: Series}."""
+    datetime_cols = [col for col, (name, _) in plan.items() if name == "datetime"]
+    other_cols = [col for col in plan if col not in datetime_cols]
+
+    converted = dict(
+        zip(other_cols, map_columns(partial(_convert_column, plan=plan), dataframe, other_cols))
+    )
+    # parsed in this thread: formats sniffed with format="infer" are recorded in `attrs`
+    for col in datetime_cols:
+        converted[col] = _datetime_series(dataframe[col], attrs=attrs, **plan[col][1])
+    return converted
+
+
+def _apply(dataframe, plan, inplace=False):
+    """Run a normalized plan, in place or into a single new DataFrame."""
+    if inplace:
+        for col, series in _convert(dataframe, plan, dataframe.attrs).items():
+            dataframe[col] = series
+        return dataframe
+
+    attrs = copy.deepcopy(dataframe.attrs)
+    converted = _convert(dataframe, plan, attrs)
+    if not dataframe.columns.is_unique:
+        result = dataframe.copy()
+        for col, series in converted.items():
+            result[col] = series
+        return result
+    # one construction from the columns instead of a copy plus per-column writes
+    columns = {col: converted.get(col, series) for col, series in dataframe.items()}
+    result = pd.DataFrame(columns, index=dataframe.index, columns=dataframe.columns)
+    result.attrs = attrs
+    return result
+
+
+def astype_plan(dataframe, plan, inplace=False):
+    """
+    Apply several column conversions at once.
+
+    The plan is validated before any column is touched. Columns are then
+    converted from the original data (in parallel for large frames, see
+    `jcds.eda.set_executor`) and the result is built in a single DataFrame
+    construction, instead of one full copy per `to_*` call.
+
+    Parameters
+    ----------
+    dataframe : pd.DataFrame
+    plan : dict
+        Maps each column to a conversion name ('int', 'float', 'numeric',
+        'str', 'category', 'bool', 'datetime' or 'object'), or to a
+        ``(name, options)`` tuple whose options are those of the matching
+        `to_*` function, e.g. ``{"age": "int", "joined": ("datetime",
+        {"format": "%Y-%m-%d"}), "active": ("bool", {"errors": "coerce"})}``.
+    inplace : bool, optional
+        If True, modify in place. Default is False.
+
+    Returns
+    -------
+    pd.DataFrame or None
+
+    Raises
+    ------
+    ValueError
+        If a column is missing or a conversion name is unknown.
+    TypeError
+        If a conversion is given options it does not accept.
+    """
+    plan = _normalize_plan(dataframe, plan)
+    result = _apply(dataframe, plan, inplace)
+    if not inplace:
+        return result
+
 
 def to_int(dataframe, columns=None, unsigned=False, errors="raise", inplace=False):
     """
@@ -21,19 +222,16 @@ def to_int(dataframe, columns=None, unsigned=False, errors="raise", inplace=Fals
     -------
     pd.DataFrame or None
     """
-    df = dataframe if inplace else dataframe.copy()
-
     if columns is None:
-        cols = df.select_dtypes(include="number").columns
+        cols = dataframe.select_dtypes(include="number").columns
     else:
-        missing = set(columns) - set(df.columns)
+        missing = set(columns) - set(dataframe.columns)
         if missing:
             raise ValueError(f"Columns not found in DataFrame: {missing}")
         cols = columns
 
-    kind = "unsigned" if unsigned else "integer"
-    for col in cols:
-        df[col] = pd.to_numeric(df[col], downcast=kind, errors=errors)
+    options = {"unsigned": unsigned, "errors": errors}
+    df = _apply(dataframe, {col: ("int", options) for col in cols}, inplace)
 
     if not inplace:
         return df
@@ -57,15 +255,13 @@ def to_float(dataframe, columns, errors="raise", inplace=False):
     -------
     pd.DataFrame or None
     """
-    df = dataframe if inplace else dataframe.copy()
     cols = [columns] if isinstance(columns, str) else list(columns)
 
-    missing = set(cols) - set(df.columns)
+    missing = set(cols) - set(dataframe.columns)
     if missing:
         raise ValueError(f"Columns not found in DataFrame: {missing}")
 
-    for col in cols:
-        df[col] = pd.to_numeric(df[col], errors=errors, downcast="float")
+    df = _apply(dataframe, {col: ("float", {"errors": errors}) for col in cols}, inplace)
 
     if not inplace:
         return df
@@ -90,17 +286,14 @@ def to_numeric(dataframe, columns, errors="raise", downcast=None, inplace=False)
     -------
     pd.DataFrame or None
     """
-    df = dataframe if inplace else dataframe.copy()
     cols = [columns] if isinstance(columns, str) else list(columns)
 
-    missing = set(cols) - set(df.columns)
+    missing = set(cols) - set(dataframe.columns)
     if missing:
         raise KeyError(f"Columns not found in DataFrame: {missing}")
 
-    for col in cols:
-        df[col] = pd.to_numeric(df[col], errors=errors, downcast=downcast)
-
-    return df
+    options = {"errors": errors, "downcast": downcast}
+    return _apply(dataframe, {col: ("numeric", options) for col in cols}, inplace)
 
 
 def to_str(dataframe, columns, inplace=False):
@@ -119,15 +312,13 @@ def to_str(dataframe, columns, inplace=False):
     -------
     pd.DataFrame or None
     """
-    df = dataframe if inplace else dataframe.copy()
     cols = [columns] if isinstance(columns, str) else list(columns)
 
-    missing = set(cols) - set(df.columns)
+    missing = set(cols) - set(dataframe.columns)
     if missing:
         raise ValueError(f"Columns not found in DataFrame: {missing}")
 
-    for col in cols:
-        df[col] = df[col].astype(str)
+    df = _apply(dataframe, {col: ("str", {}) for col in cols}, inplace)
 
     if not inplace:
         return df
@@ -151,18 +342,15 @@ def to_categorical(dataframe, columns=None, ordered=False, inplace=False):
     -------
     pd.DataFrame or None
     """
-    df = dataframe if inplace else dataframe.copy()
-
     if columns is None:
-        cols = df.select_dtypes(include=["object", "string"]).columns
+        cols = dataframe.select_dtypes(include=["object", "string"]).columns
     else:
-        missing = set(columns) - set(df.columns)
+        missing = set(columns) - set(dataframe.columns)
         if missing:
             raise ValueError(f"Columns not found: {missing}")
         cols = columns
 
-    for col in cols:
-        df[col] = df[col].astype(pd.CategoricalDtype(ordered=ordered))
+    df = _apply(dataframe, {col: ("category", {"ordered": ordered}) for col in cols}, inplace)
 
     if not inplace:
         return df
@@ -190,30 +378,14 @@ def to_bool(dataframe, columns, true_values=None, false_values=None, errors="rai
     -------
     pd.DataFrame or None
     """
-    df = dataframe if inplace else dataframe.copy()
     cols = [columns] if isinstance(columns, str) else list(columns)
 
-    missing = set(cols) - set(df.columns)
+    missing = set(cols) - set(dataframe.columns)
     if missing:
         raise KeyError(f"Columns not found in DataFrame: {missing}")
 
-    default_true = {"true", "1", "yes", "y", "t"}
-    default_false = {"false", "0", "no", "n", "f"}
-    trues = set(v.lower() for v in (true_values or default_true))
-    falses = set(v.lower() for v in (false_values or default_false))
-
-    for col in cols:
-        series = df[col].astype(str).str.strip().str.lower()
-        result = pd.Series(pd.NA, index=series.index, dtype="boolean")
-        mask_true = series.isin(trues)
-        mask_false = series.isin(falses)
-        result[mask_true] = True
-        result[mask_false] = False
-        unknown = ~(mask_true | mask_false)
-        if errors == "raise" and unknown.any():
-            bad_vals = series[unknown].unique()
-            raise ValueError(f"Unrecognized boolean values in column {col}: {bad_vals}")
-        df[col] = result
+    options = {"true_values": true_values, "false_values": false_values, "errors": errors}
+    df = _apply(dataframe, {col: ("bool", options) for col in cols}, inplace)
 
     if not inplace:
         return df
@@ -229,7 +401,9 @@ def to_datetime(dataframe, columns, format=None, errors="raise", inplace=False):
     columns : str or list of str
         Columns to convert.
     format : str, optional
-        Datetime format string.
+        Datetime format string. If None, a format recorded by
+        `eda.show_possible_datetime_columns` is reused when available.
+        "infer" sniffs the format from a sample first.
     errors : {'raise', 'coerce', 'ignore'}, optional
         Default is 'raise'.
     inplace : bool, optional
@@ -239,17 +413,14 @@ def to_datetime(dataframe, columns, format=None, errors="raise", inplace=False):
     -------
     pd.DataFrame or None
     """
-    df = dataframe if inplace else dataframe.copy()
     cols = [columns] if isinstance(columns, str) else list(columns)
 
-    missing = set(cols) - set(df.columns)
+    missing = set(cols) - set(dataframe.columns)
     if missing:
         raise KeyError(f"Columns not found in DataFrame: {missing}")
 
-    for col in cols:
-        df[col] = pd.to_datetime(df[col], format=format, errors=errors)
-
-    return df
+    options = {"format": format, "errors": errors}
+    return _apply(dataframe, {col: ("datetime", options) for col in cols}, inplace)
 
 
 def to_object(dataframe, columns, inplace=False):
@@ -268,14 +439,11 @@ def to_object(dataframe, columns, inplace=False):
     -------
     pd.DataFrame or None
     """
-    df = dataframe if inplace else dataframe.copy()
-
-    missing = set(columns) - set(df.columns)
+    missing = set(columns) - set(dataframe.columns)
     if missing:
         raise ValueError(f"Columns not found: {missing}")
 
-    for col in columns:
-        df[col] = df[col].astype("object")
+    df = _apply(dataframe, {col: ("object", {}) for col in columns}, inplace)
 
     if not inplace:
         return df
\ No newline at end of file
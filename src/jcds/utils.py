@@ -1,4 +1,6 @@
 # utils.py
+import importlib
+import sys
 import warnings
 import functools
 
@@ -99,13 +101,53 @@ def _make_module_help(module):
     def _help(func_name=None):
         from jcds import help as base_help
 
-        # Filter out dunder names and non-callables
+        # Filter out dunder names and non-callables; names listed in
+        # __all__ are fetched with getattr so lazily loaded ones are included
+        names = list(vars(module)) + [
+            k for k in getattr(module, "__all__", []) if k not in vars(module)
+        ]
         filtered_namespace = {
-            k: v
-            for k, v in vars(module).items()
-            if callable(v) and not (k.startswith("__") and k.endswith("__"))
+            k: getattr(module, k, None)
+            for k in names
+            if not (k.startswith("__") and k.endswith("__"))
+            and callable(getattr(module, k, None))
         }
 
         return base_help(func_name, namespace=filtered_namespace)
 
     return _help
+
+
+def _lazy_loader(package, attrs):
+    """
+    Returns module-level ``__getattr__`` and ``__dir__`` functions (PEP 562)
+    that import names from a package's submodules on first access.
+
+    Parameters
+    ----------
+    package : str
+        Name of the package, i.e. `__name__` of the caller.
+    attrs : dict
+        Maps each lazily loaded name to ``(module, attribute)``. `module` is
+        relative to `package`; an `attribute` of None returns the module itself.
+
+    Returns
+    -------
+    tuple of Callable
+        ``(__getattr__, __dir__)`` to assign in the package's `__init__`.
+    """
+
+    def __getattr__(name):
+        if name not in attrs:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module_name, attribute = attrs[name]
+        module = importlib.import_module(module_name, package)
+        value = module if attribute is None else getattr(module, attribute)
+        # cache on the package so later lookups skip __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package])) | set(attrs))
+
+    return __getattr__, __dir__
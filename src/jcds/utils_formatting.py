@@ -1,6 +1,3 @@
-from IPython.display import display, HTML
-
-
 def render_html_block(content_blocks, title=None):
     """
     Display a stylized HTML report block in a Jupyter Notebook.
@@ -47,4 +44,6 @@ def render_html_block(content_blocks, title=None):
         {rows}
     </div>
     """
+    from IPython.display import display, HTML
+
     display(HTML(html))
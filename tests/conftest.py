@@ -26,12 +26,14 @@ def dummy_excel_bytes():
 
 @pytest.fixture
 def mock_requests_get(monkeypatch):
-    """Patch `requests.get` to return a mocked response object."""
+    """Patch `requests.Session.get` to return a mocked response object."""
 
     def _mock(content_bytes, status_code=200):
         mock_response = MagicMock()
         mock_response.content = content_bytes
+        mock_response.raw = BytesIO(content_bytes)
         mock_response.status_code = status_code
+        mock_response.__enter__.return_value = mock_response
 
         if status_code >= 400:
 
@@ -44,7 +46,9 @@ def mock_requests_get(monkeypatch):
                 return None
 
         mock_response.raise_for_status = raise_for_status
-        monkeypatch.setattr("requests.get", lambda url: mock_response)
+        monkeypatch.setattr(
+            "requests.Session.get", lambda self, url, **kwargs: mock_response
+        )
         return mock_response
 
     return _mock
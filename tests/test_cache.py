@@ -0,0 +1,87 @@
+import pandas as pd
+import pytest
+
+from jcds import eda, reports
+from jcds.eda.cache import LRUCache, fingerprint
+
+
+@pytest.fixture(autouse=True)
+def cache():
+    eda.enable_cache()
+    yield
+    eda.disable_cache()
+
+
+def test_repeat_call_hits_cache(sample_df):
+    first = reports.data_quality(sample_df, verbose=False)
+    hits = eda.cache_info()["hits"]
+    second = reports.data_quality(sample_df, verbose=False)
+    assert second == first
+    assert eda.cache_info()["hits"] == hits + 1
+
+
+def test_cached_report_still_prints(sample_df, capsys):
+    reports.data_info(sample_df)
+    first = capsys.readouterr().out
+    reports.data_info(sample_df)
+    assert capsys.readouterr().out == first
+
+
+def test_cache_invalidates_on_change(sample_df):
+    df = sample_df.copy()
+    assert eda.show_constantvars(df) == []
+    df["Age"] = 1
+    assert eda.show_constantvars(df) == ["Age"]
+    before = eda.count_total_na(df)
+    df.loc[df.index[0], "Gender"] = None
+    assert eda.count_total_na(df) == before + 1 == df.isna().sum().sum()
+
+
+def test_cached_values_are_copies(sample_df):
+    result = eda.show_missing_summary(sample_df)
+    result.clear()
+    assert eda.show_missing_summary(sample_df) != {}
+
+
+def test_fingerprint_full_hash_sees_every_cell():
+    df = pd.DataFrame({"a": range(1000)})
+    before_sampled = fingerprint(df)
+    before_full = fingerprint(df, full=True)
+    df.iloc[1, 0] = -1
+    assert fingerprint(df) == before_sampled
+    assert fingerprint(df, full=True) != before_full
+
+
+def test_lru_eviction_by_count_and_size():
+    lru = LRUCache(max_bytes=10_000, max_entries=2)
+    lru.put("a", 1)
+    lru.put("b", 2)
+    lru.get("a")
+    lru.put("c", 3)
+    assert "b" not in lru and "a" in lru and "c" in lru
+
+    lru.put("big", "x" * 20_000)
+    assert "big" not in lru
+
+
+def test_disabled_cache_is_bypassed(sample_df):
+    eda.disable_cache()
+    eda.show_constantvars(sample_df)
+    assert eda.cache_info() == {
+        "enabled": False,
+        "hits": 0,
+        "misses": 0,
+        "entries": 0,
+        "bytes": 0,
+    }
+
+
+def test_cached_datetime_sniffing_still_records_formats(possible_datetime_df):
+    df = possible_datetime_df
+    first = eda.show_possible_datetime_columns(df, return_formats=True)
+    df.attrs.clear()
+    hits = eda.cache_info()["hits"]
+
+    assert eda.show_possible_datetime_columns(df, return_formats=True) == first
+    assert eda.cache_info()["hits"] == hits + 1
+    assert df.attrs["datetime_formats"] == first
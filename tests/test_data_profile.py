@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from jcds import eda, reports
+from jcds.reports import DataProfile
+
+
+@pytest.fixture
+def report_df():
+    return pd.DataFrame(
+        {
+            "id": range(20),
+            "grp": ["a", "b", None, "a"] * 5,
+            "value": [float(i % 7) if i % 6 else np.nan for i in range(20)],
+            "const": ["k"] * 20,
+            "mixed": [1, "1"] * 10,
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "report", [reports.data_info, reports.data_cardinality, reports.data_quality]
+)
+def test_report_prints_its_rendered_profile(report, report_df, capsys):
+    result = report(report_df)
+    out = capsys.readouterr().out
+    assert isinstance(result, DataProfile)
+    assert out == result.render() + "\n"
+
+    assert report(report_df, verbose=False) == result
+    assert capsys.readouterr().out == ""
+
+
+def test_data_quality_summary_values(report_df):
+    result = reports.data_quality(report_df, verbose=False)
+    assert result["rows"] == 20
+    assert result["duplicates"] == 0
+    assert result["constant_columns"] == ["const"]
+    assert result["mixed_type_columns"] == ["mixed"]
+    assert result.kind == "data_quality"
+
+
+def test_profile_json_round_trip(report_df, tmp_path):
+    result = reports.data_cardinality(report_df, verbose=False)
+    loaded = DataProfile.from_json(result.to_json())
+    assert loaded == result
+    assert loaded.render() == result.render()
+
+    path = tmp_path / "profile.json"
+    result.to_json(path)
+    assert DataProfile.from_json(path) == result
+
+
+def test_profile_parquet_round_trip(report_df, tmp_path):
+    result = reports.data_quality(report_df, verbose=False)
+    path = tmp_path / "profile.parquet"
+    result.to_parquet(path)
+    loaded = DataProfile.read_parquet(path)
+    assert loaded == result
+    assert loaded.render(show_columns=False) == result.render(show_columns=False)
+
+
+def test_profile_frames_concatenate_and_diff(report_df):
+    before = reports.data_quality(report_df, verbose=False)
+    after = reports.data_quality(pd.concat([report_df, report_df.iloc[:3]]), verbose=False)
+
+    frame = pd.concat([before.to_frame(), after.to_frame()], ignore_index=True)
+    assert frame["duplicates"].tolist() == [0, 3]
+    assert DataProfile.from_frame(frame) == [before, after]
+
+    changes = before.diff(after)
+    assert changes["duplicates"] == (0, 3)
+    assert "constant_columns" not in changes
+
+
+def test_catvar_report_returns_profile(report_df, capsys):
+    result = reports.catvar_report(report_df, ["grp"])
+    assert capsys.readouterr().out == result.render() + "\n"
+    assert result["features"]["grp"]["missing"] == 5
+
+    empty = reports.catvar_report(report_df, ["value"], verbose=False)
+    assert empty["features"] == {}
+
+
+def test_dqr_tables_survive_json(report_df):
+    result = eda.dqr_cont(report_df, verbose=False)
+    assert result["features"] == ["id", "value"]
+    loaded = DataProfile.from_json(result.to_json())
+    assert loaded.tables["quality"]["Missing"].tolist() == [0, 4]
+    assert loaded.render() == result.render()
+    assert eda.dqr_cat(pd.DataFrame({"x": [1.0]}), verbose=False).tables == {}
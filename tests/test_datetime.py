@@ -1,6 +1,8 @@
+import numpy as np
 import pytest
 import pandas as pd
-from jcds.eda.datetime import create_dt_col, create_dt_cols
+from jcds import eda, transform
+from jcds.eda.datetime import create_dt_col, create_dt_cols, infer_datetime_format
 
 
 def test_create_month_col(datetime_df):
@@ -57,3 +59,76 @@ def test_mixed_date_format_raises_error():
     df = pd.DataFrame({"timestamp": ["2023/01/01", "2023-02-15"]})
     with pytest.raises(ValueError, match="Inconsistent datetime format"):
         create_dt_col(df, "timestamp", "month")
+
+
+def test_infer_datetime_format_candidates():
+    assert infer_datetime_format(pd.Series(["2023-01-31", "2023-02-01"])) == "%Y-%m-%d"
+    assert infer_datetime_format(pd.Series(["31/01/2023", "01/02/2023"])) == "%d/%m/%Y"
+    assert infer_datetime_format(pd.Series(["hello", "world", "2023"])) is None
+
+
+def test_infer_datetime_format_threshold():
+    s = pd.Series(["2023-01-01", "banana", "2023-01-02", None])
+    assert infer_datetime_format(s) is None
+    assert infer_datetime_format(s, threshold=0.6) == "%Y-%m-%d"
+
+
+def test_possible_datetime_formats_are_reused(possible_datetime_df):
+    df = possible_datetime_df
+    formats = eda.show_possible_datetime_columns(df, return_formats=True)
+    assert formats == {"date_strings": "%Y-%m-%d"}
+    assert df.attrs["datetime_formats"] == formats
+
+    result = transform.to_datetime(df, "date_strings")
+    assert result["date_strings"].dt.day.tolist() == [1, 2, 3]
+
+
+def test_to_datetime_infer_format_records_it():
+    df = pd.DataFrame({"d": ["13/01/2023", "14/02/2023", None]})
+    result = transform.to_datetime(df, "d", format="infer")
+    assert result["d"].dt.month.tolist()[:2] == [1, 2]
+    assert result.attrs["datetime_formats"]["d"] == "%d/%m/%Y"
+
+
+def test_create_dt_cols_compact_dtypes(datetime_df):
+    result = create_dt_cols(
+        datetime_df, "timestamp", ["year", "month", "dayofyear", "weekday_name", "is_weekend"]
+    )
+    assert result["timestamp_year"].dtype == "int16"
+    assert result["timestamp_month"].dtype == "int8"
+    assert result["timestamp_dayofyear"].dtype == "int16"
+    assert result["timestamp_is_weekend"].dtype == bool
+    names = result["timestamp_weekday_name"]
+    assert isinstance(names.dtype, pd.CategoricalDtype)
+    assert list(names.cat.categories[:2]) == ["Monday", "Tuesday"]
+
+
+def test_create_dt_cols_missing_and_timezone():
+    ts = pd.Series(["2023-01-01 23:30", None, "2023-12-31 23:30"], dtype="datetime64[ns]")
+    df = pd.DataFrame({"ts": ts.dt.tz_localize("US/Pacific")})
+
+    result = create_dt_cols(df, "ts", ["day", "weekofyear", "is_month_end", "weekday_name"])
+
+    assert result["ts_day"].dtype == "Int8"
+    assert result["ts_day"].tolist() == [1, pd.NA, 31]
+    assert result["ts_weekofyear"].tolist() == [52, pd.NA, 52]
+    assert result["ts_is_month_end"].tolist() == [False, False, True]
+    assert result["ts_weekday_name"].isna().tolist() == [False, True, False]
+
+
+def test_create_dt_cols_inplace():
+    df = pd.DataFrame({"d": ["2023-03-01", "2023-03-02", "2023-03-01"], "x": [1, 2, 3]})
+    assert create_dt_cols(df, "d", ["day", "weekday"], inplace=True) is None
+    assert pd.api.types.is_datetime64_any_dtype(df["d"])
+    assert df["d_day"].tolist() == [1, 2, 1]
+    assert df["d_weekday"].tolist() == [2, 3, 2]
+
+
+def test_create_dt_cols_does_not_copy_or_modify_input():
+    df = pd.DataFrame({"d": ["2023-03-01", "2023-03-02"], "x": [1.0, 2.0]})
+    result = create_dt_cols(df, "d", ["day"])
+
+    assert list(df.columns) == ["d", "x"]
+    assert df["d"].dtype == object
+    assert df.attrs == {}
+    assert np.shares_memory(result["x"].to_numpy(), df["x"].to_numpy())
@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from jcds import eda, reports
+
+
+@pytest.fixture
+def dupes_df():
+    return pd.DataFrame(
+        {
+            "a": [1, 2, 1, 3, 2, 1, np.nan, np.nan],
+            "b": ["x", "y", "x", "z", "y", "x", None, None],
+            "c": [0.5, 1.5, 0.5, 2.5, 1.5, 9.9, np.nan, np.nan],
+        },
+        index=list("pqrstuvw"),
+    )
+
+
+@pytest.mark.parametrize("verify", [True, False])
+def test_show_dupes_matches_duplicated(dupes_df, verify):
+    assert eda.show_dupes(dupes_df, verify=verify) == dupes_df.duplicated().sum()
+
+
+def test_show_dupes_groups(dupes_df):
+    groups = eda.show_dupes(dupes_df, return_groups=True)
+    assert groups.index.equals(dupes_df.index)
+    assert groups.tolist() == [0, 1, 0, -1, 1, -1, 2, 2]
+
+
+def test_show_dupes_no_duplicates(sample_df):
+    assert eda.show_dupes(sample_df) == 0
+    assert (eda.show_dupes(sample_df, return_groups=True) == -1).all()
+
+
+@pytest.mark.parametrize("suffix", ["csv", "parquet"])
+def test_show_file_dupes_across_chunks(dupes_df, tmp_path, suffix):
+    path = tmp_path / f"data.{suffix}"
+    df = dupes_df.reset_index(drop=True)
+    if suffix == "csv":
+        df.to_csv(path, index=False)
+    else:
+        df.to_parquet(path, index=False)
+
+    assert eda.show_file_dupes(path, chunksize=3) == df.duplicated().sum()
+    groups = eda.show_file_dupes(path, chunksize=3, return_groups=True)
+    assert groups.tolist() == eda.show_dupes(df, return_groups=True).tolist()
+
+
+def test_data_quality_counts_dupes_for_files(dupes_df, tmp_path, capsys):
+    path = tmp_path / "data.csv"
+    dupes_df.to_csv(path, index=False)
+    reports.data_quality(path, chunksize=3)
+    assert "DUPLICATES: 3" in capsys.readouterr().out
@@ -0,0 +1,66 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import jcds
+
+SRC = str(Path(jcds.__file__).resolve().parents[1])
+
+HEAVY_MODULES = ["matplotlib", "seaborn", "sklearn", "scipy", "IPython", "requests", "tabulate"]
+
+# generous bound for `import jcds` alone; eager imports took over a second
+IMPORT_BUDGET_SECONDS = 0.5
+
+
+def _run(code):
+    """Run `code` in a fresh interpreter and return its stdout."""
+    env = dict(os.environ, PYTHONPATH=SRC + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True
+    )
+    return result.stdout.strip()
+
+
+def _loaded_heavy_modules(statement):
+    code = f"import sys\n{statement}\nprint(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    return _run(code)
+
+
+def test_import_time_within_budget():
+    code = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        "import jcds\n"
+        "print(time.perf_counter() - start)"
+    )
+    # best of three to smooth over a cold disk cache
+    elapsed = min(float(_run(code)) for _ in range(3))
+    assert elapsed < IMPORT_BUDGET_SECONDS
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import jcds",
+        "import jcds.transform",
+        "import jcds.dataio",
+        "import jcds.reports",
+        "from jcds.eda import show_dupes, profile_dataframe",
+    ],
+)
+def test_heavy_dependencies_not_loaded(statement):
+    assert _loaded_heavy_modules(statement) == ""
+
+
+def test_lazy_names_resolve():
+    import jcds.charts
+    import jcds.eda
+
+    assert jcds.charts.plot_roc.__module__ == "jcds.charts.roc"
+    assert jcds.eda.dqr_cont.__module__ == "jcds.eda.reports"
+    assert "plot_categorical" in dir(jcds.eda)
+    with pytest.raises(AttributeError):
+        jcds.eda.not_a_function
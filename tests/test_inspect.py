@@ -90,6 +90,19 @@ def test_show_binary_list(binary_list_df):
     assert excluded.isdisjoint(combined)
 
 
+
+def test_show_binary_list_columns_and_probe(binary_list_df, monkeypatch):
+    result = eda.show_binary_list(binary_list_df, columns=["bin_with_nan", "not_bin_3vals"])
+    assert result == {"binary_columns": [], "binary_with_nan": ["bin_with_nan"]}
+
+    # columns ruled out by the probe give the same answer as a full scan
+    monkeypatch.setattr("jcds.eda.inspect.BINARY_PROBE_ROWS", 3)
+    long_df = pd.concat([binary_list_df] * 3, ignore_index=True)
+    assert eda.show_binary_list(long_df) == {
+        "binary_columns": ["bin_clean"],
+        "binary_with_nan": ["bin_with_nan"],
+    }
+
 def test_show_highcardvars(unique_test_df):
     result = eda.show_highcardvars(unique_test_df, percent_unique=60)
     assert isinstance(result, list)
@@ -156,6 +169,25 @@ def test_show_mixed_type_columns_ignores_numpy_str(sample_df):
     result = eda.show_mixed_type_columns(df)
     assert "Gender" not in result
 
+def test_show_mixed_type_columns_return_counts(mixed_type_df):
+    result = eda.show_mixed_type_columns(mixed_type_df, return_counts=True)
+    assert result["mixed"] == {"int": 1, "str": 1, "float": 1}
+    assert result["more_mixed"] == {"bool": 1, "str": 1, "int": 1}
+    assert "clean" not in result
+
+def test_show_mixed_type_columns_sample_and_categorical():
+    df = pd.DataFrame(
+        {
+            "mixed": pd.Series([1, "a"] * 500, dtype=object),
+            "cat": pd.Categorical([1, "a", 1, 1] * 250),
+            "num": range(1000),
+        }
+    )
+    result = eda.show_mixed_type_columns(df, sample=100, return_counts=True)
+    assert sum(result["mixed"].values()) == 100
+    assert result["cat"] == {"int": 750, "str": 250}
+    assert "num" not in result
+
 def test_count_id_like_columns(id_like_df):
     result = eda.count_id_like_columns(id_like_df, threshold=0.95)
     assert result == 2
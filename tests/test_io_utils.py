@@ -1,7 +1,13 @@
+import os
+
 import pytest
 import pandas as pd
 from pathlib import Path
-from jcds.dataio import save_parquet, load_parquet, save_csv, load_csv
+import numpy as np
+from jcds.dataio import save_parquet, load_parquet, save_csv, load_csv, sniff_encoding
+from jcds.dataio import iter_parquet, parquet_metadata, save_feather, load_feather
+from jcds.dataio import optimize_dtypes, plan_dtypes
+from jcds.dataio import io_utils
 from jcds.dataio.s3_io import read_s3
 
 
@@ -64,6 +70,320 @@ def test_load_csv_fallback_shows_preview(tmp_path, capsys):
     assert "Preview of raw bytes" in captured.out
 
 
+@pytest.mark.parametrize("encoding", ["utf-8-sig", "utf-16", "latin1"])
+def test_sniff_encoding_detects_bom_and_fallback(tmp_path, encoding):
+    """Test that sniff_encoding reads a byte-order mark or falls back to latin1."""
+    filepath = tmp_path / "enc.csv"
+    pd.DataFrame({"name": ["café", "naïve"]}).to_csv(filepath, index=False, encoding=encoding)
+
+    assert sniff_encoding(filepath) == encoding
+    assert load_csv(filepath)["name"].tolist() == ["café", "naïve"]
+
+
+def test_load_csv_retries_when_bad_bytes_follow_the_sample(tmp_path):
+    """Test that a non-UTF-8 byte beyond the sniffed sample triggers one retry."""
+    filepath = tmp_path / "late.csv"
+    body = "a,b\n" + "1,abc\n" * 1000 + "2,café\n"
+    filepath.write_bytes(body.encode("latin1"))
+
+    for engine in [None, "pyarrow"]:
+        df = load_csv(filepath, sample_bytes=64, engine=engine)
+        assert df["b"].iloc[-1] == "café"
+
+
+def test_load_csv_chunksize_yields_dataframes(tmp_path, sample_df):
+    """Test that chunksize returns an iterator of DataFrames covering the file."""
+    filepath = tmp_path / "chunks.csv"
+    save_csv(sample_df, filepath, encoding="latin1")
+
+    with load_csv(filepath, chunksize=3) as reader:
+        chunks = list(reader)
+
+    assert [len(chunk) for chunk in chunks] == [3, 3, 3, 1]
+    pd.testing.assert_frame_equal(pd.concat(chunks), sample_df)
+
+
+def test_load_csv_pyarrow_engine(tmp_path, sample_df):
+    """Test loading with the pyarrow engine and rejecting it with chunksize."""
+    filepath = tmp_path / "arrow.csv"
+    save_csv(sample_df, filepath)
+
+    loaded_df = load_csv(filepath, engine="pyarrow")
+    assert loaded_df.shape == sample_df.shape
+    with pytest.raises(ValueError, match="chunksize"):
+        load_csv(filepath, engine="pyarrow", chunksize=2)
+
+
+def test_load_csv_does_not_swallow_parser_errors(tmp_path):
+    """Test that errors unrelated to the encoding are raised, not retried."""
+    filepath = tmp_path / "bad.csv"
+    filepath.write_text("a,b\n1,2\n3,4,5\n")
+
+    with pytest.raises(pd.errors.ParserError):
+        load_csv(filepath)
+
+
+@pytest.fixture
+def wide_df():
+    """Frame whose columns all fit in narrower dtypes."""
+    n = 1000
+    return pd.DataFrame(
+        {
+            "id": np.arange(n),
+            "delta": np.arange(n) % 7 - 3,
+            "half": (np.arange(n) % 8) / 2,
+            "ratio": np.linspace(0, 1, n),
+            "state": np.where(np.arange(n) % 2, "CA", "NY"),
+            "name": [f"user{i}" for i in range(n)],
+        }
+    )
+
+
+def test_plan_dtypes(wide_df):
+    """Test that plan_dtypes separates numeric kinds, categories and strings."""
+    assert plan_dtypes(wide_df) == {
+        "id": "integer",
+        "delta": "integer",
+        "half": "float",
+        "ratio": "float",
+        "state": "category",
+        "name": "string[pyarrow]",
+    }
+
+
+def test_optimize_dtypes_is_lossless(wide_df):
+    """Test that optimize_dtypes narrows dtypes without changing values."""
+    optimized = optimize_dtypes(wide_df)
+
+    assert optimized.dtypes.astype(str).to_dict() == {
+        "id": "uint16",
+        "delta": "int8",
+        "half": "float32",
+        "ratio": "float64",
+        "state": "category",
+        "name": "string",
+    }
+    pd.testing.assert_frame_equal(optimized.astype(wide_df.dtypes), wide_df)
+
+
+@pytest.mark.parametrize("engine", [None, "pyarrow"])
+def test_load_csv_optimize(tmp_path, wide_df, monkeypatch, capsys, engine):
+    """Test optimized CSV loads when later chunks exceed the sampled ranges."""
+    monkeypatch.setattr(io_utils, "OPTIMIZE_SAMPLE_ROWS", 100)
+    wide_df.loc[999, ["id", "state"]] = [100_000, "TX"]
+    filepath = tmp_path / "wide.csv"
+    save_csv(wide_df, filepath)
+
+    loaded_df = load_csv(filepath, optimize=True, engine=engine)
+
+    assert loaded_df["id"].dtype == "uint32"
+    assert loaded_df["state"].dtype == "category"
+    assert set(loaded_df["state"].cat.categories) == {"CA", "NY", "TX"}
+    pd.testing.assert_frame_equal(loaded_df.astype(wide_df.dtypes), wide_df)
+    assert "Memory usage:" in capsys.readouterr().out
+
+
+def test_load_csv_optimize_with_nrows(tmp_path, wide_df, capsys):
+    """Test that a caller's nrows limits both the dtype sample and the load."""
+    filepath = tmp_path / "wide.csv"
+    save_csv(wide_df, filepath)
+
+    loaded_df = load_csv(filepath, optimize=True, nrows=5)
+
+    assert len(loaded_df) == 5
+    pd.testing.assert_frame_equal(loaded_df.astype(wide_df.dtypes), wide_df.head(5))
+
+
+def test_load_parquet_optimize(tmp_path, wide_df):
+    """Test optimized Parquet loads and column selection."""
+    filepath = tmp_path / "wide.parquet"
+    save_parquet(wide_df, filepath)
+
+    loaded_df = load_parquet(filepath, optimize=True)
+
+    assert loaded_df["delta"].dtype == "int8"
+    assert loaded_df["state"].dtype == "category"
+    pd.testing.assert_frame_equal(loaded_df.astype(wide_df.dtypes), wide_df)
+    assert list(load_parquet(filepath, optimize=True, columns=["name"]).columns) == ["name"]
+
+
+@pytest.fixture
+def grouped_parquet(tmp_path):
+    """Parquet file with four row groups of 25 rows, sorted by `day`."""
+    df = pd.DataFrame(
+        {
+            "day": np.repeat(np.arange(4), 25),
+            "value": np.arange(100.0),
+            "label": ["a", "b", None, "d"] * 25,
+        }
+    )
+    filepath = tmp_path / "grouped.parquet"
+    df.to_parquet(filepath, index=False, row_group_size=25)
+    return df, filepath
+
+
+def test_load_parquet_columns_and_filters(grouped_parquet):
+    """Test column projection and predicate pushdown in load_parquet."""
+    df, filepath = grouped_parquet
+
+    loaded_df = load_parquet(filepath, columns=["value"], filters=[("day", ">=", 2)])
+
+    assert list(loaded_df.columns) == ["value"]
+    assert loaded_df["value"].tolist() == df.loc[df["day"] >= 2, "value"].tolist()
+
+
+def test_iter_parquet_skips_row_groups(grouped_parquet, monkeypatch):
+    """Test that batches stream only from row groups the filter can match."""
+    import pyarrow.parquet as pq
+
+    df, filepath = grouped_parquet
+    read_groups = []
+    iter_batches = pq.ParquetFile.iter_batches
+
+    def spy(self, *args, row_groups=None, **kwargs):
+        read_groups.extend(row_groups)
+        return iter_batches(self, *args, row_groups=row_groups, **kwargs)
+
+    monkeypatch.setattr(pq.ParquetFile, "iter_batches", spy)
+    filters = [[("day", "=", 1)], [("day", "in", {3}), ("value", ">", 90.0)]]
+    batches = list(load_parquet(filepath, columns=["value"], filters=filters, batch_size=10))
+
+    assert read_groups == [1, 3]
+    assert all(len(batch) <= 10 and list(batch.columns) == ["value"] for batch in batches)
+    expected = df.loc[(df["day"] == 1) | ((df["day"] == 3) & (df["value"] > 90)), "value"]
+    assert pd.concat(batches)["value"].tolist() == expected.tolist()
+    assert list(iter_parquet(filepath, 10, filters=[("day", ">", 5)])) == []
+
+
+def test_parquet_metadata(grouped_parquet):
+    """Test footer statistics per column and per row group."""
+    df, filepath = grouped_parquet
+
+    stats = parquet_metadata(filepath).set_index("column")
+    assert stats.loc["label", "null_count"] == df["label"].isna().sum()
+    assert (stats.loc["value", "min"], stats.loc["value", "max"]) == (0.0, 99.0)
+    assert stats.loc["day", "num_rows"] == 100
+
+    per_group = parquet_metadata(filepath, row_groups=True)
+    assert len(per_group) == 4 * 3
+    assert per_group.loc[per_group["column"] == "day", "max"].tolist() == [0, 1, 2, 3]
+
+
+@pytest.fixture
+def daily_df():
+    return pd.DataFrame(
+        {
+            "day": ["2024-01-01"] * 3 + ["2024-01-02"] * 2,
+            "store": [1, 2, 1, 1, 2],
+            "sales": [10.0, 20.0, 30.0, 40.0, 50.0],
+        }
+    )
+
+
+def _sorted(df):
+    df = df.assign(day=df["day"].astype(str))
+    return df.sort_values(["day", "sales"]).reset_index(drop=True)[["day", "store", "sales"]]
+
+
+def test_save_parquet_partitioned_roundtrip_and_pruning(tmp_path, daily_df):
+    """Test hive-partitioned writes and filtered reads on the partition column."""
+    dataset = tmp_path / "sales"
+    save_parquet(daily_df, dataset, partition_cols=["day"], row_group_size=2, compression="zstd")
+
+    assert sorted(p.name for p in dataset.iterdir()) == ["day=2024-01-01", "day=2024-01-02"]
+    pd.testing.assert_frame_equal(_sorted(load_parquet(dataset)), _sorted(daily_df))
+
+    filtered = load_parquet(dataset, filters=[("day", "=", "2024-01-02")])
+    assert filtered["sales"].tolist() == [40.0, 50.0]
+    batches = list(load_parquet(dataset, columns=["sales"], filters=[("store", "=", 1)], batch_size=1))
+    assert sorted(pd.concat(batches)["sales"]) == [10.0, 30.0, 40.0]
+
+
+def test_save_parquet_append_and_overwrite_partitions(tmp_path, daily_df):
+    """Test appending files and replacing only the partitions being written."""
+    dataset = tmp_path / "sales"
+    save_parquet(daily_df, dataset, partition_cols=["day"])
+
+    late = pd.DataFrame({"day": ["2024-01-03"], "store": [3], "sales": [60.0]})
+    save_parquet(late, dataset, partition_cols=["day"], mode="append")
+    assert len(load_parquet(dataset)) == 6
+
+    fixed = pd.DataFrame({"day": ["2024-01-01"], "store": [1], "sales": [99.0]})
+    save_parquet(fixed, dataset, partition_cols=["day"], mode="overwrite_partitions")
+    result = _sorted(load_parquet(dataset))
+    assert result["sales"].tolist() == [99.0, 40.0, 50.0, 60.0]
+
+    save_parquet(late, dataset, partition_cols=["day"])
+    assert load_parquet(dataset)["sales"].tolist() == [60.0]
+
+
+def test_save_parquet_rejects_unsafe_modes(tmp_path, sample_df):
+    """Test that append to a single file and overwriting foreign files fail."""
+    filepath = tmp_path / "single.parquet"
+    save_parquet(sample_df, filepath)
+    with pytest.raises(ValueError, match="single file"):
+        save_parquet(sample_df, filepath, mode="append")
+    with pytest.raises(ValueError, match="mode must be"):
+        save_parquet(sample_df, tmp_path / "x", mode="upsert")
+
+    partition = tmp_path / "folder" / "Gender=M"
+    partition.mkdir(parents=True)
+    (partition / "notes.txt").write_text("keep me")
+    with pytest.raises(ValueError, match="Refusing to overwrite"):
+        save_parquet(sample_df, tmp_path / "folder", partition_cols=["Gender"])
+    assert (partition / "notes.txt").exists()
+
+
+def test_save_parquet_overwrite_keeps_unrelated_files(tmp_path, daily_df):
+    """Test that overwrites never delete files outside the partitions being written."""
+    out = tmp_path / "out"
+    out.mkdir()
+    daily_df.to_parquet(out / "other.parquet")
+    with pytest.raises(ValueError, match="is a directory"):
+        save_parquet(daily_df, out)
+    assert [p.name for p in out.iterdir()] == ["other.parquet"]
+
+    save_parquet(daily_df, out, partition_cols=["day"])
+    save_parquet(daily_df.head(1), out, partition_cols=["day"])
+    assert sorted(p.name for p in out.iterdir()) == ["day=2024-01-01", "other.parquet"]
+    assert len(pd.read_parquet(out / "other.parquet")) == 5
+
+
+def test_feather_roundtrip_memory_mapped(tmp_path, wide_df):
+    """Test that Feather files round-trip dtypes and load without copying numbers."""
+    wide_df = optimize_dtypes(wide_df)
+    filepath = tmp_path / "frame.feather"
+    save_feather(wide_df, filepath)
+
+    loaded_df = load_feather(filepath)
+    pd.testing.assert_frame_equal(loaded_df, wide_df)
+    assert not loaded_df["id"].to_numpy().flags.owndata
+
+    arrow_df = load_feather(filepath, columns=["id", "name"], dtype_backend="pyarrow")
+    assert list(arrow_df.columns) == ["id", "name"]
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in arrow_df.dtypes)
+
+
+def test_load_csv_cache_dir(tmp_path, sample_df, capsys):
+    """Test that a cached parse is reused until the CSV changes."""
+    filepath = tmp_path / "data.csv"
+    cache_dir = tmp_path / "cache"
+    save_csv(sample_df, filepath)
+
+    first = load_csv(filepath, cache_dir=cache_dir)
+    second = load_csv(filepath, cache_dir=cache_dir)
+    assert "from cache" in capsys.readouterr().out
+    pd.testing.assert_frame_equal(first, second)
+    assert len(list(cache_dir.glob("*.feather"))) == 1
+
+    save_csv(sample_df.head(3), filepath)
+    os.utime(filepath, ns=(0, 10**18))
+    third = load_csv(filepath, cache_dir=cache_dir)
+    assert "from cache" not in capsys.readouterr().out
+    assert len(third) == 3
+    assert len(list(cache_dir.glob("*.feather"))) == 1
+
+
 def test_read_s3_csv_success(sample_df, mock_requests_get):
     """Test reading a CSV file from S3 using mocked response."""
     # Convert the sample DataFrame to CSV bytes
@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.metrics import confusion_matrix, precision_recall_fscore_support
+
+from jcds import metrics
+from jcds.metrics import ConfusionAccumulator, confusion_from_file, mc_confusion
+
+
+@pytest.fixture
+def labelled():
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 4, 20_000)
+    noise = rng.integers(0, 4, 20_000)
+    y_pred = np.where(rng.random(20_000) < 0.6, y_true, noise)
+    return y_true, y_pred
+
+
+def test_mc_confusion_per_class(capsys):
+    cm = np.array([[50, 10, 5], [5, 35, 5], [5, 10, 40]])
+    result = mc_confusion(cm)
+
+    assert "Confusion Matrix:" in capsys.readouterr().out
+    assert list(result.columns) == ["Class 0", "Class 1", "Class 2"]
+    assert result.loc["Sensitivity (Recall)", "Class 0"] == round(50 / 65, 5)
+    assert result.loc["Precision", "Class 1"] == round(35 / 55, 5)
+    assert result.loc["Specificity", "Class 2"] == round(100 / 110, 5)
+    assert result.loc["Accuracy", "Class 0"] == round((50 + 90) / 165, 5)
+
+
+def test_mc_confusion_empty_class_is_zero():
+    result = mc_confusion(np.array([[0, 0], [3, 0]]), verbose=False)
+    assert result.loc[["Precision", "F1"], "Class 0"].tolist() == [0.0, 0.0]
+
+
+def test_mc_confusion_averages_match_sklearn(labelled):
+    y_true, y_pred = labelled
+    result = mc_confusion(confusion_matrix(y_true, y_pred), rnd=10, averages=True, verbose=False)
+
+    for average, column in [("macro", "Macro"), ("micro", "Micro"), ("weighted", "Weighted")]:
+        precision, recall, _, _ = precision_recall_fscore_support(y_true, y_pred, average=average)
+        assert result.loc["Precision", column] == pytest.approx(precision)
+        assert result.loc["Sensitivity (Recall)", column] == pytest.approx(recall)
+    _, _, f1, _ = precision_recall_fscore_support(y_true, y_pred, average="macro")
+    assert result.loc["F1", "Macro"] == pytest.approx(f1)
+
+
+def test_accumulator_matches_confusion_matrix(labelled):
+    y_true, y_pred = labelled
+    whole = ConfusionAccumulator()
+    for start in range(0, len(y_true), 3_000):
+        whole.update(y_true[start : start + 3_000], y_pred[start : start + 3_000])
+
+    np.testing.assert_array_equal(whole.matrix, confusion_matrix(y_true, y_pred))
+    assert whole.count == len(y_true)
+
+    left = ConfusionAccumulator().update(y_true[:5_000], y_pred[:5_000])
+    right = ConfusionAccumulator().update(y_true[5_000:], y_pred[5_000:])
+    np.testing.assert_array_equal(left.merge(right).matrix, whole.matrix)
+    pd.testing.assert_frame_equal(left.metrics(), whole.metrics())
+
+
+def test_accumulator_with_labels():
+    acc = ConfusionAccumulator(labels=["cat", "dog", "fox"])
+    acc.update(pd.Series(["cat", "dog", "dog"]), pd.Series(["cat", "cat", "dog"]))
+
+    assert acc.matrix.tolist() == [[1, 0, 0], [1, 1, 0], [0, 0, 0]]
+    assert list(acc.metrics().columns[:3]) == ["cat", "dog", "fox"]
+    with pytest.raises(ValueError, match="owl"):
+        acc.update(["owl"], ["cat"])
+
+
+def test_accumulator_rejects_non_integer_labels():
+    with pytest.raises(ValueError, match="non-negative integers"):
+        ConfusionAccumulator().update(["a"], ["b"])
+    with pytest.raises(ValueError, match="same length"):
+        ConfusionAccumulator().update([0, 1], [0])
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet"])
+def test_confusion_from_file(tmp_path, labelled, suffix):
+    y_true, y_pred = labelled
+    df = pd.DataFrame({"extra": 1.0, "y": y_true, "pred": y_pred})
+    path = tmp_path / f"scores{suffix}"
+    if suffix == ".csv":
+        df.to_csv(path, index=False)
+    else:
+        df.to_parquet(path, index=False)
+
+    acc = confusion_from_file(path, "y", "pred", chunksize=4_000)
+
+    np.testing.assert_array_equal(acc.matrix, confusion_matrix(y_true, y_pred))
+
+
+def test_metrics_exports():
+    assert set(metrics.__all__) >= {"mc_confusion", "ConfusionAccumulator", "confusion_from_file"}
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -19,9 +20,160 @@ def test_outlier_boxplots(sample_df):
         pytest.fail(f"charts.outlier_boxplots raised an exception: {e}")
 
 
+def test_outlier_boxplots_from_file(tmp_path, sample_df):
+    path = tmp_path / "data.csv"
+    sample_df.to_csv(path, index=False)
+    try:
+        charts.outlier_boxplots(path, chunksize=4)
+    except Exception as e:
+        pytest.fail(f"charts.outlier_boxplots raised an exception: {e}")
+
+
 def test_missing_data_heatmap_charts(sample_df):
     """Test that charts.plot_missing_heatmap runs without error."""
     try:
         charts.missing_data_heatmap(sample_df)
     except Exception as e:
         pytest.fail(f"charts.plot_missing_heatmap raised an exception: {e}")
+
+
+@pytest.fixture
+def outlier_df():
+    values = np.arange(100, dtype=float)
+    values[[3, 50]] = [1000.0, -1000.0]
+    return pd.DataFrame(
+        {
+            "x": values,
+            "flag": [0, 1] * 50,
+            "label": ["a"] * 100,
+        },
+        index=np.arange(100) * 10,
+    )
+
+
+def test_detect_outliers_iqr_counts(outlier_df):
+    assert outliers.detect_outliers_iqr(outlier_df) == {"x": 2}
+
+
+@pytest.mark.parametrize("mask_format", ["dense", "sparse"])
+def test_detect_outliers_iqr_mask(outlier_df, mask_format):
+    mask = outliers.detect_outliers_iqr(outlier_df, return_mask=True, mask_format=mask_format)
+
+    assert mask.shape == outlier_df.shape
+    assert list(mask.columns) == list(outlier_df.columns)
+    if mask_format == "sparse":
+        assert all(isinstance(dtype, pd.SparseDtype) for dtype in mask.dtypes)
+        mask = mask.sparse.to_dense()
+    assert mask.index[mask["x"]].tolist() == [30, 500]
+    assert not mask[["flag", "label"]].any().any()
+
+
+def test_detect_outliers_iqr_index(outlier_df):
+    rows = outliers.detect_outliers_iqr(outlier_df, return_mask=True, mask_format="index")
+
+    assert list(rows) == ["x"]
+    assert rows["x"].tolist() == [30, 500]
+
+
+def test_detect_outliers_iqr_rejects_unknown_format(outlier_df):
+    with pytest.raises(ValueError, match="mask_format"):
+        outliers.detect_outliers_iqr(outlier_df, return_mask=True, mask_format="coo")
+
+
+def test_detect_outliers_iqr_streams_file(tmp_path):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"x": rng.normal(size=20_000), "flag": rng.integers(0, 2, 20_000)})
+    df.loc[[7, 15_000], "x"] = [50.0, -50.0]
+    path = tmp_path / "data.csv"
+    df.to_csv(path, index=False)
+
+    expected = outliers.detect_outliers_iqr(df.reset_index(drop=True))
+    counts = outliers.detect_outliers_iqr(path, chunksize=3_000)
+    rows = outliers.detect_outliers_iqr(path, return_mask=True, mask_format="index", chunksize=3_000)
+
+    assert list(counts) == ["x"]
+    assert counts["x"] == pytest.approx(expected["x"], rel=0.2)
+    assert {7, 15_000} <= set(rows["x"])
+    assert len(rows["x"]) == counts["x"]
+
+
+def test_iqr_fences():
+    assert outliers.iqr_fences(1.0, 3.0) == (-2.0, 6.0)
+    assert outliers.iqr_fences(1.0, 3.0, threshold=3) == (-5.0, 9.0)
+
+
+@pytest.mark.parametrize("method", ["iqr", "mad", "zscore"])
+def test_detect_outliers_engines(outlier_df, method):
+    result = outliers.detect_outliers(outlier_df, method=method)
+
+    assert isinstance(result, outliers.OutlierResult)
+    assert result.counts == {"x": 2}
+    assert list(result.bounds.columns) == ["lower", "upper"]
+    assert result.bounds.loc["x", "lower"] < 0 < 99 < result.bounds.loc["x", "upper"]
+    assert result.mask.shape == outlier_df.shape
+    assert all(isinstance(dtype, pd.SparseDtype) for dtype in result.mask.dtypes)
+    assert result.rows("x").tolist() == [30, 500]
+    assert result.scores is None
+
+
+def test_detect_outliers_iqr_engine_matches_detect_outliers_iqr():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"a": rng.standard_t(3, 5_000), "b": rng.lognormal(size=5_000)})
+    df.loc[::97, "a"] = np.nan
+    df["c"] = pd.array(rng.integers(0, 1_000, 5_000), dtype="Int64")
+
+    assert outliers.detect_outliers(df).counts == outliers.detect_outliers_iqr(df)
+
+
+def test_detect_outliers_iqr_shares_column_selection():
+    df = pd.DataFrame(
+        {
+            "wait": pd.to_timedelta([1, 2, None, 4, 3, 100], unit="s"),
+            "label": pd.array(list("abcdef"), dtype="string"),
+            "x": [1.0, 2.0, 3.0, 2.0, 1.0, 50.0],
+        }
+    )
+    result = outliers.detect_outliers(df)
+
+    assert result.counts == outliers.detect_outliers_iqr(df) == {"wait": 1, "x": 1}
+    assert result.rows("wait").tolist() == [5]
+
+
+def test_mad_engine_handles_zero_mad():
+    df = pd.DataFrame({"x": [5.0] * 90 + [6.0] * 9 + [100.0]})
+    assert outliers.detect_outliers(df, method="mad").counts == {"x": 1}
+
+
+def test_isolation_forest_engine():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(2_000, 3)), columns=["a", "b", "c"])
+    df.loc[[10, 1_500], ["a", "b"]] = 25.0
+    df.loc[5, "c"] = np.nan
+
+    result = outliers.detect_outliers(
+        df, method="isolation_forest", sample_size=500, n_jobs=2, random_state=0
+    )
+
+    assert {10, 1_500} <= set(result.rows("a"))
+    assert len(result.scores) == len(df)
+    assert result.scores[[10, 1_500]].max() < result.scores.median()
+    assert result.bounds.isna().all().all()
+
+
+def test_register_outlier_engine(outlier_df):
+    @outliers.register_outlier_engine("negative")
+    def _negative(dataframe, columns):
+        positions = {col: np.flatnonzero(dataframe[col].to_numpy() < 0) for col in columns}
+        bounds = pd.DataFrame({"lower": 0.0, "upper": np.inf}, index=pd.Index(columns))
+        return bounds, positions, None
+
+    try:
+        result = outliers.detect_outliers(outlier_df, method="negative")
+        assert result.counts == {"x": 1}
+    finally:
+        del outliers.OUTLIER_ENGINES["negative"]
+
+
+def test_detect_outliers_rejects_unknown_method(outlier_df):
+    with pytest.raises(ValueError, match="method"):
+        outliers.detect_outliers(outlier_df, method="lof")
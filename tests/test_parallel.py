@@ -0,0 +1,67 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from jcds import eda
+from jcds.eda import parallel
+from jcds.eda.profile import profile_dataframe
+
+
+@pytest.fixture
+def executor(request, monkeypatch):
+    monkeypatch.setattr(parallel, "PARALLEL_MIN_CELLS", 0)
+    if request.param == "pool":
+        pool = ThreadPoolExecutor(2)
+        eda.set_executor(pool)
+    else:
+        pool = None
+        eda.set_executor(request.param, n_jobs=2)
+    yield request.param
+    eda.set_executor()
+    if pool is not None:
+        pool.shutdown()
+
+
+def _results(df):
+    return [
+        eda.show_constantvars(df),
+        eda.show_nearconstvars(df, 0.6),
+        eda.show_binary_list(df),
+        eda.show_lowcardvars(df, 3),
+        eda.show_highcardvars(df, 30),
+        eda.show_mixed_type_columns(df, return_counts=True),
+        eda.count_unique_values(df, list(df.columns)[:3]),
+        eda.count_id_like_columns(df),
+    ]
+
+
+@pytest.mark.parametrize("executor", ["thread", "process", "pool"], indirect=True)
+def test_parallel_matches_serial(executor, sample_df):
+    df = sample_df.assign(const="k", mixed=[1, "a"] * 5)
+    parallel_results = _results(df)
+    parallel_profile = profile_dataframe(df)
+
+    eda.set_executor("serial")
+    assert _results(df) == parallel_results
+    serial_profile = profile_dataframe(df)
+    for col in df.columns:
+        assert parallel_profile[col].nunique == serial_profile[col].nunique
+        assert repr(parallel_profile[col].top_values) == repr(serial_profile[col].top_values)
+    assert parallel_profile.rows_any_na == serial_profile.rows_any_na
+
+
+def test_map_columns_keeps_column_order(sample_df, monkeypatch):
+    monkeypatch.setattr(parallel, "PARALLEL_MIN_CELLS", 0)
+    eda.set_executor("thread", n_jobs=3)
+    try:
+        assert parallel.map_columns(lambda s: s.name, sample_df) == list(sample_df.columns)
+    finally:
+        eda.set_executor()
+
+
+def test_set_executor_validates():
+    with pytest.raises(ValueError):
+        eda.set_executor("gpu")
+    with pytest.raises(ValueError):
+        eda.set_executor("thread", n_jobs=0)
+    assert eda.get_executor() == {"executor": "thread", "n_jobs": None}
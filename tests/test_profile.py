@@ -0,0 +1,192 @@
+import pandas as pd
+import numpy as np
+import pytest
+
+from jcds import eda
+from jcds.eda.profile import (
+    ProfileAccumulator,
+    profile_column,
+    profile_dataframe,
+    profile_file,
+    profile_parquet_metadata,
+)
+
+
+@pytest.fixture
+def profile_df():
+    return pd.DataFrame(
+        {
+            "id": range(6),
+            "grp": ["a", "b", "a", None, "a", "a"],
+            "flag": [1, 0, 1, 1, np.nan, 0],
+            "const": ["x"] * 6,
+            "mixed": [1, "1", 2, None, 3, 4],
+            "cat": pd.Categorical(["p", "q", "p", "p", "q", "p"], categories=["p", "q", "r"]),
+            "empty": [np.nan] * 6,
+        }
+    )
+
+
+def test_profile_column_counts(profile_df):
+    stats = profile_column(profile_df["grp"])
+    assert stats.count == 5
+    assert stats.null_count == 1
+    assert stats.nunique == 2
+    assert stats.nunique_with_na == 3
+    assert stats.top_values[0] == ("a", 4)
+    assert stats.dtype_class == "object"
+    assert stats.python_types == frozenset({"str"})
+
+
+def test_profile_column_ignores_unobserved_categories(profile_df):
+    stats = profile_column(profile_df["cat"])
+    assert stats.nunique == 2
+    assert stats.dtype_class == "category"
+
+
+def test_profile_row_level_missing(na_test_df):
+    profile = profile_dataframe(na_test_df)
+    assert profile.rows_any_na == eda.count_rows_with_any_na(na_test_df)
+    assert profile.rows_all_na == eda.count_rows_with_all_na(na_test_df)
+    assert profile.total_na == eda.count_total_na(na_test_df)
+
+
+def test_profile_matches_direct_scans(profile_df):
+    profile = profile_dataframe(profile_df)
+    df = profile_df
+
+    assert eda.show_dimensions(df, profile=profile) == eda.show_dimensions(df)
+    assert eda.show_constantvars(df, profile=profile) == eda.show_constantvars(df)
+    assert eda.show_nearconstvars(df, 0.6, profile=profile) == eda.show_nearconstvars(df, 0.6)
+    assert eda.show_highcardvars(df, 30, profile=profile) == eda.show_highcardvars(df, 30)
+    assert eda.show_lowcardvars(df, 3, profile=profile) == eda.show_lowcardvars(df, 3)
+    assert eda.show_binary_list(df, profile=profile) == eda.show_binary_list(df)
+    assert eda.show_mixed_type_columns(df, profile=profile) == eda.show_mixed_type_columns(df)
+    assert eda.count_id_like_columns(df, profile=profile) == eda.count_id_like_columns(df)
+    assert eda.get_dtype_summary(df, profile=profile) == eda.get_dtype_summary(df)
+    assert eda.show_missing_summary(df, profile=profile) == eda.show_missing_summary(df)
+    assert eda.count_cols_with_any_na(df, profile=profile) == eda.count_cols_with_any_na(df)
+    assert eda.count_cols_with_all_na(df, profile=profile) == eda.count_cols_with_all_na(df)
+
+
+def test_profile_count_unique_values(unique_test_df):
+    profile = profile_dataframe(unique_test_df)
+    cols = ["Category", "Numeric", "Empty", "Mixed"]
+    for dropna in (False, True):
+        expected = eda.count_unique_values(unique_test_df, cols, dropna=dropna)
+        result = eda.count_unique_values(
+            unique_test_df, cols, dropna=dropna, profile=profile
+        )
+        assert result == expected
+
+
+def test_profile_count_unique_values_falls_back_past_top_n(id_like_df):
+    profile = profile_dataframe(id_like_df, top_n=2)
+    result = eda.count_unique_values(id_like_df, "id", n_modes=4, profile=profile)
+    assert len(result["id"]["top_modes"]) == 4
+
+
+# --- chunked / out-of-core profiling ---
+
+@pytest.fixture
+def stream_df():
+    n = 200
+    return pd.DataFrame(
+        {
+            "id": range(n),
+            "grp": (["a", "b", None, "a"] * 50),
+            "value": [float(i % 17) if i % 9 else np.nan for i in range(n)],
+            "const": ["k"] * n,
+        }
+    )
+
+
+def test_accumulator_merge_matches_single_pass(stream_df):
+    whole = profile_dataframe(stream_df)
+    left = ProfileAccumulator().update(stream_df.iloc[:70])
+    right = ProfileAccumulator().update(stream_df.iloc[70:])
+    merged = left.merge(right).finalize()
+
+    assert merged.n_rows == whole.n_rows
+    assert merged.rows_any_na == whole.rows_any_na
+    for col in stream_df.columns:
+        a, b = merged[col], whole[col]
+        assert (a.null_count, a.nunique, a.nunique_with_na) == (
+            b.null_count,
+            b.nunique,
+            b.nunique_with_na,
+        )
+        assert [c for _, c in a.top_values] == [c for _, c in b.top_values]
+    assert merged["value"].min == stream_df["value"].min()
+    assert merged["value"].max == stream_df["value"].max()
+    assert merged["value"].mean == pytest.approx(stream_df["value"].mean())
+    assert merged["value"].std == pytest.approx(stream_df["value"].std())
+
+
+@pytest.mark.parametrize("suffix", ["csv", "parquet"])
+def test_profile_file_matches_loaded_frame(stream_df, tmp_path, suffix):
+    path = tmp_path / f"data.{suffix}"
+    if suffix == "csv":
+        stream_df.to_csv(path, index=False)
+    else:
+        stream_df.to_parquet(path, index=False)
+
+    streamed = profile_file(path, chunksize=32)
+    whole = profile_dataframe(stream_df)
+
+    assert streamed.n_rows == len(stream_df)
+    assert streamed.total_na == whole.total_na
+    assert eda.show_constantvars(streamed.schema(), profile=streamed) == ["const"]
+    assert [s.nunique for s in streamed] == [s.nunique for s in whole]
+
+
+def test_profile_file_max_tracked_falls_back_to_estimate(stream_df, tmp_path):
+    path = tmp_path / "data.csv"
+    stream_df.to_csv(path, index=False)
+
+    profile = profile_file(path, chunksize=50, max_tracked=20)
+    assert profile["id"].nunique_exact is False
+    assert profile["id"].nunique == pytest.approx(200, rel=0.05)
+    assert profile["grp"].nunique_exact is True
+
+
+def test_data_quality_accepts_file_path(stream_df, tmp_path, capsys):
+    from jcds import reports
+
+    path = tmp_path / "data.csv"
+    stream_df.to_csv(path, index=False)
+    reports.data_quality(path, chunksize=64)
+    out = capsys.readouterr().out
+    assert " * Rows: 200" in out
+    assert "CONSTANT: 1" in out
+
+
+def test_profile_parquet_metadata_answers_missing_checks(stream_df, tmp_path):
+    path = tmp_path / "data.parquet"
+    stream_df.to_parquet(path, index=False, row_group_size=64)
+    footer = profile_parquet_metadata(path)
+    schema = footer.schema()
+
+    assert (footer.n_rows, footer.n_cols) == stream_df.shape
+    assert eda.count_total_na(schema, profile=footer) == stream_df.isna().sum().sum()
+    assert eda.count_cols_with_any_na(schema, profile=footer) == 2
+    assert eda.show_missing_summary(schema, profile=footer) == eda.show_missing_summary(
+        stream_df
+    )
+    assert (footer["value"].min, footer["value"].max) == (0.0, 16.0)
+    assert footer["grp"].nunique is None
+    assert footer.rows_any_na is None
+
+
+def test_profile_parquet_metadata_rejects_value_count_checks(stream_df, tmp_path):
+    path = tmp_path / "data.parquet"
+    stream_df.to_parquet(path, index=False)
+    footer = profile_parquet_metadata(path)
+    schema = footer.schema()
+
+    with pytest.raises(ValueError, match="count_id_like_columns.*profile_parquet_metadata"):
+        eda.count_id_like_columns(schema, profile=footer)
+    with pytest.raises(ValueError, match="nunique"):
+        eda.show_binary_list(schema, profile=footer)
+    with pytest.raises(ValueError, match="rows_any_na"):
+        eda.count_rows_with_any_na(schema, profile=footer)
@@ -0,0 +1,304 @@
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from jcds.dataio import s3_io
+from jcds.dataio.s3_io import (
+    configure_session,
+    download_s3,
+    open_s3,
+    read_s3,
+    read_s3_many,
+)
+
+
+class _RangeHandler(BaseHTTPRequestHandler):
+    """Serves files under /<bucket>/<key> with HEAD, Range, ETags and injected 503s."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _body(self):
+        path = self.server.root / self.path.lstrip("/")
+        return path.read_bytes() if path.is_file() else None
+
+    def do_HEAD(self):
+        body = self._body()
+        self.send_response(200 if body is not None else 404)
+        self.send_header("Content-Length", str(len(body or b"")))
+        self.end_headers()
+
+    def do_GET(self):
+        server = self.server
+        if server.failures.get(self.path, 0) > 0:
+            server.failures[self.path] -= 1
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = self._body()
+        if body is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        if self.headers.get("If-None-Match") == etag:
+            server.not_modified += 1
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        status = 200
+        requested = self.headers.get("Range")
+        if requested:
+            start, end = requested.split("=")[1].split("-")
+            body = body[int(start) : int(end) + 1]
+            status = 206
+        server.log.append((self.path, requested, len(body)))
+        self.send_response(status)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def s3_server(tmp_path):
+    """Local stand-in for a public S3 endpoint, serving files from tmp_path."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _RangeHandler)
+    server.root = tmp_path
+    server.log = []
+    server.failures = {}
+    server.not_modified = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    configure_session(backoff_factor=0)
+    yield server, f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+    configure_session()
+
+
+def test_read_s3_streams_csv_and_chunks(s3_server, tmp_path, sample_df):
+    server, endpoint = s3_server
+    (tmp_path / "bucket").mkdir()
+    sample_df.to_csv(tmp_path / "bucket" / "data.csv", index=False)
+
+    df = read_s3("bucket", "data.csv", endpoint_url=endpoint)
+    pd.testing.assert_frame_equal(df, sample_df)
+
+    chunks = list(read_s3("bucket", "data.csv", endpoint_url=endpoint, chunksize=4))
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+
+
+def test_read_s3_retries_transient_errors(s3_server, tmp_path, sample_df):
+    server, endpoint = s3_server
+    (tmp_path / "bucket").mkdir()
+    sample_df.to_csv(tmp_path / "bucket" / "flaky.csv", index=False)
+    server.failures["/bucket/flaky.csv"] = 2
+
+    df = read_s3("bucket", "flaky.csv", endpoint_url=endpoint)
+
+    pd.testing.assert_frame_equal(df, sample_df)
+    assert server.failures["/bucket/flaky.csv"] == 0
+
+
+def test_read_s3_parquet_uses_range_requests(s3_server, tmp_path):
+    server, endpoint = s3_server
+    (tmp_path / "bucket").mkdir()
+    n = 200_000
+    df = pd.DataFrame(
+        {
+            "day": np.repeat(np.arange(4), n // 4),
+            "value": np.arange(n, dtype="float64"),
+            "noise": np.random.default_rng(0).random(n),
+        }
+    )
+    path = tmp_path / "bucket" / "data.parquet"
+    df.to_parquet(path, index=False, row_group_size=n // 4, compression=None)
+
+    result = read_s3(
+        "bucket",
+        "data.parquet",
+        file_type="parquet",
+        endpoint_url=endpoint,
+        columns=["value"],
+        filters=[("day", "=", 3)],
+    )
+
+    assert result["value"].tolist() == df.loc[df["day"] == 3, "value"].tolist()
+    assert all(requested is not None for _, requested, _ in server.log)
+    downloaded = sum(size for _, _, size in server.log)
+    assert downloaded < path.stat().st_size / 2
+
+
+def test_open_s3_is_seekable(s3_server, tmp_path):
+    server, endpoint = s3_server
+    (tmp_path / "bucket").mkdir()
+    (tmp_path / "bucket" / "blob.bin").write_bytes(bytes(range(256)) * 8)
+
+    with open_s3("bucket", "blob.bin", endpoint_url=endpoint, block_size=64) as f:
+        f.seek(-4, 2)
+        assert f.read() == bytes([252, 253, 254, 255])
+        f.seek(10)
+        assert f.read(3) == bytes([10, 11, 12])
+        assert f.raw.range_requests == 2
+
+
+def test_read_s3_missing_object_returns_none(s3_server):
+    server, endpoint = s3_server
+    assert read_s3("bucket", "missing.csv", endpoint_url=endpoint) is None
+    assert read_s3("bucket", "missing.parquet", file_type="parquet", endpoint_url=endpoint) is None
+
+
+def _write_parts(tmp_path, sample_df, n_parts=6):
+    (tmp_path / "bucket").mkdir()
+    keys = []
+    for i in range(n_parts):
+        key = f"part-{i}.csv"
+        sample_df.assign(part=i).to_csv(tmp_path / "bucket" / key, index=False)
+        keys.append(key)
+    return keys
+
+
+def test_read_s3_many_concatenates_in_order(s3_server, tmp_path, sample_df):
+    server, endpoint = s3_server
+    keys = _write_parts(tmp_path, sample_df)
+
+    df = read_s3_many("bucket", keys, endpoint_url=endpoint, max_workers=4)
+
+    assert len(df) == len(sample_df) * len(keys)
+    assert df["part"].tolist() == [i for i in range(len(keys)) for _ in range(len(sample_df))]
+    frames = read_s3_many("bucket", keys[:2], endpoint_url=endpoint, concat=False)
+    assert list(frames) == keys[:2]
+
+
+def test_read_s3_many_accepts_listing_records(s3_server, tmp_path, sample_df):
+    server, endpoint = s3_server
+    keys = _write_parts(tmp_path, sample_df, n_parts=3)
+    records = [{"key": "folder/", "size": None, "is_prefix": True}] + [
+        {"key": key, "size": size, "is_prefix": False} for key, size in zip(keys, [1, 3, 2])
+    ]
+    configure_session(backoff_factor=0, pool_maxsize=1)
+
+    df = read_s3_many("bucket", records, endpoint_url=endpoint, max_workers=1)
+
+    assert df["part"].unique().tolist() == [0, 1, 2]
+    assert [path for path, _, _ in server.log] == [f"/bucket/{keys[i]}" for i in (1, 2, 0)]
+
+
+def test_read_s3_many_reuses_cache(s3_server, tmp_path, sample_df):
+    server, endpoint = s3_server
+    keys = _write_parts(tmp_path, sample_df)
+    cache = tmp_path / "cache"
+
+    first = read_s3_many("bucket", keys, endpoint_url=endpoint, cache_dir=cache)
+    downloads = len(server.log)
+    second = read_s3_many("bucket", keys, endpoint_url=endpoint, cache_dir=cache)
+
+    pd.testing.assert_frame_equal(first, second)
+    assert downloads == len(keys)
+    assert len(server.log) == downloads
+    assert server.not_modified == len(keys)
+
+    # a changed object is downloaded again
+    sample_df.assign(part=99).to_csv(tmp_path / "bucket" / keys[0], index=False)
+    third = read_s3_many("bucket", keys, endpoint_url=endpoint, cache_dir=cache)
+    assert len(server.log) == downloads + 1
+    assert (third["part"] == 99).sum() == len(sample_df)
+
+
+def test_download_s3_evicts_least_recently_used(s3_server, tmp_path):
+    server, endpoint = s3_server
+    (tmp_path / "bucket").mkdir()
+    for name in "abc":
+        (tmp_path / "bucket" / name).write_bytes(b"x" * 100)
+    cache = tmp_path / "cache"
+
+    a = download_s3("bucket", "a", cache, endpoint_url=endpoint, max_bytes=250)
+    b = download_s3("bucket", "b", cache, endpoint_url=endpoint, max_bytes=250)
+    download_s3("bucket", "a", cache, endpoint_url=endpoint, max_bytes=250, revalidate=False)
+    c = download_s3("bucket", "c", cache, endpoint_url=endpoint, max_bytes=250)
+
+    assert a.exists() and c.exists()
+    assert not b.exists()
+
+
+def test_read_s3_many_reports_failures(s3_server, tmp_path, sample_df, capsys):
+    server, endpoint = s3_server
+    keys = _write_parts(tmp_path, sample_df, n_parts=2)
+
+    result = read_s3_many(
+        "bucket", keys + ["missing.csv"], endpoint_url=endpoint, cache_dir=tmp_path / "cache"
+    )
+
+    assert result is None
+    assert "1 of 3 files failed" in capsys.readouterr().out
+
+
+def test_read_s3_many_parquet(s3_server, tmp_path, sample_df):
+    server, endpoint = s3_server
+    (tmp_path / "bucket").mkdir()
+    sample_df.to_parquet(tmp_path / "bucket" / "a.parquet")
+    sample_df.to_parquet(tmp_path / "bucket" / "b.parquet")
+
+    df = read_s3_many(
+        "bucket",
+        ["a.parquet", "b.parquet"],
+        file_type="parquet",
+        endpoint_url=endpoint,
+        cache_dir=tmp_path / "cache",
+        columns=[sample_df.columns[0]],
+    )
+
+    assert list(df.columns) == [sample_df.columns[0]]
+    assert len(df) == 2 * len(sample_df)
+
+
+def test_session_is_shared():
+    assert s3_io.get_session() is s3_io.get_session()
+
+
+def test_read_s3_many_keeps_batch_entries_until_read(s3_server, tmp_path, sample_df, monkeypatch):
+    server, endpoint = s3_server
+    keys = _write_parts(tmp_path, sample_df, n_parts=4)
+    cache = tmp_path / "cache"
+    size = (tmp_path / "bucket" / keys[0]).stat().st_size
+    configure_session(backoff_factor=0, pool_maxsize=4)
+
+    # every download finishes before any file is read, each one over the cap
+    barrier = threading.Barrier(len(keys), timeout=10)
+    read_local = s3_io._read_local
+
+    def _read_after_all_downloads(*args, **kwargs):
+        barrier.wait()
+        return read_local(*args, **kwargs)
+
+    monkeypatch.setattr(s3_io, "_read_local", _read_after_all_downloads)
+    df = read_s3_many(
+        "bucket", keys, endpoint_url=endpoint, cache_dir=cache, max_workers=4, max_bytes=size * 3 // 2
+    )
+
+    assert len(df) == len(sample_df) * len(keys)
+    assert not s3_io._pinned
+    assert sum(path.stat().st_size for path in cache.iterdir()) <= size * 2
+
+
+def test_read_s3_many_reports_read_errors(s3_server, tmp_path, capsys):
+    server, endpoint = s3_server
+    (tmp_path / "bucket").mkdir()
+    (tmp_path / "bucket" / "bad.parquet").write_bytes(b"not parquet")
+
+    result = read_s3_many(
+        "bucket", ["bad.parquet"], file_type="parquet", endpoint_url=endpoint, cache_dir=tmp_path / "cache"
+    )
+
+    assert result is None
+    assert "Error loading bad.parquet" in capsys.readouterr().out
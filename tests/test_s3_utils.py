@@ -1,6 +1,34 @@
 # tests/unit/test_s3_utils.py
 
-from jcds.aws.s3_utils import list_s3_bucket
+import pytest
+
+from jcds.aws.s3_utils import get_s3_client, iter_s3_objects, list_s3_bucket
+
+
+@pytest.fixture(autouse=True)
+def fresh_client():
+    """Drop cached clients so each test builds its own (mocked) one."""
+    get_s3_client.cache_clear()
+    yield
+    get_s3_client.cache_clear()
+
+
+@pytest.fixture(scope="module")
+def moto_bucket():
+    """A mocked bucket holding 1200 keys under two prefixes."""
+    boto3 = pytest.importorskip("boto3")
+    moto = pytest.importorskip("moto")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("AWS_ACCESS_KEY_ID", "testing")
+        mp.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+        mp.setenv("AWS_DEFAULT_REGION", "us-east-1")
+        with moto.mock_aws():
+            client = boto3.client("s3", region_name="us-east-1")
+            client.create_bucket(Bucket="bucket")
+            for i in range(1200):
+                folder = "a" if i < 1100 else "b"
+                client.put_object(Bucket="bucket", Key=f"{folder}/{i:05d}.csv", Body=b"x" * i)
+            yield "bucket"
 
 
 def test_list_s3_bucket_prints_keys(monkeypatch, capsys):
@@ -18,3 +46,49 @@ def test_list_s3_bucket_prints_keys(monkeypatch, capsys):
     captured = capsys.readouterr()
     assert "file1.csv" in captured.out
     assert "file2.csv" in captured.out
+
+
+def test_iter_s3_objects_paginates(moto_bucket):
+    records = list(iter_s3_objects(moto_bucket, anonymous=False))
+
+    assert len(records) == 1200
+    assert records[1]["key"] == "a/00001.csv"
+    assert records[1]["size"] == 1
+    assert len(records[1]["etag"]) == 32
+    assert records[1]["last_modified"] is not None
+
+
+def test_iter_s3_objects_is_lazy(moto_bucket):
+    client = get_s3_client(anonymous=False)
+    calls = []
+
+    class CountingClient:
+        def list_objects_v2(self, **params):
+            calls.append(params)
+            return client.list_objects_v2(**params)
+
+    objects = iter_s3_objects(moto_bucket, page_size=100, client=CountingClient())
+    first = [next(objects) for _ in range(150)]
+
+    assert first[-1]["key"] == "a/00149.csv"
+    assert len(calls) == 2
+    assert "ContinuationToken" in calls[1]
+
+
+def test_iter_s3_objects_prefix_and_delimiter(moto_bucket):
+    keys = [r["key"] for r in iter_s3_objects(moto_bucket, prefix="b/", anonymous=False)]
+    assert len(keys) == 100 and all(k.startswith("b/") for k in keys)
+
+    folders = list(iter_s3_objects(moto_bucket, delimiter="/", anonymous=False))
+    assert [(r["key"], r["is_prefix"]) for r in folders] == [("a/", True), ("b/", True)]
+
+
+def test_get_s3_client_is_cached(moto_bucket):
+    assert get_s3_client(anonymous=False) is get_s3_client(anonymous=False)
+
+
+def test_list_s3_bucket_returns_records(moto_bucket, capsys):
+    records = list_s3_bucket(moto_bucket, prefix="b/", verbose=False, anonymous=False)
+
+    assert len(records) == 100
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,123 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from jcds import eda
+from jcds.eda.profile import profile_dataframe
+from jcds.eda.sketches import HyperLogLog, QuantileSketch, approx_nunique, approx_quantile
+
+
+@pytest.mark.parametrize("n", [10, 1_000, 50_000])
+def test_hll_estimate_within_error(n):
+    hll = HyperLogLog(error=0.01).update(pd.Series(np.arange(n)))
+    assert hll.estimate() == pytest.approx(n, rel=0.03)
+
+
+def test_hll_merge_matches_single_sketch():
+    values = pd.Series([f"k{i}" for i in range(20_000)])
+    whole = HyperLogLog().update(values)
+    left = HyperLogLog().update(values.iloc[:12_000])
+    right = HyperLogLog().update(values.iloc[8_000:])
+    assert len(left.merge(right)) == len(whole)
+
+
+def test_hll_rejects_mismatched_precision():
+    with pytest.raises(ValueError):
+        HyperLogLog(error=0.01).merge(HyperLogLog(error=0.1))
+
+
+def test_approx_nunique_dropna():
+    s = pd.Series(["a", "b", None, "a", np.nan])
+    assert approx_nunique(s) == 2
+    assert approx_nunique(s, dropna=False) == 3
+
+
+def test_approx_mode_matches_exact_on_small_frame(id_like_df):
+    df = id_like_df
+
+    def names(result):
+        return [col for col, _ in result]
+
+    assert names(eda.show_highcardvars(df, 90, approx=True)) == ["id"]
+    assert names(eda.show_lowcardvars(df, 3, approx=True)) == ["not_unique"]
+    assert eda.show_constantvars(df, approx=True) == eda.show_constantvars(df)
+    assert eda.count_id_like_columns(df, threshold=0.9, approx=True) == 2
+
+
+def test_profile_approx_flags_estimates():
+    df = pd.DataFrame({"id": np.arange(5_000), "grp": ["a", "b"] * 2_500})
+    profile = profile_dataframe(df, approx=True)
+    assert profile["id"].nunique == pytest.approx(5_000, rel=0.03)
+    assert profile["id"].nunique_exact is False
+
+
+def test_data_cardinality_approx(id_like_df, capsys):
+    from jcds import reports
+
+    reports.data_cardinality(id_like_df, approx=True)
+    out = capsys.readouterr().out
+    assert "CARDINALITY REPORT" in out
+
+
+def test_quantile_sketch_exact_on_small_data():
+    values = pd.Series(np.random.default_rng(0).normal(size=200))
+    sketch = QuantileSketch().update(values)
+
+    assert sketch.exact
+    assert sketch.quantile([0.1, 0.5, 0.9]) == pytest.approx(values.quantile([0.1, 0.5, 0.9]).to_numpy())
+    pd.testing.assert_series_equal(sketch.describe(), values.describe(), check_names=False)
+
+
+def test_quantile_sketch_rank_error_after_merges():
+    values = np.random.default_rng(1).lognormal(size=200_000)
+    sketch = QuantileSketch(error=0.01)
+    for chunk in np.array_split(values, 8):
+        part = QuantileSketch(error=0.01)
+        for piece in np.array_split(chunk, 5):
+            part.update(pd.Series(piece))
+        sketch.merge(part)
+
+    ordered = np.sort(values)
+    assert not sketch.exact
+    assert len(sketch) == len(values)
+    assert sum(len(level) for level in sketch.levels) < len(values) / 50
+    for q in [0.01, 0.25, 0.5, 0.75, 0.99]:
+        true_rank = np.searchsorted(ordered, sketch.quantile(q), side="right") / len(values)
+        assert abs(true_rank - q) <= 0.01
+    assert sketch.quantile([0, 1]).tolist() == [values.min(), values.max()]
+    assert sketch.describe()["mean"] == pytest.approx(values.mean())
+    assert sketch.describe()["std"] == pytest.approx(values.std(ddof=1))
+
+
+def test_quantile_sketch_rejects_mismatched_error():
+    with pytest.raises(ValueError):
+        QuantileSketch(error=0.01).merge(QuantileSketch(error=0.05))
+
+
+def test_approx_quantile_skips_nulls():
+    s = pd.Series([1.0, None, 3.0, np.nan, 2.0])
+    assert approx_quantile(s) == 2.0
+    assert np.isnan(approx_quantile(pd.Series([], dtype=float)))
+
+
+def test_dqr_cont_streams_file(tmp_path, sample_df):
+    path = tmp_path / "data.csv"
+    sample_df.to_csv(path, index=False)
+
+    expected = eda.dqr_cont(sample_df, verbose=False)
+    result = eda.dqr_cont(path, verbose=False, chunksize=3)
+
+    assert result.summary == expected.summary
+    pd.testing.assert_frame_equal(result.tables["quality"], expected.tables["quality"], check_dtype=False)
+    pd.testing.assert_frame_equal(result.tables["describe"], expected.tables["describe"])
+
+
+def test_dqr_cont_file_without_numeric_summary(tmp_path, capsys):
+    path = tmp_path / "b.parquet"
+    pd.DataFrame({"flag": [True, False, True], "name": ["a", "b", "c"]}).to_parquet(path)
+
+    result = eda.dqr_cont(path)
+
+    assert result.tables["quality"]["Feature"].tolist() == ["flag"]
+    assert "describe" not in result.tables
+    assert "Descriptive Stats" not in capsys.readouterr().out
@@ -73,6 +73,43 @@ def test_to_bool_missing_column_raises(sample_df):
         jtransform.to_bool(sample_df, "does_not_exist")
 
 
+@pytest.mark.parametrize(
+    "values",
+    [
+        pd.Categorical([" Yes", "no", "yes", None], categories=[" Yes", "no", "yes", "maybe"]),
+        pd.Series([1, 0, 1, 2]),
+        pd.Series([True, False, True, False]),
+        pd.Series(["Y", "f", "1", None]),
+    ],
+)
+def test_to_bool_fast_paths_match_string_rules(values):
+    df = pd.DataFrame({"flag": values})
+    expected = df["flag"].astype(str).str.strip().str.lower().map(
+        {"yes": True, "y": True, "1": True, "true": True, "no": False, "f": False, "0": False, "false": False}
+    )
+
+    result = jtransform.to_bool(df, "flag", errors="coerce")
+
+    assert result["flag"].dtype.name == "boolean"
+    assert result["flag"].tolist() == [pd.NA if pd.isna(v) else v for v in expected]
+
+
+def test_to_bool_reports_only_present_bad_values():
+    df = pd.DataFrame({"flag": pd.Categorical(["yes", "nope"], categories=["yes", "nope", "maybe"])})
+    with pytest.raises(ValueError, match=r"\['nope'\]"):
+        jtransform.to_bool(df, "flag")
+
+
+def test_to_bool_small_int_range_near_dtype_limits():
+    df = pd.DataFrame({"flag": pd.Series([-2, 0, 1, 127], dtype="int8")})
+    result = jtransform.to_bool(df, "flag", errors="coerce")
+    assert result["flag"].tolist() == [pd.NA, False, True, pd.NA]
+
+    df = pd.DataFrame({"flag": pd.Series([-100, 100, 1, 0], dtype="int8")})
+    with pytest.raises(ValueError, match=r"\['-100' '100'\]"):
+        jtransform.to_bool(df, "flag")
+
+
 # --- to_datetime ---
 def test_to_datetime_basic(datetime_df):
     result = jtransform.to_datetime(datetime_df, columns=["timestamp"])
@@ -94,6 +131,49 @@ def test_to_object_basic(unique_test_df):
 def test_to_object_missing_raises(unique_test_df):
     with pytest.raises(ValueError, match="Columns not found"):
         jtransform.to_object(unique_test_df, columns=["NoCol"])
+
+
+# --- astype_plan ---
+def test_astype_plan_matches_chained_conversions(sample_df):
+    plan = {
+        "Age": "int",
+        "Income": ("float", {"errors": "coerce"}),
+        "Subscribed": "bool",
+        "Gender": "category",
+    }
+    chained = jtransform.to_int(sample_df, ["Age"])
+    chained = jtransform.to_float(chained, ["Income"], errors="coerce")
+    chained = jtransform.to_bool(chained, "Subscribed")
+    chained = jtransform.to_categorical(chained, ["Gender"])
+
+    result = jtransform.astype_plan(sample_df, plan)
+
+    pd.testing.assert_frame_equal(result, chained)
+    assert sample_df["Gender"].dtype == object
+
+
+def test_astype_plan_validates_before_converting(unique_test_df):
+    original = unique_test_df.copy()
+    with pytest.raises(ValueError, match="Unknown conversion"):
+        jtransform.astype_plan(unique_test_df, {"Numeric": "str", "Category": "decimal"}, inplace=True)
+    with pytest.raises(TypeError, match="Invalid options"):
+        jtransform.astype_plan(unique_test_df, {"Numeric": ("int", {"signed": True})}, inplace=True)
+    with pytest.raises(ValueError, match="Columns not found"):
+        jtransform.astype_plan(unique_test_df, {"NoCol": "int"}, inplace=True)
+    pd.testing.assert_frame_equal(unique_test_df, original)
+
+
+def test_astype_plan_inplace(unique_test_df):
+    assert jtransform.astype_plan(unique_test_df, {"Numeric": "str"}, inplace=True) is None
+    assert unique_test_df["Numeric"].tolist() == ["1", "2", "2", "3", "3"]
+
+
+def test_astype_plan_records_inferred_format_on_result(datetime_df):
+    result = jtransform.astype_plan(datetime_df, {"timestamp": ("datetime", {"format": "infer"})})
+
+    assert pd.api.types.is_datetime64_any_dtype(result["timestamp"])
+    assert result.attrs["datetime_formats"] == {"timestamp": "%Y-%m-%d"}
+    assert "datetime_formats" not in datetime_df.attrs
         
 # --- clean_column_names ---
 def test_clean_column_names_basic():